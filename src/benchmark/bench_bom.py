@@ -0,0 +1,100 @@
+"""
+Benchmark the BOM and the reference lookups of large schemas.
+
+Synthetic schemas with 1k to 5k resistors and capacitors with eight
+properties each are produced to a Bom, and every reference is looked
+up with `in` and as attribute of the schema. The property and the
+reference index are compared with the former linear scans.
+Run from the repository root:
+
+    python src/benchmark/bench_bom.py
+"""
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.append('src')
+
+from nukleus.Bom import Bom
+from nukleus.Library import Library
+from nukleus.ModelSchema import Property, Symbol
+from nukleus.Schema import Schema
+
+SIZES = (1000, 5000)
+KEYS = ('Footprint', 'Datasheet', 'Tolerance', 'Power', 'Manufacturer', 'MPN')
+
+
+def _property(self, name: str) -> Property:
+    """The former linear scan, kept as reference."""
+    for prop in self.properties:
+        if prop.key == name:
+            return prop
+    raise LookupError(f"property not found: {name}")
+
+
+def _has_property(self, name: str) -> bool:
+    for prop in self.properties:
+        if prop.key == name:
+            return True
+    return False
+
+
+def _contains(self, name) -> bool:
+    for symbol in self.elements:
+        if isinstance(symbol, Symbol):
+            if(symbol.has_property("Reference") and
+               symbol.property('Reference').value == name):
+                return True
+    return False
+
+
+def _getattr(self, name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return [x for x in self.elements if isinstance(x, Symbol) and
+            x.has_property('Reference') and x.property('Reference').value == name]
+
+
+def schematic(size: int) -> Schema:
+    library = Library(['samples/files/symbols'])
+    symbols = {'R': library.get('Device:R'), 'C': library.get('Device:C')}
+    schema = Schema()
+    for i in range(size):
+        prefix, value = ('R', f'{i % 50}k') if i % 2 else ('C', f'{i % 20}n')
+        properties = [Property(key='Reference', value=f'{prefix}{i}'),
+                      Property(key='Value', value=value)]
+        properties += [Property(key=key, value=f'{key} {i % 7}') for key in KEYS]
+        schema.visitSymbol(Symbol(identifier='uuid', library_identifier=f'Device:{prefix}',
+                                  unit=1, properties=properties,
+                                  library_symbol=symbols[prefix]))
+    return schema
+
+
+def run(schema: Schema, size: int):
+    start = time.perf_counter()
+    bom = Bom()
+    schema.produce(bom)
+    bom.bom()
+    middle = time.perf_counter()
+    for i in range(0, size, 10):
+        ref = f'R{i + 1}'
+        assert ref in schema
+        getattr(schema, ref)
+    return middle - start, time.perf_counter() - middle
+
+
+def main():
+    print(f'{"symbols":>8} {"bom before":>11} {"bom after":>10} '
+          f'{"lookup before":>14} {"lookup after":>13}')
+    for size in SIZES:
+        schema = schematic(size)
+        with patch.multiple(Symbol, property=_property, has_property=_has_property), \
+             patch.multiple(Schema, __contains__=_contains, __getattr__=_getattr):
+            old_bom, old_lookup = run(schema, size)
+        new_bom, new_lookup = run(schema, size)
+        print(f'{size:>8} {old_bom:>10.3f}s {new_bom:>9.3f}s '
+              f'{old_lookup:>13.3f}s {new_lookup:>12.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark the per element dispatch of the visitor chain and the Dispatcher.
+
+A synthetic schema with wires, junctions and labels is produced to
+four consumers. Two of them only count wires or labels, two do not
+override any element callback. The chain links the consumers with
+child, the Dispatcher calls only the consumers that override the
+callback. The time of producing to a single idle consumer is
+subtracted, the columns show the dispatch time per element.
+Run from the repository root:
+
+    python src/benchmark/bench_dispatch.py
+"""
+import sys
+import time
+from typing import List
+
+sys.path.append('src')
+
+from nukleus.AbstractParser import AbstractParser
+from nukleus.Dispatcher import Dispatcher
+from nukleus.ModelSchema import Junction, LocalLabel, Wire
+from nukleus.Schema import Schema
+
+SIZES = (10000, 100000)
+
+
+class _Wires(AbstractParser):
+    def __init__(self, child: AbstractParser|None = None):
+        super().__init__(child)
+        self.count = 0
+
+    def visitWire(self, wire: Wire):
+        self.count += 1
+        super().visitWire(wire)
+
+
+class _Labels(AbstractParser):
+    def __init__(self, child: AbstractParser|None = None):
+        super().__init__(child)
+        self.count = 0
+
+    def visitLocalLabel(self, local_label: LocalLabel):
+        self.count += 1
+        super().visitLocalLabel(local_label)
+
+
+class _Idle(AbstractParser):
+    pass
+
+
+def schematic(size: int) -> Schema:
+    schema = Schema()
+    for i in range(size):
+        pos = (i * 2.54, 0.0)
+        if i % 3 == 0:
+            schema.elements.append(Wire(identifier='uuid', pts=[pos, (pos[0] + 2.54, 0.0)]))
+        elif i % 3 == 1:
+            schema.elements.append(Junction(identifier='uuid', pos=pos))
+        else:
+            schema.elements.append(LocalLabel(identifier='uuid', pos=pos, text='A'))
+    return schema
+
+
+def chain() -> AbstractParser:
+    return _Wires(_Labels(_Idle(_Idle(None))))
+
+
+def dispatcher() -> AbstractParser:
+    return Dispatcher([_Wires(), _Labels(), _Idle(None), _Idle(None)])
+
+
+def produce(schema: Schema, parser: AbstractParser) -> float:
+    start = time.perf_counter()
+    schema.produce(parser)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f'{"elements":>9} {"produce":>9} {"chain":>9} {"dispatcher":>11} {"speedup":>8}')
+    for size in SIZES:
+        schema = schematic(size)
+        base = min(produce(schema, _Idle(None)) for _ in range(3))
+        old = min(produce(schema, chain()) for _ in range(3)) - base
+        new = min(produce(schema, dispatcher()) for _ in range(3)) - base
+        print(f'{size:>9} {base / size * 1e9:>7.0f}ns {old / size * 1e9:>7.0f}ns '
+              f'{new / size * 1e9:>9.0f}ns {old / new:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
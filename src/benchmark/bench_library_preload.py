@@ -0,0 +1,38 @@
+"""
+Benchmark the cold loading of all sample libraries.
+
+Library.preload_all is run without the disk cache with one worker
+and with a worker per processor. Run from the repository root:
+
+    python src/benchmark/bench_library_preload.py [library_path]
+"""
+import os
+import sys
+import time
+
+sys.path.append('src')
+
+from nukleus.Library import Library
+from nukleus.Registry import Registry
+
+LIBRARY_PATH = 'samples/files/symbols/'
+
+
+def preload(path: str, max_workers: int|None) -> float:
+    start = time.perf_counter()
+    Library([path]).preload_all(max_workers)
+    return time.perf_counter() - start
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else LIBRARY_PATH
+    Registry().cache_path = None
+    serial = preload(path, 1)
+    parallel = preload(path, None)
+    print(f'{path}: {os.cpu_count()} processors')
+    print(f'  one worker:            {serial:6.2f}s')
+    print(f'  worker per processor:  {parallel:6.2f}s {serial/parallel:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
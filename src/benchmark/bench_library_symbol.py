@@ -0,0 +1,110 @@
+"""
+Benchmark ParserVisitor._get_library_symbol on large symbol libraries.
+
+The keyed child index of SexpNode is compared against the former linear
+scan of the children. The Device library has small symbols, the
+generated library has symbols with many pins. Run from the repository root:
+
+    python src/benchmark/bench_library_symbol.py
+"""
+import sys
+import timeit
+from typing import Iterator, List
+from unittest.mock import patch
+
+sys.path.append('src')
+
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.SexpParser import SexpNode, load_tree
+
+LIBRARY = 'samples/files/symbols/Device.kicad_sym'
+PINS = 256
+SYMBOLS = 100
+
+PIN = ('(pin passive line (at 0 {0} 0) (length 2.54) '
+       '(name "P{0}" (effects (font (size 1.27 1.27)))) '
+       '(number "{0}" (effects (font (size 1.27 1.27)))))')
+
+
+def generated_library() -> str:
+    """A library with SYMBOLS symbols and PINS pins per unit."""
+    symbols = []
+    for sym in range(SYMBOLS):
+        pins = ' '.join(PIN.format(pin) for pin in range(PINS))
+        symbols.append(
+            f'(symbol "MCU{sym}" (in_bom yes) (on_board yes) '
+            f'(property "Reference" "U" (id 0) (at 0 0 0)) '
+            f'(property "Value" "MCU{sym}" (id 1) (at 0 0 0)) '
+            f'(symbol "MCU{sym}_1_1" {pins}))')
+    return f'(kicad_symbol_lib (version 20211014) {" ".join(symbols)})'
+
+
+def _contains(self, key: str) -> bool:
+    return len(self[key]) > 0
+
+
+def _getitem(self, key: str) -> List[SexpNode]:
+    res: List[SexpNode] = []
+    for node in self.sexp:
+        if isinstance(node, SexpNode) and node.sexp[0] == key:
+            res.append(node)
+    return res
+
+
+def _iter(self) -> Iterator[SexpNode]:
+    return iter([x for x in self.sexp if isinstance(x, SexpNode)])
+
+
+def _values(self) -> List[str]:
+    res: List[str] = []
+    for node in self.sexp:
+        if isinstance(node, str):
+            res.append(node)
+    return res
+
+
+def parse(symbols: List[SexpNode]):
+    for symbol in symbols:
+        ParserVisitor._get_library_symbol(symbol)
+
+
+KEYS = ('pin', 'property', 'symbol', 'power', 'extends', 'in_bom',
+        'on_board', 'pin_numbers', 'pin_names')
+
+
+def lookup(symbols: List[SexpNode]):
+    """The lookups of _get_library_symbol on the symbol nodes."""
+    for symbol in symbols:
+        for unit in symbol['symbol']:
+            for key in KEYS:
+                if key in unit:
+                    unit[key][0].get(0, '')
+
+
+def bench(name: str, content: str):
+    number = 3
+    symbols = load_tree(content)['symbol']
+    with patch.multiple(SexpNode, __contains__=_contains, __getitem__=_getitem,
+                        __iter__=_iter, values=_values):
+        scan = min(timeit.repeat(lambda: parse(symbols), number=number, repeat=3)) / number
+        scan_lookup = min(timeit.repeat(lambda: lookup(symbols), number=number, repeat=3)) / number
+
+    index = min(timeit.repeat(lambda: parse(symbols), number=number, repeat=3)) / number
+    index_lookup = min(timeit.repeat(lambda: lookup(symbols), number=number, repeat=3)) / number
+
+    print(f'{name}: {len(symbols)} symbols')
+    print(f'  _get_library_symbol linear scan: {scan*1000:8.1f}ms')
+    print(f'  _get_library_symbol keyed index: {index*1000:8.1f}ms {scan/index:5.1f}x')
+    print(f'  unit lookups linear scan:        {scan_lookup*1000:8.1f}ms')
+    print(f'  unit lookups keyed index:        {index_lookup*1000:8.1f}ms '
+          f'{scan_lookup/index_lookup:5.1f}x')
+
+
+def main():
+    with open(LIBRARY, 'r', encoding='utf-8') as file:
+        bench(LIBRARY, file.read())
+    bench(f'generated {PINS} pins', generated_library())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Scaling benchmark for the net builder of AbstractNetlist.
+
+Synthetic schematics with 10k to 100k wires are netlisted with the
+disjoint set and with the former per wire set merging. The wires form
+long chains, like busy power nets, and are visited in drawing order
+and in random order.
+Run from the repository root:
+
+    python src/benchmark/bench_netlist.py
+"""
+import random
+import sys
+import time
+from typing import List
+from unittest.mock import patch
+
+sys.path.append('src')
+
+from nukleus.AbstractNetlist import AbstractNetlist, Net
+from nukleus.AbstractParser import AbstractParser
+from nukleus.ModelSchema import LocalLabel, Wire
+
+SIZES = (10000, 30000, 100000)
+CHAIN = 1000
+LEGACY_MAX = 30000
+
+
+def _visit_wire(self, wire: Wire):
+    """The former set merging, kept as reference."""
+    net0 = self.nets.get(wire.pts[0])
+    net1 = self.nets.get(wire.pts[1])
+    if net0 and net1:
+        net = net0
+        net.coords = net0.coords.union(net1.coords)
+    elif net0:
+        net = net0
+    elif net1:
+        net = net1
+    else:
+        net = Net()
+    net.coords.add(wire.pts[0])
+    net.coords.add(wire.pts[1])
+    for coord in net.coords:
+        self.nets[coord] = net
+    AbstractParser.visitWire(self, wire)
+
+
+def _visit_local_label(self, local_label: LocalLabel):
+    net = self.nets.get(local_label.pos)
+    if not net:
+        net = Net()
+        self.nets[local_label.pos] = net
+    net.identifier = local_label.text
+    net.coords.add(local_label.pos)
+
+
+def schematic(size: int, shuffle: bool) -> List:
+    """Chains of CHAIN wires with a label at the start of every chain."""
+    elements: List = []
+    for i in range(size):
+        row, col = divmod(i, CHAIN)
+        start = (round(col * 2.54, 2), round(row * 2.54, 2))
+        end = (round((col + 1) * 2.54, 2), start[1])
+        elements.append(Wire(identifier='uuid', pts=[start, end]))
+        if col == 0:
+            elements.append(LocalLabel(identifier='uuid', pos=start, text=f'NET{row}'))
+    if shuffle:
+        random.Random(size).shuffle(elements)
+    return elements
+
+
+def netlist(elements: List) -> float:
+    start = time.perf_counter()
+    net = AbstractNetlist()
+    for element in elements:
+        if isinstance(element, Wire):
+            net.visitWire(element)
+        else:
+            net.visitLocalLabel(element)
+    net.end()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f'{"order":>8} {"wires":>8} {"set merging":>12} {"disjoint set":>13} {"speedup":>8}')
+    for shuffle in (False, True):
+        order = 'random' if shuffle else 'drawing'
+        for size in SIZES:
+            elements = schematic(size, shuffle)
+            new = netlist(elements)
+            if size <= LEGACY_MAX:
+                with patch.multiple(AbstractNetlist, visitWire=_visit_wire,
+                                    visitLocalLabel=_visit_local_label,
+                                    _nets=lambda self: []):
+                    old = netlist(elements)
+                print(f'{order:>8} {size:>8} {old:>11.2f}s {new:>12.2f}s {old/new:>7.1f}x')
+            else:
+                print(f'{order:>8} {size:>8} {"-":>12} {new:>12.2f}s')
+
+
+if __name__ == '__main__':
+    main()
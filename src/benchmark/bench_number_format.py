@@ -0,0 +1,104 @@
+"""
+Benchmark the number formatting of the SexpWriter.
+
+A synthetic schema with wires, junctions, labels and polylines on the
+1.27mm grid is written. The coordinates are formatted once with
+ffmt() and :g like before and once with the FFMT and GFMT tables.
+The schema is then written with tables that store nothing but zero,
+which formats the numbers again, and with the default tables. The
+same is done for the track boards of bench_sexp_writer.py, the start,
+end and at coordinates of the segments, vias and graphical lines.
+Run from the repository root:
+
+    python src/benchmark/bench_number_format.py
+"""
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.append('src')
+
+from bench_sexp_writer import board
+from nukleus.ModelSchema import GraphicalLine, Junction, LocalLabel, Wire
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.PCB import PCB
+from nukleus.Schema import Schema
+from nukleus.SexpParser import load_tree
+from nukleus.SexpWriter import FFMT, GFMT, SexpWriter, _NumberFormat, ffmt
+
+SIZES = (10000, 50000)
+BOARD_SIZES = (20000, 100000)
+
+
+def schematic(size: int) -> Schema:
+    schema = Schema()
+    for i in range(size):
+        pos = (round((i % 400) * 1.27, 2), round((i // 400) * 1.27, 2))
+        end = (round(pos[0] + 2.54, 2), pos[1])
+        if i % 4 == 0:
+            schema.elements.append(Wire(pts=[pos, end]))
+        elif i % 4 == 1:
+            schema.elements.append(Junction(pos=pos))
+        elif i % 4 == 2:
+            schema.elements.append(LocalLabel(pos=pos, text='A'))
+        else:
+            schema.elements.append(GraphicalLine(pts=[pos, end, (end[0], end[1] + 1.27)]))
+    return schema
+
+
+def numbers(schema: Schema):
+    result = []
+    for element in schema.elements:
+        if isinstance(element, (Wire, GraphicalLine)):
+            result += [x for pt in element.pts for x in pt]
+        else:
+            result += element.pos
+    return result
+
+
+def format_direct(values):
+    return [(f'{ffmt(x)}', f'{x:g}') for x in values]
+
+
+def format_table(values):
+    return [(FFMT[x], GFMT[x]) for x in values]
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def write(schema: Schema|PCB):
+    schema.produce(SexpWriter())
+
+
+def uncached_write(schema: Schema|PCB) -> float:
+    with patch.multiple(sys.modules['nukleus.SexpWriter'],
+                        FFMT=_NumberFormat(FFMT.function, limit=0),
+                        GFMT=_NumberFormat(GFMT.function, limit=0)):
+        return min(timed(write, schema) for _ in range(3))
+
+
+def main():
+    print(f'{"elements":>9} {"direct":>8} {"table":>8} {"uncached":>9} {"cached":>8}')
+    for size in SIZES:
+        schema = schematic(size)
+        values = numbers(schema)
+        direct = min(timed(format_direct, values) for _ in range(3))
+        table = min(timed(format_table, values) for _ in range(3))
+        uncached = uncached_write(schema)
+        cached = min(timed(write, schema) for _ in range(3))
+        print(f'{size:>9} {direct:>7.3f}s {table:>7.3f}s {uncached:>8.3f}s {cached:>7.3f}s')
+    print(f'\n{"tracks":>9} {"uncached":>9} {"cached":>8}')
+    for size in BOARD_SIZES:
+        pcb = PCB()
+        ParserVisitor(pcb).visit(load_tree(board(size)))
+        uncached = uncached_write(pcb)
+        cached = min(timed(write, pcb) for _ in range(3))
+        print(f'{size:>9} {uncached:>8.3f}s {cached:>7.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark edit and save of large boards with the raw passthrough.
+
+The boards of bench_sexp_writer.py are loaded with spans, ten track
+segments are moved and the board is written to a temporary file. With
+passthrough the writer copies the unchanged elements from the parsed
+text, the full column writes every element from the model. Parsing
+with and without spans is compared as well.
+Run from the repository root:
+
+    python src/benchmark/bench_passthrough.py
+"""
+import dataclasses
+import sys
+import tempfile
+import time
+
+sys.path.append('src')
+
+from bench_sexp_writer import board
+from nukleus.ModelPcb import TrackSegment
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.PCB import PCB
+from nukleus.SexpParser import load_tree
+from nukleus.SexpWriter import SexpWriter
+
+SIZES = (20000, 100000)
+EDITS = 10
+
+
+def load(content: str, spans: bool) -> PCB:
+    pcb = PCB()
+    ParserVisitor(pcb).visit(load_tree(content, spans=spans))
+    return pcb
+
+
+def edit(pcb: PCB):
+    indexes = [i for i, x in enumerate(pcb.elements) if isinstance(x, TrackSegment)]
+    for index in indexes[::len(indexes) // EDITS][:EDITS]:
+        segment = pcb.elements[index]
+        pcb.elements[index] = dataclasses.replace(
+            segment, end=(segment.end[0] + 1.27, segment.end[1]))
+
+
+def save(pcb: PCB, passthrough: bool) -> float:
+    with tempfile.TemporaryFile('w') as file:
+        start = time.perf_counter()
+        pcb.produce(SexpWriter(out=file, passthrough=passthrough))
+        return time.perf_counter() - start
+
+
+def main():
+    print(f'{"elements":>9} {"parse":>8} {"spans":>8} {"full":>8} {"passthrough":>12}')
+    for size in SIZES:
+        content = board(size)
+        start = time.perf_counter()
+        load(content, False)
+        parse = time.perf_counter() - start
+        start = time.perf_counter()
+        pcb = load(content, True)
+        spans = time.perf_counter() - start
+        edit(pcb)
+        full = min(save(pcb, False) for _ in range(3))
+        raw = min(save(pcb, True) for _ in range(3))
+        print(f'{size:>9} {parse:>7.2f}s {spans:>7.2f}s {full:>7.3f}s {raw:>11.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Measure the memory of a board loaded through PCB with tracemalloc.
+
+The retained memory after loading is divided by the number of elements.
+A generated board with many track segments and vias is appended to the
+sample board. Run from the repository root:
+
+    python src/benchmark/bench_pcb_memory.py [board.kicad_pcb]
+"""
+import sys
+import tracemalloc
+from io import StringIO
+from typing import Type
+
+sys.path.append('src')
+
+from nukleus.ModelPcb import TrackSegment, TrackVia
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.PCB import PCB
+
+BOARD = 'samples/files/produkt/main.kicad_pcb'
+SEGMENTS = 200000
+VIAS = 50000
+
+SEGMENT = ('  (segment (start {x} {y}) (end {x} 120.65) (width 0.5) (layer "B.Cu") '
+           '(net {net}) (tstamp 65eb646d-9c09-4d98-b9e5-{id:012d}))\n')
+VIA = ('  (via (at {x} {y}) (size 0.8) (drill 0.4) (layers "F.Cu" "B.Cu") '
+       '(net {net}) (tstamp 47325218-752c-4061-9479-{id:012d}))\n')
+
+
+def generated_board(content: str) -> str:
+    """Append SEGMENTS track segments and VIAS vias to the board."""
+    end = content.rindex(')')
+    items = [content[:end]]
+    for i in range(SEGMENTS):
+        items.append(SEGMENT.format(x=round(i * 0.01, 3), y=round(i * 0.02, 3),
+                                    net=i % 64, id=i))
+    for i in range(VIAS):
+        items.append(VIA.format(x=round(i * 0.01, 3), y=round(i * 0.02, 3),
+                                net=i % 64, id=i))
+    items.append(')\n')
+    return ''.join(items)
+
+
+def instance_size(cls: Type) -> int:
+    """Size of an empty instance including the attribute dict."""
+    obj = cls()
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(name: str, content: str):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    pcb = PCB()
+    ParserVisitor(pcb).visit_stream(StringIO(content))
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elements = len(pcb.elements)
+    retained = after - before
+    print(f'{name}: {elements} elements')
+    print(f'  before load:  {before:>12} bytes')
+    print(f'  after load:   {after:>12} bytes')
+    print(f'  peak:         {peak:>12} bytes')
+    print(f'  per element:  {retained / elements:>12.1f} bytes')
+
+
+def main():
+    board = sys.argv[1] if len(sys.argv) > 1 else BOARD
+    with open(board, 'r', encoding='utf-8') as file:
+        content = file.read()
+    print(f'TrackSegment instance: {instance_size(TrackSegment)} bytes')
+    print(f'TrackVia instance:     {instance_size(TrackVia)} bytes')
+    measure(board, content)
+    measure(f'generated {SEGMENTS} segments, {VIAS} vias', generated_board(content))
+
+
+if __name__ == '__main__':
+    main()
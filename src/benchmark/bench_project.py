@@ -0,0 +1,64 @@
+"""
+Benchmark the loading of a hierarchical project.
+
+A synthetic project with the pic_programmer root schema and 32 child
+sheets, each a copy of pic_sockets, is loaded with one worker and with
+a worker per processor. Run from the repository root:
+
+    python src/benchmark/bench_project.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.append('src')
+
+from nukleus.Project import Project
+
+SAMPLE = 'samples/files/pic_programmer'
+SHEET_UUID = '00000000-0000-0000-0000-00004804a5e2'
+SHEETS = 32
+
+
+def project(path: str, sheets: int) -> str:
+    """Write a root schema with the given number of child sheets."""
+    with open(os.path.join(SAMPLE, 'pic_programmer.kicad_sch'), 'r', encoding='utf-8') as file:
+        data = file.read()
+    start = data.index('  (sheet (at')
+    end = data.index('  (sheet_instances')
+    block = data[start:end]
+    copies = []
+    for i in range(sheets):
+        name = f'sheet{i}.kicad_sch'
+        shutil.copy(os.path.join(SAMPLE, 'pic_sockets.kicad_sch'), os.path.join(path, name))
+        copies.append(block.replace(SHEET_UUID, f'00000000-0000-0000-0000-{i:012x}')
+                           .replace('pic_sockets.kicad_sch', name))
+    filename = os.path.join(path, 'root.kicad_sch')
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write(data[:start] + ''.join(copies) + data[end:])
+    return filename
+
+
+def load(filename: str, max_workers: int|None) -> float:
+    start = time.perf_counter()
+    Project(filename, max_workers).netlist()
+    return time.perf_counter() - start
+
+
+def main():
+    tmp = tempfile.mkdtemp()
+    try:
+        filename = project(tmp, SHEETS)
+        serial = load(filename, 1)
+        parallel = load(filename, None)
+        print(f'{SHEETS} sheets: {os.cpu_count()} processors')
+        print(f'  one worker:            {serial:6.2f}s')
+        print(f'  worker per processor:  {parallel:6.2f}s {serial/parallel:5.1f}x')
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
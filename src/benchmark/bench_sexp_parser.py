@@ -0,0 +1,93 @@
+"""
+Benchmark the sexp tokenizer against the former recursive parser.
+
+Run from the repository root:
+
+    python src/benchmark/bench_sexp_parser.py
+"""
+import glob
+import sys
+import timeit
+from typing import List, Tuple
+
+sys.path.append('src')
+
+from nukleus.SexpParser import SexpNode, load_tree
+
+FILES = sorted(glob.glob('samples/files/**/*.kicad_*', recursive=True))
+
+
+def load_tree_recursive(sexp: str) -> SexpNode:
+    """The character based recursive parser, kept as reference."""
+    length = len(sexp)
+
+    def traverse(index: int) -> Tuple[SexpNode, int]:
+        res = SexpNode()
+        buffer: List[str] = []
+        item = sexp[index]
+
+        while item != ")":
+            if item in [' ', '\n', '\r']:
+                pass
+            elif item == '(':
+                subtree, index = traverse(index + 1)
+                res.sexp.append(subtree)
+
+            elif item == '"':
+                buffer = []
+                index += 1
+                while index < length:
+                    if sexp[index] == '"':
+                        break
+                    if sexp[index] == '\\':
+                        buffer.append(sexp[index])
+                        index += 1
+                    buffer.append(sexp[index])
+                    index += 1
+                res.sexp.append("".join(buffer))
+            else:
+                buffer = []
+                while index < length:
+                    if sexp[index] == ')':
+                        res.sexp.append("".join(buffer))
+                        index -= 1
+                        break
+                    if sexp[index] in [' ', '\n', '\r']:
+                        res.sexp.append("".join(buffer))
+                        break
+                    buffer.append(sexp[index])
+                    index += 1
+
+            index += 1
+            item = sexp[index]
+        return res, index
+
+    return traverse(sexp.find('(')+1)[0]
+
+
+def main():
+    total_old = 0.0
+    total_new = 0.0
+    print(f'{"file":<60} {"size":>9} {"recursive":>10} {"tokenizer":>10} {"speedup":>8}')
+    for filename in FILES:
+        if not filename.endswith(('.kicad_sch', '.kicad_pcb', '.kicad_sym')):
+            continue
+        with open(filename, 'r', encoding='utf-8') as file:
+            content = file.read()
+        assert repr(load_tree(content)) == repr(load_tree_recursive(content)), \
+            f'tree mismatch in {filename}'
+        number = 3
+        old = min(timeit.repeat(lambda: load_tree_recursive(content),
+                                number=number, repeat=3)) / number
+        new = min(timeit.repeat(lambda: load_tree(content),
+                                number=number, repeat=3)) / number
+        total_old += old
+        total_new += new
+        print(f'{filename:<60} {len(content):>9} {old*1000:>8.1f}ms '
+              f'{new*1000:>8.1f}ms {old/new:>7.1f}x')
+    print(f'{"total":<60} {"":>9} {total_old*1000:>8.1f}ms '
+          f'{total_new*1000:>8.1f}ms {total_old/total_new:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
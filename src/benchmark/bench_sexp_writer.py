@@ -0,0 +1,77 @@
+"""
+Benchmark the parse and write round trip of large boards.
+
+The track lines of the produkt board are repeated to 20k and 100k
+segments, vias and graphical lines. The board is parsed to a PCB and
+written to a temporary file, once with str() of the collected lines
+and once streamed with SexpWriter(out=file). The time and the peak
+memory allocated while writing are shown.
+Run from the repository root:
+
+    python src/benchmark/bench_sexp_writer.py
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append('src')
+
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.PCB import PCB
+from nukleus.SexpParser import load_tree
+from nukleus.SexpWriter import SexpWriter
+
+SIZES = (20000, 100000)
+BOARD = 'samples/files/produkt/main.kicad_pcb'
+TRACKS = ('  (segment ', '  (via ', '  (gr_line ')
+
+
+def board(size: int) -> str:
+    with open(BOARD, 'r') as file:
+        lines = file.read().rstrip().splitlines()
+    tracks = [x for x in lines if x.startswith(TRACKS)]
+    lines = lines[:-1] + (tracks * (size // len(tracks) + 1))[:size] + [lines[-1]]
+    return '\n'.join(lines)
+
+
+def write_string(pcb: PCB, file):
+    writer = SexpWriter()
+    pcb.produce(writer)
+    file.write(str(writer))
+
+
+def write_stream(pcb: PCB, file):
+    pcb.produce(SexpWriter(out=file))
+
+
+def run(pcb: PCB, write):
+    with tempfile.TemporaryFile('w') as file:
+        start = time.perf_counter()
+        write(pcb, file)
+        elapsed = time.perf_counter() - start
+    with tempfile.TemporaryFile('w') as file:
+        tracemalloc.start()
+        write(pcb, file)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    print(f'{"elements":>9} {"parse":>8} {"str":>8} {"stream":>8} '
+          f'{"peak str":>10} {"peak stream":>12}')
+    for size in SIZES:
+        content = board(size)
+        start = time.perf_counter()
+        pcb = PCB()
+        ParserVisitor(pcb).visit(load_tree(content))
+        parse = time.perf_counter() - start
+        old, old_peak = run(pcb, write_string)
+        new, new_peak = run(pcb, write_stream)
+        print(f'{size:>9} {parse:>7.2f}s {old:>7.2f}s {new:>7.2f}s '
+              f'{old_peak / 1e6:>8.1f}MB {new_peak / 1e6:>10.1f}MB')
+
+
+if __name__ == '__main__':
+    main()
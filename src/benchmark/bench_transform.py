@@ -0,0 +1,52 @@
+"""
+Benchmark the batch transform against the scalar transform.
+
+Synthetic symbols with eight points each are placed with the four
+KiCad angles and the three mirror states. The scalar path calls
+transform once per symbol, the batch path transforms all points
+in one call. Run from the repository root:
+
+    python src/benchmark/bench_transform.py
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append('src')
+
+from nukleus.ModelSchema import Symbol
+from nukleus.transform import transform, transform_batch
+
+SIZES = (1000, 10000, 100000)
+POINTS = 8
+
+
+def symbols(size: int):
+    rnd = random.Random(size)
+    return [Symbol(pos=(rnd.randrange(1000) * 1.27, rnd.randrange(1000) * 1.27),
+                   angle=rnd.choice((0, 90, 180, 270)), mirror=rnd.choice(('', 'x', 'y')))
+            for _ in range(size)]
+
+
+def main():
+    path = np.array([(x * 2.54, (x % 2) * 5.08) for x in range(POINTS)])
+    print(f'{"symbols":>8} {"scalar":>9} {"batch":>9} {"speedup":>8}')
+    for size in SIZES:
+        elements = symbols(size)
+        start = time.perf_counter()
+        for symbol in elements:
+            transform(symbol, path)
+        scalar = time.perf_counter() - start
+
+        start = time.perf_counter()
+        transform_batch([x.pos for x in elements], [x.angle for x in elements],
+                        [x.mirror for x in elements], np.tile(path, (size, 1)),
+                        np.repeat(np.arange(size), POINTS))
+        batch = time.perf_counter() - start
+        print(f'{size:>8} {scalar:>8.3f}s {batch:>8.3f}s {scalar/batch:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,10 @@
-from typing import Dict, List, Tuple
-
-import networkx as nx
+import math
+from typing import Dict, List, Set, Tuple
 
 from .AbstractParser import AbstractParser
 from .ModelSchema import (GlobalLabel, LocalLabel, NoConnect, Pin, PinImpl,
                           SchemaElement, Symbol, Wire)
-from .transform import get_pins, transform
+from .transform import pin_positions
 from .Typing import POS_T
 
 
@@ -32,143 +31,616 @@ class Net:
         return f"Net: {self.identifier}, coords: {self.coords}, pins: {pins_string}"
 
 
+GRID_SIZE = 5.08
+"""Cell size of the wire grid, four times the KiCad grid of 1.27mm."""
+
+EPSILON = 1e-6
+"""Tolerance for a point on a wire."""
+
+
+class _WireGrid:
+    """
+    Grid hash over the wire segments.
+
+    Horizontal and vertical wires are stored by their line and the cells
+    along the line they cover. The other wires are stored in every cell
+    their bounding box covers. A point only has to be tested against the
+    wires in its own cells.
+    """
+
+    def __init__(self, size: float = GRID_SIZE):
+        self.size = size
+        self.lines: Dict[Tuple[int, float, int], List[Tuple[float, float, int, int, int]]] = {}
+        self.cells: Dict[Tuple[int, int], List[Tuple[POS_T, POS_T, int, int, int]]] = {}
+
+    def _range(self, start: float, end: float) -> range:
+        return range(math.floor((min(start, end) - EPSILON) / self.size),
+                     math.floor((max(start, end) + EPSILON) / self.size) + 1)
+
+    def _entries(self, start: POS_T, end: POS_T, ids: Tuple[int, int], key: int):
+        if abs(start[1] - end[1]) <= EPSILON:
+            wire = (min(start[0], end[0]), max(start[0], end[0]), *ids, key)
+            line = round(start[1], 3)
+            return self.lines, [((0, line, x), wire) for x in self._range(start[0], end[0])]
+        if abs(start[0] - end[0]) <= EPSILON:
+            wire = (min(start[1], end[1]), max(start[1], end[1]), *ids, key)
+            line = round(start[0], 3)
+            return self.lines, [((1, line, y), wire) for y in self._range(start[1], end[1])]
+        wire = (start, end, *ids, key)
+        return self.cells, [(cell, wire) for cell in self.cells_of(start, end)]
+
+    def add(self, start: POS_T, end: POS_T, ids: Tuple[int, int], key: int):
+        """
+        Add a wire.
+
+        :param start POS_T: Start of the wire.
+        :param end POS_T: End of the wire.
+        :param ids Tuple[int, int]: Coordinate ids of the wire start and end.
+        :param key int: Key of the wire element.
+        """
+        table, entries = self._entries(start, end, ids, key)
+        for cell, wire in entries:
+            table.setdefault(cell, []).append(wire)
+
+    def remove(self, start: POS_T, end: POS_T, ids: Tuple[int, int], key: int):
+        """
+        Remove a wire.
+
+        :param start POS_T: Start of the wire.
+        :param end POS_T: End of the wire.
+        :param ids Tuple[int, int]: Coordinate ids of the wire start and end.
+        :param key int: Key of the wire element.
+        """
+        table, entries = self._entries(start, end, ids, key)
+        for cell, wire in entries:
+            table[cell].remove(wire)
+            if not table[cell]:
+                del table[cell]
+
+    def cell(self, pos: POS_T) -> Tuple[int, int]:
+        """
+        Get the cell of a point.
+
+        :param pos POS_T: The point.
+        :rtype Tuple[int, int]: The cell.
+        """
+        return math.floor(pos[0] / self.size), math.floor(pos[1] / self.size)
+
+    def cells_of(self, start: POS_T, end: POS_T) -> List[Tuple[int, int]]:
+        """
+        Get the cells the bounding box of a wire covers.
+
+        :param start POS_T: Start of the wire.
+        :param end POS_T: End of the wire.
+        :rtype List[Tuple[int, int]]: The cells.
+        """
+        return [(x, y) for x in self._range(start[0], end[0])
+                for y in self._range(start[1], end[1])]
+
+    @staticmethod
+    def contains(start: POS_T, end: POS_T, pos: POS_T) -> bool:
+        """
+        Test if a point is on a wire.
+
+        :param start POS_T: Start of the wire.
+        :param end POS_T: End of the wire.
+        :param pos POS_T: The point.
+        :rtype bool: True if the point is on the wire.
+        """
+        x, y = pos
+        return (min(start[0], end[0]) - EPSILON <= x <= max(start[0], end[0]) + EPSILON and
+                min(start[1], end[1]) - EPSILON <= y <= max(start[1], end[1]) + EPSILON and
+                abs((end[0] - start[0]) * (y - start[1]) -
+                    (end[1] - start[1]) * (x - start[0])) <=
+                EPSILON * max(1.0, math.dist(start, end)))
+
+    def find(self, pos: POS_T, _id: int) -> List[Tuple[int, int]]:
+        """
+        Find the wires the point is on, but not at one of their ends.
+
+        :param pos POS_T: The point.
+        :param _id int: Coordinate id of the point.
+        :rtype List[Tuple[int, int]]: Coordinate ids of the wire starts and wire keys.
+        """
+        res: List[Tuple[int, int]] = []
+        x, y = pos
+        cell_x, cell_y = self.cell(pos)
+        for low, high, start, end, key in self.lines.get((0, round(y, 3), cell_x), ()):
+            if low - EPSILON <= x <= high + EPSILON and _id != start and _id != end:
+                res.append((start, key))
+        for low, high, start, end, key in self.lines.get((1, round(x, 3), cell_y), ()):
+            if low - EPSILON <= y <= high + EPSILON and _id != start and _id != end:
+                res.append((start, key))
+        for first, second, start, end, key in self.cells.get((cell_x, cell_y), ()):
+            if _id != start and _id != end and _WireGrid.contains(first, second, pos):
+                res.append((start, key))
+        return res
+
+
+class DisjointSet:
+    """
+    Union-find with path compression.
+
+    The netlist adds coordinates, every other hashable key works as well.
+    """
+
+    def __init__(self):
+        self.ids: Dict[POS_T, int] = {}
+        """Coordinate id by coordinate, in the order they are added."""
+        self.coords: List[POS_T] = []
+        """Coordinate by coordinate id."""
+        self.parent: List[int] = []
+        self.size: List[int] = []
+
+    def add(self, coord: POS_T) -> int:
+        """
+        Get the id of a coordinate, the coordinate is added when it is new.
+
+        :param coord POS_T: The coordinate.
+        :rtype int: The coordinate id.
+        """
+        _id = self.ids.get(coord)
+        if _id is None:
+            _id = len(self.parent)
+            self.ids[coord] = _id
+            self.coords.append(coord)
+            self.parent.append(_id)
+            self.size.append(1)
+        return _id
+
+    def reset(self, _id: int):
+        """
+        Make a coordinate id a set of its own.
+
+        :param _id int: The coordinate id.
+        """
+        self.parent[_id] = _id
+        self.size[_id] = 1
+
+    def find(self, _id: int) -> int:
+        """
+        Get the root of a coordinate id.
+
+        :param _id int: The coordinate id.
+        :rtype int: The id of the root.
+        """
+        parent = self.parent
+        root = _id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[_id] != root:
+            parent[_id], _id = root, parent[_id]
+        return root
+
+    def union(self, first: int, second: int) -> int:
+        """
+        Join the sets of two coordinate ids.
+
+        :param first int: The first coordinate id.
+        :param second int: The second coordinate id.
+        :rtype int: The id of the new root.
+        """
+        first = self.find(first)
+        second = self.find(second)
+        if first == second:
+            return first
+        if self.size[first] < self.size[second]:
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] += self.size[second]
+        return first
+
+
 class AbstractNetlist(AbstractParser):
-    """Calculate netlists for the schema."""
+    """
+    Calculate netlists for the schema.
+
+    The connected coordinates are collected in a disjoint set while
+    the elements are visited. The Net objects are created in end, nets
+    is empty before. Points on the middle of a wire (T-junctions, pins
+    and labels) are connected to the wire with a grid over the wires.
+
+    After end the netlist can be changed with add and remove. Every
+    union of two coordinates is kept as link, a change only rebuilds
+    the nets of the components it touches.
+    """
 
     def __init__(self, child: AbstractParser | None = None) -> None:
         super().__init__(child)
-        self.graph = nx.MultiGraph()
+        self.pin_nets: Dict[str, str] = {}
+        """Net identifier by pin key `symbol identifier:pin number`."""
+        self.ref_pins: Dict[str, List[Tuple[str, Pin]]] = {}
+        """Pin keys and pins by symbol reference."""
+        self._graph = None
         self.nodes: Dict[Tuple[float, float], SchemaElement] = {}
         self.references: Dict[str, List[Symbol]] = {}
         self.nets: Dict[POS_T, Net] = {}
         self.no_connect: Dict[POS_T, NoConnect] = {}
+        self._coords = DisjointSet()
+        self._wires = _WireGrid()
+        self._links: Dict[int, Dict[int, int]] = {}
+        self._refs: Dict[int, int] = {}
+        self._elements: Dict[int, Tuple[SchemaElement, List[int]]] = {}
+        self._wire_links: Dict[int, List[Tuple[int, int]]] = {}
+        self._pins: Dict[int, List[Pin]] = {}
+        self._names: Dict[int, List[Tuple[int, str, int]]] = {}
+        self._order = 0
+        self._new_coords: List[int] = []
+        self._new_wires: List[Wire] = []
+        self._points: Dict[Tuple[int, int], Set[int]] | None = None
+        self._numbers: Set[str] = set()
+        self._next_number = 1
+        self._built = False
+
+    def _ref(self, coord: POS_T) -> int:
+        _id = self._coords.ids.get(coord)
+        if _id is None:
+            _id = self._coords.add(coord)
+            self._new_coords.append(_id)
+            self._refs[_id] = 1
+            if self._points is not None:
+                self._points.setdefault(self._wires.cell(coord), set()).add(_id)
+        else:
+            self._refs[_id] += 1
+        return _id
+
+    def _unref(self, _id: int):
+        self._refs[_id] -= 1
+        if self._refs[_id] == 0:
+            del self._refs[_id]
+            coord = self._coords.coords[_id]
+            del self._coords.ids[coord]
+            if self._points is not None:
+                self._points[self._wires.cell(coord)].discard(_id)
+            for other in self._links.pop(_id, {}):
+                del self._links[other][_id]
+            self._pins.pop(_id, None)
+            self._names.pop(_id, None)
+            self.nets.pop(coord, None)
+
+    def _link(self, first: int, second: int):
+        if first == second:
+            return
+        for one, other in ((first, second), (second, first)):
+            links = self._links.get(one)
+            if links is None:
+                self._links[one] = {other: 1}
+            else:
+                links[other] = links.get(other, 0) + 1
+        self._coords.union(first, second)
+
+    def _unlink(self, first: int, second: int):
+        for one, other in ((first, second), (second, first)):
+            links = self._links.get(one)
+            if links and other in links:
+                links[other] -= 1
+                if not links[other]:
+                    del links[other]
+
+    def _name(self, _id: int, name: str, key: int):
+        # the last name that is visited names the net
+        self._names.setdefault(_id, []).append((self._order, name, key))
+        self._order += 1
+
+    def _add_wire(self, wire: Wire):
+        self.nodes[wire.pts[0]] = wire
+        start = self._ref(wire.pts[0])
+        end = self._ref(wire.pts[1])
+        self._link(start, end)
+        self._wires.add(wire.pts[0], wire.pts[1], (start, end), id(wire))
+        self._new_wires.append(wire)
+        self._elements[id(wire)] = (wire, [start, end])
+
+    def _add_no_connect(self, no_connect: NoConnect):
+        self.no_connect[no_connect.pos] = no_connect
+        self._elements[id(no_connect)] = (no_connect, [])
+
+    def _add_label(self, label: LocalLabel | GlobalLabel):
+        self.nodes[label.pos] = label
+        _id = self._ref(label.pos)
+        self._name(_id, label.text, id(label))
+        self._elements[id(label)] = (label, [_id])
+
+    def _add_symbol(self, symbol: Symbol):
+        self.references.setdefault(symbol.property('Reference').value, []).append(symbol)
+        ids: List[int] = []
+        for pin, pin_pos, _ in pin_positions(symbol):
+            self.nodes[pin_pos] = pin
+            _id = self._ref(pin_pos)
+            ids.append(_id)
+            self._pins.setdefault(_id, []).append(pin)
+            if symbol.library_identifier.startswith("power:"):
+                self._name(_id, symbol.property("Value").value, id(symbol))
+        self._elements[id(symbol)] = (symbol, ids)
 
     def visitWire(self, wire: Wire):
         """Wire Symbol"""
-
-        if wire.pts[0] in self.nodes:
-            self.nodes[wire.pts[0]] = wire
-        else:
-            self.nodes[wire.pts[0]] = wire
-        if wire.pts[1] in self.nodes:
-            self.nodes[wire.pts[1]] = wire
-        else:
-            self.nodes[wire.pts[0]] = wire
-
-        net0 = self.nets.get(wire.pts[0])
-        net1 = self.nets.get(wire.pts[1])
-        if net0 and net1:
-            net = net0
-            net.coords = net0.coords.union(net1.coords)
-        elif net0:
-            net = net0
-        elif net1:
-            net = net1
-        else:
-            net = Net()
-
-        net.coords.add(wire.pts[0])
-        net.coords.add(wire.pts[1])
-
-        assert net, "net is not set"
-        for coord in net.coords:
-            self.nets[coord] = net
-
+        self._add_wire(wire)
         super().visitWire(wire)
 
     def visitNoConnect(self, no_connect: NoConnect):
         """No Connect Symbol"""
-        self.no_connect[no_connect.pos] = no_connect
+        self._add_no_connect(no_connect)
         super().visitNoConnect(no_connect)
 
     def visitLocalLabel(self, local_label: LocalLabel):
         """Local Label"""
-        self.nodes[local_label.pos] = local_label
-
-        label_pos = local_label.pos
-        net0 = self.nets.get(label_pos)
-        if net0:
-            net = net0
-        else:
-            net = Net()
-            self.nets[label_pos] = net
-
-        net.identifier = local_label.text
-        assert net, "net is not set"
-        net.coords.add(label_pos)
-
+        self._add_label(local_label)
         super().visitLocalLabel(local_label)
 
     def visitGlobalLabel(self, global_label: GlobalLabel):
         """Global Label"""
-        self.nodes[global_label.pos] = global_label
-
-        label_pos = global_label.pos
-        net0 = self.nets.get(label_pos)
-        if net0:
-            net = net0
-        else:
-            net = Net()
-            self.nets[label_pos] = net
-
-        net.identifier = global_label.text
-        assert net, "net is not set"
-        net.coords.add(label_pos)
-
+        self._add_label(global_label)
         super().visitGlobalLabel(global_label)
 
     def visitSymbol(self, symbol: Symbol):
         """Symbol"""
+        self._add_symbol(symbol)
+        super().visitSymbol(symbol)
 
-        for pin in get_pins(symbol):
-            pin_pos = transform(symbol, transform(pin))[0]
-            self.nodes[pin_pos] = pin
-
-        ref = symbol.property('Reference').value
-        if ref in self.references:
-            self.references[ref].append(symbol)
+    def _mid(self, _id: int, start: int, key: int):
+        self._link(_id, start)
+        self._wire_links.setdefault(key, []).append((_id, start))
+
+    def _resolve(self):
+        """Connect the new points and wires to the wires and points they are on."""
+        coords = self._coords.coords
+        for _id in self._new_coords:
+            if _id in self._refs:
+                for start, key in self._wires.find(coords[_id], _id):
+                    self._mid(_id, start, key)
+        if self._built:
+            # wires added after end also connect the existing points
+            if self._new_wires and self._points is None:
+                self._points = {}
+                for coord, _id in self._coords.ids.items():
+                    self._points.setdefault(self._wires.cell(coord), set()).add(_id)
+            new = set(self._new_coords)
+            for wire in self._new_wires:
+                if id(wire) in self._elements:
+                    start, end = self._elements[id(wire)][1]
+                    for cell in self._wires.cells_of(wire.pts[0], wire.pts[1]):
+                        for _id in self._points.get(cell, ()):
+                            if (_id not in new and _id != start and _id != end and
+                                    _WireGrid.contains(wire.pts[0], wire.pts[1], coords[_id])):
+                                self._mid(_id, start, id(wire))
+        self._new_coords = []
+        self._new_wires = []
+
+    def _component(self, ids: List[int]) -> Set[int]:
+        """Get the coordinate ids connected to the given ids."""
+        seen = set(ids)
+        stack = list(seen)
+        while stack:
+            for other in self._links.get(stack.pop(), ()):
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        return seen
+
+    def _nets(self, members: Set[int] | None = None) -> List[Net]:
+        """
+        Create the Net objects from the disjoint set.
+
+        :param members Set[int]|None: Coordinate ids to update, all when None.
+        :rtype List[Net]: The new Net objects.
+        """
+        self._resolve()
+        if members is None:
+            items = list(self._coords.ids.items())
         else:
-            self.references[ref] = [symbol]
-
-        for pin in get_pins(symbol):
-            pin_pos = transform(symbol, transform(pin))[0]
-            net0 = self.nets.get(pin_pos)
-            if net0:
-                net = net0
-            else:
+            coords = self._coords.coords
+            items = [(coords[x], x) for x in sorted(members) if x in self._refs]
+        nets: Dict[int, Net] = {}
+        names: Dict[int, Tuple[int, str, int]] = {}
+        for coord, _id in items:
+            root = self._coords.find(_id)
+            net = nets.get(root)
+            if net is None:
                 net = Net()
-                self.nets[pin_pos] = net
-
-            if symbol.library_identifier.startswith("power:"):
-                net.identifier = symbol.property("Value").value
-            assert net, "net is not set"
-            net.coords.add(pin_pos)
-            net.pins.append(pin)
-
-        super().visitSymbol(symbol)
+                nets[root] = net
+            net.coords.add(coord)
+            net.pins.extend(self._pins.get(_id, []))
+            name = max(self._names.get(_id, ()), default=None)
+            if name and (root not in names or names[root] < name):
+                names[root] = name
+            self.nets[coord] = net
+        for root, (_, name, _) in names.items():
+            nets[root].identifier = name
+        return list(nets.values())
+
+    def _number(self, net: Net, previous: Net | None = None):
+        if len(net.coords) == 1 and next(iter(net.coords)) in self.no_connect:
+            net.identifier = "NC"
+        elif previous and previous.identifier in self._numbers:
+            net.identifier = previous.identifier
+        else:
+            net.identifier = str(self._next_number)
+            self._numbers.add(net.identifier)
+        self._next_number += 1
+
+    def _update(self, members: Set[int]):
+        """Create the nets of the coordinate ids again after a change."""
+        previous = {x: self.nets.get(self._coords.coords[x]) for x in members}
+        used: Set[str] = set()
+        for net in self._nets(members):
+            if not net.identifier:
+                old = None
+                for coord in sorted(net.coords, key=self._coords.ids.__getitem__):
+                    old = previous.get(self._coords.ids[coord])
+                    if old is not None:
+                        break
+                if old is not None and old.identifier in used:
+                    old = None
+                self._number(net, old)
+                used.add(net.identifier)
+            for pin in net.pins:
+                self.pin_nets[f'{pin.parent.identifier}:{pin.number[0]}'] = net.identifier
+        self._graph = None
+        self._changed()
+
+    def _changed(self):
+        """Called when add or remove changed the nets after end."""
+
+    def add(self, element: SchemaElement):
+        """
+        Add an element to the netlist.
+
+        Before end the element is only collected like a visited element.
+        After end the nets the element touches are updated.
+
+        :param element SchemaElement: Wire, Symbol, label or NoConnect,
+                                      other elements are ignored.
+        """
+        if isinstance(element, Wire):
+            self._add_wire(element)
+        elif isinstance(element, NoConnect):
+            self._add_no_connect(element)
+        elif isinstance(element, (LocalLabel, GlobalLabel)):
+            self._add_label(element)
+        elif isinstance(element, Symbol):
+            self._add_symbol(element)
+            if self._built:
+                pins = self.ref_pins.setdefault(element.reference(), [])
+                for pin, _, _ in pin_positions(element):
+                    pins.append((f'{element.identifier}:{pin.number[0]}', pin))
+        else:
+            return
+        if self._built:
+            self._resolve()
+            ids = self._elements[id(element)][1]
+            if isinstance(element, NoConnect) and element.pos in self._coords.ids:
+                ids = [self._coords.ids[element.pos]]
+            self._update(self._component(ids))
+
+    def add_points(self, element: SchemaElement, coords: List[POS_T]):
+        """
+        Add an element that only connects at the coordinates.
+
+        Used for elements that have no meaning in a single sheet,
+        like hierarchical labels and sheet pins. The element can
+        be removed with remove.
+
+        :param element SchemaElement: The element.
+        :param coords List[POS_T]: The coordinates of the element.
+        """
+        ids = [self._ref(coord) for coord in coords]
+        self._elements[id(element)] = (element, ids)
+        if self._built:
+            self._resolve()
+            self._update(self._component(ids))
+
+    def is_numbered(self, net: Net) -> bool:
+        """
+        Check if the identifier of a net is a number.
+
+        :param net Net: A net of the netlist.
+        :rtype bool: True when the net is not named by a label or power symbol.
+        """
+        return net.identifier in self._numbers
+
+    def remove(self, element: SchemaElement):
+        """
+        Remove an element from the netlist.
+
+        The components the element was part of are joined again
+        from the remaining links.
+
+        :param element SchemaElement: Wire, Symbol, label or NoConnect.
+        :raises LookupError: When the element is not in the netlist.
+        """
+        record = self._elements.pop(id(element), None)
+        if record is None:
+            raise LookupError(f'element is not in the netlist: {element}')
+        ids = record[1]
+        touched = ids
+        if isinstance(element, NoConnect):
+            if self.no_connect.get(element.pos) is element:
+                del self.no_connect[element.pos]
+            if element.pos in self._coords.ids:
+                touched = [self._coords.ids[element.pos]]
+        members = self._component(touched)
+
+        key = id(element)
+        if isinstance(element, Wire):
+            self._unlink(ids[0], ids[1])
+            self._wires.remove(element.pts[0], element.pts[1], (ids[0], ids[1]), key)
+            for first, second in self._wire_links.pop(key, []):
+                self._unlink(first, second)
+        for _id in ids:
+            if _id in self._names:
+                self._names[_id] = [x for x in self._names[_id] if x[2] != key]
+            if _id in self._pins:
+                self._pins[_id] = [x for x in self._pins[_id]
+                                   if not (isinstance(x, PinImpl) and x.parent is element)]
+        if isinstance(element, Symbol):
+            ref = element.property('Reference').value
+            self.references[ref] = [x for x in self.references.get(ref, []) if x is not element]
+            if not self.references[ref]:
+                del self.references[ref]
+            pins = [x for x in self.ref_pins.get(element.reference(), []) if x[1].parent is not element]
+            for pin_key, pin in self.ref_pins.get(element.reference(), []):
+                if pin.parent is element:
+                    self.pin_nets.pop(pin_key, None)
+            if pins:
+                self.ref_pins[element.reference()] = pins
+            else:
+                self.ref_pins.pop(element.reference(), None)
+        # the nodes of an element are at the coordinates of its ids
+        for _id in ids:
+            coord = self._coords.coords[_id]
+            node = self.nodes.get(coord)
+            if node is element or getattr(node, 'parent', None) is element:
+                del self.nodes[coord]
+        for _id in ids:
+            self._unref(_id)
+
+        # join the remaining coordinates of the components again
+        members = {x for x in members if x in self._refs}
+        for _id in members:
+            self._coords.reset(_id)
+        for _id in members:
+            for other in self._links.get(_id, ()):
+                self._coords.union(_id, other)
+        if self._built:
+            self._update(members)
 
     def end(self):
-        _id = 1
-        for net in self.nets.values():
+        for net in self._nets():
             if net.identifier == '':
-                if len(net.coords) == 1 and next(iter(net.coords)) in self.no_connect:
-                    net.identifier = "NC"
-                else:
-                    net.identifier = str(_id)
-                _id += 1
+                self._number(net)
+        self._built = True
 
         for ref in self.references.values():
             for symbol in ref:
-                for pin in get_pins(symbol):
-                    pin_pos = transform(symbol, transform(pin))[0]
-                    self.graph.add_node(
-                        self.nets[pin_pos].identifier, type='net')
-                    self.graph.add_node(symbol.reference(),
-                                        symbol=symbol, type='symbol')
-                    self.graph.add_edge(
-                        self.nets[pin_pos].identifier,
-                        symbol.reference(),
-                        key=f'{pin.parent.identifier}:{pin.number[0]}',
-                        pin=pin,
-                        net=self.nets[pin_pos].identifier)
+                pins = self.ref_pins.setdefault(symbol.reference(), [])
+                for pin, pin_pos, _ in pin_positions(symbol):
+                    key = f'{symbol.identifier}:{pin.number[0]}'
+                    self.pin_nets[key] = self.nets[pin_pos].identifier
+                    pins.append((key, pin))
+        self._graph = None
         super().end()
+
+    @property
+    def graph(self):
+        """
+        The netlist as networkx MultiGraph.
+
+        The graph is created from pin_nets on first access.
+        Nets and symbols are the nodes, every pin is an edge between
+        the symbol and its net, keyed by the pin key.
+
+        :rtype nx.MultiGraph: The netlist graph.
+        """
+        if self._graph is None:
+            import networkx as nx
+            self._graph = nx.MultiGraph()
+            for symbols in self.references.values():
+                for symbol in symbols:
+                    for pin, _, _ in pin_positions(symbol):
+                        key = f'{symbol.identifier}:{pin.number[0]}'
+                        net = self.pin_nets[key]
+                        self._graph.add_node(net, type='net')
+                        self._graph.add_node(symbol.reference(), symbol=symbol, type='symbol')
+                        self._graph.add_edge(net, symbol.reference(), key=key, pin=pin, net=net)
+        return self._graph
@@ -88,8 +88,5 @@ class Bom(AbstractParser):
     def visitSymbol(self, symbol: Symbol):
         assert symbol.library_symbol, 'symbol has no library symbol'
         if symbol.library_symbol.extends not in ['power']:
-            if symbol.property('Reference').value in self.symbols:
-                self.symbols[symbol.property('Reference').value].append(symbol)
-            else:
-                self.symbols[symbol.property('Reference').value] = [symbol]
+            self.symbols.setdefault(symbol.property('Reference').value, []).append(symbol)
         super().visitSymbol(symbol)
@@ -0,0 +1,139 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from typing import Callable, Dict, Tuple, TypeVar
+
+from .Registry import Registry
+
+RESULT_FORMAT = 3
+"""Version of the result cache format, increment when the model changes."""
+
+T = TypeVar('T')
+
+_HASHES: Dict[Tuple[str, int, int], str] = {}
+"""File hash by path, modification time and size."""
+
+
+@lru_cache
+def version() -> str:
+    """
+    Get the installed nukleus version.
+
+    When nukleus is not installed, like when it is used from the
+    source tree, the version is the SHA-256 of the package sources.
+    The cache entries of other code are then outdated as well.
+
+    :rtype str: The version or the hash of the sources.
+    """
+    try:
+        return metadata.version('nukleus')
+    except metadata.PackageNotFoundError:
+        sha = hashlib.sha256()
+        package = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(package):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    filename = os.path.join(root, name)
+                    sha.update(os.path.relpath(filename, package).encode('utf-8'))
+                    with open(filename, 'rb') as file:
+                        sha.update(file.read())
+        return f'source-{sha.hexdigest()}'
+
+
+def read_cache(cache_file: str, key: Tuple) -> Tuple|None:
+    """
+    Read an entry from the cache.
+
+    :param cache_file str: The cache file.
+    :param key Tuple: The expected key.
+    :rtype Tuple|None: The cached values or None when the
+                       cache is missing or outdated.
+    """
+    try:
+        with open(cache_file, 'rb') as file:
+            cached_key, *values = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, TypeError, ValueError):
+        return None
+    if cached_key != key:
+        return None
+    return tuple(values)
+
+
+def write_cache(cache_file: str, key: Tuple, *values):
+    """
+    Write an entry to the cache.
+
+    The file is replaced atomically, errors and values that can
+    not be pickled are ignored.
+
+    :param cache_file str: The cache file.
+    :param key Tuple: The key of the entry.
+    :param values: The values to store.
+    """
+    tmp_file = None
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        handle, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file))
+        with os.fdopen(handle, 'wb') as file:
+            pickle.dump((key, *values), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def file_hash(filename: str) -> str:
+    """
+    Get the SHA-256 of a file content.
+
+    The hash is kept in memory as long as the file is not modified.
+
+    :param filename str: The filename.
+    :rtype str: The hex digest.
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    stamp = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _HASHES.get(stamp)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        _HASHES[stamp] = digest
+    return digest
+
+
+def cached(stage: str, filename: str, build: Callable[[], T], config: Tuple = ()) -> T:
+    """
+    Get a result from the content addressed cache.
+
+    The key is the SHA-256 of the input file, the stage and the
+    configuration of the visitors. The result is created with build
+    and stored when it is not in the cache. Moved or copied files
+    with the same content share the entry.
+
+    :param stage str: The name of the pipeline stage, like 'netlist'.
+    :param filename str: The input file.
+    :param build Callable[[], T]: Creates the result.
+    :param config Tuple: The configuration of the stage, must be picklable.
+    :rtype T: The result.
+    """
+    cache_path = Registry().cache_path
+    if not cache_path:
+        return build()
+    key = (stage, file_hash(filename), config, version(), RESULT_FORMAT)
+    name = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+    cache_file = os.path.join(cache_path, 'results', f'{name}.pickle')
+    values = read_cache(cache_file, key)
+    if values is not None:
+        return values[0]
+    result = build()
+    write_cache(cache_file, key, result)
+    return result
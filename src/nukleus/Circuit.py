@@ -1,12 +1,11 @@
 from __future__ import annotations
 from typing import List, Dict
 
-import networkx as nx
 from nukleus.AbstractNetlist import AbstractNetlist
 
 from nukleus.AbstractParser import AbstractParser
 from nukleus.Registry import Registry
-from .transform import get_pins
+from .transform import pin_positions
 from .ModelSchema import Symbol
 
 from .SpiceModel import get_includes, load_spice_models, spice_model
@@ -100,6 +99,7 @@ class Circuit(AbstractNetlist):
         super().__init__(child)
         self.includes: List[spice_model] = []
         self.netlist: List[Element] = []
+        self._generated: List[Element] = []
         self.subcircuits: Dict[str, Circuit] = {}
         self.spice_models: List[spice_model] = load_spice_models(Registry().spice_path)
 
@@ -242,7 +242,7 @@ class Circuit(AbstractNetlist):
             assert comp.library_symbol, 'Library Symbol not set.'
             if comp.library_symbol.extends == "power":
                 continue
-            for pin in get_pins(comp):
+            for pin, _, _ in pin_positions(comp):
                 pins.append(pin.number[0])
 
         if all([item.isdigit() for item in pins]):
@@ -251,14 +251,18 @@ class Circuit(AbstractNetlist):
 
     def end(self):
         super().end()
-        symbols = nx.get_node_attributes(self.graph, 'symbol')
-        #for symbol in symbols:
-        for _, symbols in self.references.items():
-            edge_list = []
-            for _symbol in symbols:
-                edge_list.extend(self.graph.edges(_symbol.reference(), keys=True, data=True))
+        self._spice()
+
+    def _changed(self):
+        self._spice()
 
-            element: Symbol = symbols[0] #self.graph.nodes[symbol]['symbol']
+    def _spice(self):
+        """Create the spice elements of the symbols, the other elements are kept."""
+        generated = {id(x) for x in self._generated}
+        others = [x for x in self.netlist if id(x) not in generated]
+        self.netlist = []
+        for _, symbols in self.references.items():
+            element: Symbol = symbols[0]
             sym = element.library_symbol
             assert sym, 'Library Symbol not set.'
             if sym.extends == "power":
@@ -278,9 +282,9 @@ class Circuit(AbstractNetlist):
                 nodes: List[str] = []
                 for nlitem in seq:
                     for symbol in symbols:
-                        for edges in edge_list:
-                            if edges[2] == f'{symbol.identifier}:{nlitem}':
-                                nodes.append(edges[3]['net'])
+                        net = self.pin_nets.get(f'{symbol.identifier}:{nlitem}')
+                        if net is not None:
+                            nodes.append(net)
 
                 if self._spice_primitive(element, "X"):
                     model = element.property("Spice_Model").value
@@ -328,6 +332,8 @@ class Circuit(AbstractNetlist):
                 elif element.has_property("Spice_Primitive"):
                     print(
                         f'unknown spice primitive "{element.property("Spice_Primitive").value}"')
+        self._generated = list(self.netlist)
+        self.netlist.extend(others)
 
 class SubCircuit(Circuit):
     """
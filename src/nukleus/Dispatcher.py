@@ -0,0 +1,98 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Protocol
+
+from .AbstractParser import AbstractParser
+
+METHODS = [name for name, value in vars(AbstractParser).items()
+           if callable(value) and not name.startswith('_')]
+"""The callbacks of AbstractParser."""
+
+
+class Producer(Protocol):
+    """Anything that replays its elements to a parser, like Schema or PCB."""
+
+    def produce(self, parser: AbstractParser):
+        ...
+
+
+def _ignore(*_):
+    pass
+
+
+def _overrides(consumer: AbstractParser, name: str) -> bool:
+    """
+    Test if the consumer has to be called for a callback.
+
+    :param consumer AbstractParser: The consumer.
+    :param name str: The name of the callback.
+    :rtype bool: False when the default implementation would do nothing.
+    """
+    if consumer._next is not None or name in vars(consumer):
+        return True
+    return getattr(type(consumer), name) is not getattr(AbstractParser, name)
+
+
+def _fan_out(methods: List[Callable]) -> Callable:
+    if not methods:
+        return _ignore
+    if len(methods) == 1:
+        return methods[0]
+    if len(methods) == 2:
+        first, second = methods
+        def call_two(*args):
+            first(*args)
+            second(*args)
+        return call_two
+    def call(*args):
+        for method in methods:
+            method(*args)
+    return call
+
+
+class Dispatcher(AbstractParser):
+    """
+    Fan out the callbacks to several consumers.
+
+    A dispatch table with the consumers that override the callback is
+    built once. A consumer that does not override a callback and has
+    no child is never called for it. The child is called like a consumer
+    after the others.
+
+    :param consumers List[AbstractParser]: The consumers in call order.
+    :param child AbstractParser|None: The next parser.
+    """
+
+    def __init__(self, consumers: List[AbstractParser], child: AbstractParser|None = None) -> None:
+        super().__init__(child)
+        self.consumers = list(consumers) + ([child] if child else [])
+        self.table: Dict[str, List[Callable]] = {}
+        """The bound methods by callback name."""
+        for name in METHODS:
+            methods = [getattr(consumer, name) for consumer in self.consumers
+                       if _overrides(consumer, name)]
+            self.table[name] = methods
+            setattr(self, name, _fan_out(methods))
+
+
+def produce(producer: Producer, consumers: List[AbstractParser],
+            max_workers: int|None = None):
+    """
+    Replay the elements of a producer to independent consumers.
+
+    Every consumer gets the whole stream in its own worker thread.
+    The elements are shared and must not be changed by the consumers.
+    Use a Dispatcher when the consumers should see every element in turn.
+
+    :param producer Producer: The element source, like a loaded Schema.
+    :param consumers List[AbstractParser]: The consumers.
+    :param max_workers int|None: Maximum number of threads, one
+                                 per consumer when None.
+    """
+    if max_workers == 1 or len(consumers) <= 1:
+        for consumer in consumers:
+            producer.produce(consumer)
+        return
+    with ThreadPoolExecutor(max_workers=max_workers or len(consumers)) as executor:
+        for future in [executor.submit(producer.produce, x) for x in consumers]:
+            future.result()
@@ -1,12 +1,11 @@
 from __future__ import annotations
 from typing import List, Dict
 
-import networkx as nx
 from nukleus.AbstractNetlist import AbstractNetlist
 
 from nukleus.AbstractParser import AbstractParser
 from nukleus.Registry import Registry
-from .transform import get_pins
+from .transform import pin_positions
 from .ModelSchema import Symbol
 
 
@@ -25,7 +24,7 @@ class ERC(AbstractNetlist):
             assert comp.library_symbol, 'Library Symbol not set.'
             if comp.library_symbol.extends == "power":
                 continue
-            for pin in get_pins(comp):
+            for pin, _, _ in pin_positions(comp):
                 pins.append(pin.number[0])
 
         if all([item.isdigit() for item in pins]):
@@ -35,7 +34,6 @@ class ERC(AbstractNetlist):
     def end(self):
         super().end()
 
-        symbols = nx.get_node_attributes(self.graph, 'symbol')
         for ref, symbols in self.references.items():
             #check if all units are on the schema
             # TODO
@@ -1,12 +1,23 @@
 from __future__ import annotations
+import atexit
 from functools import lru_cache
+import hashlib
 import os
-from copy import deepcopy
-from typing import cast, Dict, List
+import re
+import bisect
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from typing import Dict, List, Set, Tuple
 from .AbstractParser import AbstractParser
+from .Cache import read_cache, version, write_cache
 from .ModelSchema import LibrarySymbol
 from .ParserVisitor import ParserVisitor
-from .SexpParser import load_tree, SexpNode
+from .Registry import Registry
+from .SexpParser import load_tree, iter_nodes
+
+CACHE_FORMAT = 2
+"""Version of the library cache format, increment when the model changes."""
 
 class LibrarySymbolNotFound(Exception):
     """Library can not be found."""
@@ -15,21 +26,343 @@ class LibrarySymbolNotFound(Exception):
 class LibrarySymbolFromat(Exception):
     """When the library symbol name has wrong format."""
 
-class _LibraryParser(ParserVisitor):
-#   def __init__(self, consumer: AbstractParser):
-#       super().__init__(consumer)
-    def node(self, name: str, sexp: SexpNode) -> None:
-        if name == 'symbol':
-            lib_symbol = ParserVisitor._get_library_symbol(cast(SexpNode, sexp))
-            self.consumer.visitLibrarySymbol(lib_symbol)
+_BRACKETS = re.compile(rb'"(?:[^"\\]|\\.)*"|[()]')
+"""Quoted strings and brackets of a library file."""
+
+_SYMBOL_NAME = re.compile(rb'\(\s*symbol\s+"((?:[^"\\]|\\.)*)"')
+"""The name of a symbol node."""
+
+
+def _index_symbols(data: bytes) -> Dict[str, Tuple[int, int]]:
+    """
+    Find the byte ranges of the top level symbols in a library file.
+
+    :param data bytes: The library file content.
+    :rtype Dict[str, Tuple[int, int]]: Start and end offset by symbol name.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    depth = 0
+    start = 0
+    for match in _BRACKETS.finditer(data):
+        token = match.group()
+        if token == b'(':
+            depth += 1
+            if depth == 2:
+                start = match.start()
+        elif token == b')':
+            if depth == 2:
+                name = _SYMBOL_NAME.match(data, start)
+                if name:
+                    index[name.group(1).decode('utf-8')] = (start, match.end())
+            depth -= 1
+    return index
+
+
+def _cache_key(filename: str) -> Tuple[str|None, Tuple]:
+    """
+    Get the cache file and the key of a library file.
+
+    The key changes when the library file or the nukleus version changes.
+
+    :param filename str: The library filename.
+    :rtype Tuple[str|None, Tuple]: The cache file or None when
+                                   the cache is disabled and the key.
+    """
+    cache_path = Registry().cache_path
+    if not cache_path:
+        return None, ()
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size, version(), CACHE_FORMAT)
+    name = hashlib.sha1(path.encode('utf-8')).hexdigest()
+    return os.path.join(cache_path, f'{name}.pickle'), key
+
+
+def _parse_library(filename: str) -> Tuple[Dict[str, Tuple[int, int]], Dict[str, LibrarySymbol]]:
+    """
+    Index and parse all symbols of a library file.
+
+    This runs in the worker processes of Library.preload.
+
+    :param filename str: The library filename.
+    :rtype Tuple[Dict[str, Tuple[int, int]], Dict[str, LibrarySymbol]]: The
+        byte ranges and the parsed symbols by name.
+    """
+    with open(filename, 'rb') as file:
+        data = file.read()
+    index = _index_symbols(data)
+    symbols: Dict[str, LibrarySymbol] = {}
+    for name, (start, end) in index.items():
+        symbols[name] = ParserVisitor._get_library_symbol(
+            load_tree(data[start:end].decode('utf-8')))
+    return index, symbols
+
+
+_UNSAVED: Set[_LibraryFile] = set()
+"""Library files with symbols that are parsed but not in the cache."""
+
+
+@atexit.register
+def save_libraries():
+    """Store the symbols that were parsed on demand in the cache."""
+    while _UNSAVED:
+        _UNSAVED.pop()._store()
+
+
+class _LibraryFile():
+    """
+    A library file with the symbols loaded on demand.
+
+    The byte ranges of the top level symbols are indexed when the file
+    is opened. A symbol is parsed on the first access. The index and the
+    parsed symbols are stored in the cache, the symbols parsed on demand
+    once by save_libraries at exit or when Library.save is called.
+
+    :param filename str: The library filename.
+    :param parsed Tuple|None: Index and symbols from _parse_library.
+    """
+    def __init__(self, filename: str, parsed: Tuple|None = None):
+        self.filename = filename
+        self.index: Dict[str, Tuple[int, int]] = {}
+        self.symbols: Dict[str, LibrarySymbol] = {}
+        self._cache_file, self._key = _cache_key(filename)
+
+        if parsed:
+            self.index, self.symbols = parsed
+            self._store()
+            return
+
+        cached = read_cache(self._cache_file, self._key) if self._cache_file else None
+        if cached:
+            self.index, self.symbols = cached
+        else:
+            with open(filename, 'rb') as file:
+                self.index = _index_symbols(file.read())
+            self._store()
+
+    @classmethod
+    def from_cache(cls, filename: str) -> _LibraryFile|None:
+        """
+        Get the library file from the cache without indexing the file.
+
+        :param filename str: The library filename.
+        :rtype _LibraryFile|None: The library file or None when not cached.
+        """
+        cache_file, key = _cache_key(filename)
+        cached = read_cache(cache_file, key) if cache_file else None
+        if not cached:
+            return None
+        library = cls.__new__(cls)
+        library.filename = filename
+        library._cache_file, library._key = cache_file, key
+        library.index, library.symbols = cached
+        return library
+
+    @property
+    def complete(self) -> bool:
+        """True when all symbols are parsed."""
+        return len(self.symbols) == len(self.index)
+
+    def _store(self):
+        if self._cache_file:
+            write_cache(self._cache_file, self._key, self.index, self.symbols)
+
+    def save(self):
+        """Store the symbols when some were parsed since the last store."""
+        if self in _UNSAVED:
+            _UNSAVED.discard(self)
+            self._store()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def get(self, name: str) -> LibrarySymbol:
+        """
+        Get a symbol, the symbol is parsed on the first access.
+
+        :param name str: The symbol name.
+        :rtype LibrarySymbol: The parsed symbol.
+        """
+        symbol = self.symbols.get(name)
+        if symbol is None:
+            start, end = self.index[name]
+            with open(self.filename, 'rb') as file:
+                file.seek(start)
+                data = file.read(end - start)
+            symbol = ParserVisitor._get_library_symbol(load_tree(data.decode('utf-8')))
+            self.symbols[name] = symbol
+            if self._cache_file:
+                _UNSAVED.add(self)
+        return symbol
+
+
+_WORDS = re.compile(r'\w+')
+"""The words of a search text."""
+
+
+def _symbol_texts(filename: str) -> List[Tuple[str, str]]:
+    """
+    Get the searchable text of the symbols in a library file.
+
+    The text contains the symbol name and all property values
+    including the keywords and the description.
+
+    :param filename str: The library filename.
+    :rtype List[Tuple[str, str]]: Symbol name and text.
+    """
+    texts: List[Tuple[str, str]] = []
+    with open(filename, 'r', encoding='utf-8') as file:
+        for node in iter_nodes(file):
+            if node.get(0, '') == 'symbol':
+                name = node.get(1, '')
+                values = [prop.get(2, '') for prop in node['property']]
+                texts.append((name, '\n'.join([name, *values])))
+    return texts
+
+
+def _tokens(text: str) -> Set[str]:
+    """
+    Split the text into lower case tokens.
+
+    The tokens are the whitespace separated words and the alphanumeric
+    parts of the words.
+
+    :param text str: The text.
+    :rtype Set[str]: The tokens.
+    """
+    text = text.lower()
+    return set(text.split()) | set(_WORDS.findall(text))
 
-class _LibraryVisitor(AbstractParser):
-    def __init__(self):
-        super().__init__(None)
-        self.libraries: List[LibrarySymbol] = []
 
-    def visitLibrarySymbol(self, symbol: LibrarySymbol):
-        self.libraries.append(symbol)
+class SymbolIndex():
+    """
+    Inverted index over the symbols of the library files.
+
+    The searchable texts are read once per library file and stored in
+    the cache with the file mtime and size. Only new or changed files
+    are read again by update.
+
+    :param paths List[str]: The library paths.
+    """
+
+    def __init__(self, paths: List[str]):
+        self.paths = paths
+        self.files: Dict[str, Tuple[int, int, List[Tuple[str, str]]]] = {}
+        """Stat and symbol texts by library filename."""
+        self.documents: List[Tuple[str, str]] = []
+        """Library identifier and lower case text by document id."""
+        self.tokens: List[str] = []
+        """Sorted tokens of all documents."""
+        self.postings: Dict[str, Set[int]] = {}
+        """Document ids by token."""
+        self._loaded = False
+
+    def _index_file(self) -> str|None:
+        cache_path = Registry().cache_path
+        if not cache_path:
+            return None
+        paths = '\n'.join(os.path.abspath(path) for path in self.paths)
+        name = hashlib.sha1(paths.encode('utf-8')).hexdigest()
+        return os.path.join(cache_path, f'symbol_index_{name}.pickle')
+
+    def _library_files(self) -> List[str]:
+        files: List[str] = []
+        for path in self.paths:
+            files.extend(sorted(glob.glob(os.path.join(os.path.abspath(path), '*.kicad_sym'))))
+        return files
+
+    def update(self) -> bool:
+        """
+        Read the new and changed library files and rebuild the index.
+
+        :rtype bool: True when the index was changed.
+        """
+        index_file = self._index_file()
+        key = (version(), CACHE_FORMAT)
+        if not self._loaded:
+            self._loaded = True
+            cached = read_cache(index_file, key) if index_file else None
+            if cached:
+                self.files, self.documents, self.tokens, self.postings = cached
+
+        changed = False
+        library_files = self._library_files()
+        for filename in library_files:
+            stat = os.stat(filename)
+            entry = self.files.get(filename)
+            if not entry or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+                self.files[filename] = (stat.st_mtime_ns, stat.st_size, _symbol_texts(filename))
+                changed = True
+        # removed files
+        for filename in set(self.files.keys()) - set(library_files):
+            del self.files[filename]
+            changed = True
+
+        if changed:
+            self._build()
+            if index_file:
+                write_cache(index_file, key, self.files,
+                             self.documents, self.tokens, self.postings)
+        return changed
+
+    def _build(self):
+        self.documents = []
+        self.postings = {}
+        for filename, (*_, texts) in sorted(self.files.items()):
+            prefix = os.path.splitext(os.path.basename(filename))[0]
+            for name, text in texts:
+                doc = len(self.documents)
+                self.documents.append((f'{prefix}:{name}', text.lower()))
+                for token in _tokens(text):
+                    self.postings.setdefault(token, set()).add(doc)
+        self.tokens = sorted(self.postings.keys())
+
+    def _prefix(self, word: str) -> Set[int]:
+        res: Set[int] = set()
+        start = bisect.bisect_left(self.tokens, word)
+        for token in self.tokens[start:]:
+            if not token.startswith(word):
+                break
+            res |= self.postings[token]
+        return res
+
+    def _substring(self, word: str) -> Set[int]:
+        res: Set[int] = set()
+        for token in self.tokens:
+            if word in token:
+                res |= self.postings[token]
+        return res
+
+    def search(self, pattern: str, mode: str = 'substring') -> List[str]:
+        """
+        Search the symbols.
+
+        In the prefix and substring mode every word of the pattern must
+        match a token of the symbol. The regex is searched in the symbol
+        name and the property values, each on its own line. The search
+        is case insensitive.
+
+        :param pattern str: The search pattern.
+        :param mode str: 'prefix', 'substring' or 'regex'.
+        :rtype List[str]: The matching library identifiers.
+        :raises ValueError: When the mode is unknown.
+        """
+        if mode == 'regex':
+            regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+            return sorted(lib_id for lib_id, text in self.documents if regex.search(text))
+        if mode == 'prefix':
+            lookup = self._prefix
+        elif mode == 'substring':
+            lookup = self._substring
+        else:
+            raise ValueError(f'unknown search mode: {mode}')
+
+        docs: Set[int]|None = None
+        for word in pattern.lower().split():
+            docs = lookup(word) if docs is None else docs & lookup(word)
+            if not docs:
+                break
+        return sorted(self.documents[doc][0] for doc in docs or [])
 
 
 class Library(AbstractParser):
@@ -37,16 +370,34 @@ class Library(AbstractParser):
 
     def __init__(self, paths: List[str] | None = None):
         self.paths = [] if paths is None else paths
-        self.symbols: Dict[str, List[LibrarySymbol]] = {}
+        self.libraries: Dict[str, _LibraryFile] = {}
+        self._index: SymbolIndex|None = None
+
+    def search(self, pattern: str, mode: str = 'substring') -> List[str]:
+        """
+        Search the symbols of all library files in the paths.
 
-    def search(self, pattern):
-        pass
+        The library files are not parsed at query time, the index is
+        only updated when a library file has changed.
+
+        :param pattern str: The search pattern.
+        :param mode str: 'prefix', 'substring' or 'regex'.
+        :rtype List[str]: The matching library identifiers, GROUP:NAME.
+        """
+        if self._index is None:
+            self._index = SymbolIndex(self.paths)
+        self._index.update()
+        return self._index.search(pattern, mode)
 
     @lru_cache
     def get(self, name) -> LibrarySymbol:
         """
         Load a library symbol.
 
+        The returned symbol is a shallow copy, the units, graphics, pins
+        and properties are shared with all other copies of the symbol and
+        must not be changed. The per instance values are held by Symbol.
+
         :param name str: Name of the library symbol.
         :rtype LibrarySymbol: The Symbol instance.
         :raises LibrarySymbolNotFound: Library symbol not found.
@@ -57,36 +408,91 @@ class Library(AbstractParser):
 
         prefix, suffix = name.split(':')
 
-        if not prefix in self.symbols:
+        if not prefix in self.libraries:
             self._load_symbols(prefix)
 
-        for symbol in self.symbols[prefix]:
-            if symbol.identifier == suffix:
-                if symbol.extends not in ('', 'power'):
-                    parent_symbol = self.get(
-                        f'{prefix}:{symbol.extends}')
-                    symbol.units = parent_symbol.units
-                return deepcopy(symbol)
+        library = self.libraries[prefix]
+        if suffix in library:
+            symbol = copy(library.get(suffix))
+            if symbol.extends not in ('', 'power'):
+                parent_symbol = self.get(
+                    f'{prefix}:{symbol.extends}')
+                symbol.units = parent_symbol.units
+            return symbol
 
         raise LibrarySymbolNotFound("Symbol not found", name, self.paths)
 
-    def _load_symbols(self, prefix) -> bool:
-        # load the symbols
+    def save(self):
+        """
+        Store the symbols parsed on demand in the cache.
+
+        This is done at exit as well, call it to store them earlier.
+        """
+        for library in self.libraries.values():
+            library.save()
+
+    def preload(self, prefixes: List[str], max_workers: int|None = None):
+        """
+        Parse all symbols of the library files.
+
+        The library files are parsed in parallel in a process pool.
+        Files that are completely parsed in the cache are not parsed again.
+
+        :param prefixes List[str]: The library names.
+        :param max_workers int|None: Maximum number of worker processes,
+                                     the number of processors when None.
+        :raises LibrarySymbolNotFound: Library file not found.
+        """
+        todo: Dict[str, str] = {}
+        for prefix in prefixes:
+            library = self.libraries.get(prefix)
+            if library is None:
+                filename = self._filename(prefix)
+                library = _LibraryFile.from_cache(filename)
+                if library is None:
+                    todo[prefix] = filename
+                    continue
+                self.libraries[prefix] = library
+            if not library.complete:
+                # the parsed file replaces the partial one
+                _UNSAVED.discard(library)
+                todo[prefix] = library.filename
+
+        workers = min(len(todo), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            results = map(_parse_library, todo.values())
+            for prefix, parsed in zip(todo.keys(), results):
+                self.libraries[prefix] = _LibraryFile(todo[prefix], parsed)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_parse_library, todo.values())
+                for prefix, parsed in zip(todo.keys(), results):
+                    self.libraries[prefix] = _LibraryFile(todo[prefix], parsed)
+
+    def preload_all(self, max_workers: int|None = None):
+        """
+        Parse all library files in the paths.
+
+        :param max_workers int|None: Maximum number of worker processes,
+                                     the number of processors when None.
+        """
+        prefixes: List[str] = []
+        for path in self.paths:
+            for filename in sorted(glob.glob(os.path.join(path, '*.kicad_sym'))):
+                prefix = os.path.splitext(os.path.basename(filename))[0]
+                if prefix not in prefixes:
+                    prefixes.append(prefix)
+        self.preload(prefixes, max_workers)
+
+    def _filename(self, prefix) -> str:
         for path in self.paths:
             filename = os.path.join(path, f'{prefix}.kicad_sym')
             if os.path.isfile(filename):
-                self.symbols[prefix] = self._load(filename, self)
-                return True
+                return filename
         raise LibrarySymbolNotFound(
             "Symbol prefix not found", prefix, self.paths)
 
-
-    @classmethod
-    @lru_cache
-    def _load(cls, filename, consumer) -> List[LibrarySymbol]:
-        with open(filename, 'r', encoding='utf-8') as file:
-            tree = load_tree(file.read())
-            visitor = _LibraryVisitor()
-            parser = _LibraryParser(visitor)
-            parser.visit(tree)
-            return visitor.libraries
+    def _load_symbols(self, prefix) -> bool:
+        # index the library file
+        self.libraries[prefix] = _LibraryFile(self._filename(prefix))
+        return True
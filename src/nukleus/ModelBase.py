@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
 from abc import ABC
 from enum import Enum
-from typing import Any, Dict, List, Tuple
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple
 
+from .Typing import POS_T
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class TitleBlock():
     """Schema title block"""
     title: str = ""
@@ -22,6 +25,8 @@ class TitleBlock():
 
 
 class rgb():
+    __slots__ = ('r', 'g', 'b', 'a')
+
     def __init__(self, r: float, g: float, b: float, a: float):
         self.r = r
         self.g = g
@@ -151,7 +156,7 @@ class Justify(Enum):
         return 'center'
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TextEffects():
     """The text effects definition."""
 
@@ -173,7 +178,7 @@ class TextEffects():
     color: rgb = rgb(0, 0, 0, 0)
     """Text color."""
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StrokeDefinition():
     """
     The stroke token defines how the outlines of graphical objects are drawn.
@@ -196,3 +201,54 @@ class StrokeDefinition():
 
 class BaseElement(ABC):
     """Abstract class for the Elements"""
+    __slots__ = ()
+
+
+_PLAIN_TYPES = {str, int, float, bool, POS_T, 'str', 'int', 'float', 'bool', 'POS_T'}
+"""Field types with immutable values, they are compared without following them."""
+
+_STATES: Dict[type, Callable[[Any], Any]] = {}
+"""Function that gets the state by type."""
+
+
+def _state_function(cls: type) -> Callable[[Any], Any]:
+    if cls is list:
+        return lambda value: [model_state(x) for x in value]
+    if cls is rgb:
+        return rgb.get
+    if not is_dataclass(cls):
+        return lambda value: value
+    plain: List[str] = []
+    nested: List[str] = []
+    for _field in fields(cls):
+        if _field.compare and _field.metadata.get('state', True):
+            (plain if _field.type in _PLAIN_TYPES else nested).append(_field.name)
+    if len(plain) > 1:
+        getter = attrgetter(*plain)
+    elif plain:
+        single = attrgetter(plain[0])
+        getter = lambda value: (single(value),)
+    else:
+        getter = lambda value: ()
+    if not nested:
+        return getter
+    return lambda value: (getter(value), [model_state(getattr(value, x)) for x in nested])
+
+
+def model_state(value: Any) -> Any:
+    """
+    Get the values of a model object to find changes.
+
+    The compared fields of a dataclass are collected, lists and nested
+    model objects are followed. The state differs when the object or
+    one of its nested objects was changed in place. Fields with the
+    metadata state=False, like the library symbol of a symbol, are
+    not part of the state.
+
+    :param value Any: The model object.
+    :rtype Any: The state, to compare with a state taken before.
+    """
+    function = _STATES.get(type(value))
+    if function is None:
+        function = _STATES[type(value)] = _state_function(type(value))
+    return function(value)
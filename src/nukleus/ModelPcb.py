@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List
 
 from .ModelBase import BaseElement
-from .Typing import POS_T
+from .Typing import PARSED_T, POS_T
 
 class PcbGeneral(BaseElement):
     """The general token define general information about the board. This section is required."""
@@ -29,7 +29,7 @@ class PcbGeneral(BaseElement):
         return self.value == __o.value
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StackUpLayerSettings(BaseElement):
     """The layer token defines the stack up setting
        of a single layer in the board stack up settings."""
@@ -59,7 +59,7 @@ class StackUpLayerSettings(BaseElement):
        the dielectric loss tangent of the layer"""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class StackupSettings(BaseElement):
     """The optional stackup toke defines the board stack up settings."""
     layers: List[StackUpLayerSettings] = field(default_factory=list)
@@ -83,7 +83,7 @@ class StackupSettings(BaseElement):
        board edges should be plated."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PlotSettings(BaseElement):
     layerselection: str = ''
     disableapertmacros: str = ''
@@ -118,7 +118,7 @@ class PlotSettings(BaseElement):
     outputdirectory: str = ''
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PcbSetup(BaseElement):
     """
     The general token define general information about the board. This section is required.
@@ -137,7 +137,7 @@ class PcbSetup(BaseElement):
     castellated_pads: str = ''
     edge_plating: str = ''
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PcbLayer(BaseElement):
     """The layers token defines all of the layers used by the board.
        This section is required."""
@@ -158,7 +158,7 @@ class PcbLayer(BaseElement):
     """The optional USER_NAME attribute defines the custom user name."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TrackSegment(BaseElement):
     """
     The segment token defines a track segment.
@@ -178,9 +178,11 @@ class TrackSegment(BaseElement):
        section that the segment is part of."""
     tstamp: str = ''
     """The tstamp token defines the unique identifier of the line object."""
+    source: PARSED_T|None = field(default=None, init=False, repr=False, compare=False)
+    """The parsed text of the element, see SchemaElement.source."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TrackVia(BaseElement):
     """
     The via token defines a track via.
@@ -210,9 +212,11 @@ class TrackVia(BaseElement):
     net in the net section that the segment is part of."""
     tstamp: str = ''
     """The tstamp token defines the unique identifier of the line object."""
+    source: PARSED_T|None = field(default=None, init=False, repr=False, compare=False)
+    """The parsed text of the element, see SchemaElement.source."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PcbGraphicalLine(BaseElement):
     """The gr_line token defines a graphical line."""
     start: POS_T = (0, 0)
@@ -227,19 +231,23 @@ class PcbGraphicalLine(BaseElement):
     """The layer token defines the canonical layer the line resides on."""
     tstamp: str = ''
     """The tstamp token defines the unique identifier of the line object."""
+    source: PARSED_T|None = field(default=None, init=False, repr=False, compare=False)
+    """The parsed text of the element, see SchemaElement.source."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Net(BaseElement):
     """The net token defines a net for the board. This section is required."""
     ordinal: int = 0
     """The oridinal attribute is an integer that defines the net order."""
     netname: str = ''
     """The net name is a string that defines the name of the net."""
+    source: PARSED_T|None = field(default=None, init=False, repr=False, compare=False)
+    """The parsed text of the element, see SchemaElement.source."""
 
 
-@dataclass(kw_only=True)
-class Footprint():
+@dataclass(kw_only=True, slots=True)
+class Footprint(BaseElement):
     """
     The footprint token defines a footprint.
     """
@@ -270,3 +278,5 @@ class Footprint():
     ZONES: str = ''
     GROUPS: str = ''
     MODEL: str = ''
+    source: PARSED_T|None = field(default=None, init=False, repr=False, compare=False)
+    """The parsed text of the element, see SchemaElement.source."""
@@ -4,12 +4,13 @@ from typing import Any, Dict, List, Tuple, cast
 from dataclasses import dataclass, field
 import string
 
-from copy import deepcopy
+from copy import copy
 from enum import Enum
 import re
 import uuid
 
 from .ModelBase import StrokeDefinition, TextEffects, FillType, rgb, BaseElement
+from .Typing import PARSED_T
 
 import numpy as np
 import math
@@ -22,13 +23,13 @@ from .Typing import POS_T, PTS_T
 ###############################################################################
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GraphicItem():
     """Abstract Class for a GraphicItem."""
     fill: FillType = FillType.NONE
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Polyline(GraphicItem):
     '''
     Polyline
@@ -43,7 +44,7 @@ class Polyline(GraphicItem):
     stroke_definition: StrokeDefinition = StrokeDefinition()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Rectangle(GraphicItem):
     """The rectangle token defines a graphical rectangle in a symbol definition."""
     start_x: float = 0
@@ -53,7 +54,7 @@ class Rectangle(GraphicItem):
     stroke_definition: StrokeDefinition = StrokeDefinition()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Circle(GraphicItem):
     """ The circle token defines a graphical circle in a symbol definition. """
 
@@ -62,7 +63,7 @@ class Circle(GraphicItem):
     stroke_definition: StrokeDefinition = StrokeDefinition()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Arc(GraphicItem):
     """ The arc token defines a graphical arc in a symbol definition. """
 
@@ -72,7 +73,7 @@ class Arc(GraphicItem):
     stroke_definition: StrokeDefinition = StrokeDefinition()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Text(GraphicItem):
     """The text token defines graphical text in a symbol definition."""
 
@@ -86,18 +87,22 @@ class Text(GraphicItem):
 ###        the classes for the different schema graphics elements           ###
 ###############################################################################
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SchemaElement(BaseElement):
     """Base element for the schematic items."""
 
     identifier: str = ''
     """The UNIQUE_IDENTIFIER defines the universally unique identifier for the pin."""
+    source: PARSED_T|None = field(default=None, init=False, repr=False, compare=False)
+    """The parsed text of the element, when loaded with spans. SexpWriter
+       with passthrough copies it when the element was not changed since
+       it was parsed. dataclasses.replace drops it."""
 
     def __post_init__(self):
         if self.identifier == '':
             self.identifier = str(uuid.uuid4())
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PositionalElement(SchemaElement):
     """ Positional element for the schema items """
 
@@ -107,7 +112,7 @@ class PositionalElement(SchemaElement):
     """The POSITION_IDENTIFIER defines the angle of rotation of the element in the sheet."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Pin():
     """
     The pin token defines a pin in a symbol definition.
@@ -185,7 +190,7 @@ class PinList():
         assert key in self.dict, f'key not in PinList: {key} {self.dict.keys()}'
         return self.dict[key]
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PinRef():
     number: str = ''
     identifier: str = ''
@@ -195,7 +200,7 @@ class PinRef():
         return f'{"  " * indent}(pin "{self.number}" (uuid {self.identifier}))'
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Property:
     """
     The property token defines a key value pair for storing user defined information.
@@ -215,8 +220,19 @@ class Property:
     text_effects: TextEffects|None = None
     """The TEXT_EFFECTS section defines how the text is displayed."""
 
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name == 'key':
+            global _property_keys
+            _property_keys += 1
 
-@dataclass(kw_only=True)
+
+_property_keys = 0
+"""Number of property keys set, the property indexes of the symbols are
+outdated when it changes."""
+
+
+@dataclass(kw_only=True, slots=True)
 class BusEntry(PositionalElement):
 
     """
@@ -231,7 +247,7 @@ class BusEntry(PositionalElement):
     stroke_definition: StrokeDefinition = StrokeDefinition()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Bus(SchemaElement):
     """
     The bus tokens define wires and buses in the schematic.
@@ -246,7 +262,7 @@ class Bus(SchemaElement):
     """The STROKE_DEFINITION defines how the wire or bus is drawn."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GlobalLabel(PositionalElement):
     """
     The global_label token defines a label name that is visible across all
@@ -270,7 +286,7 @@ class GlobalLabel(PositionalElement):
     Currently, the only supported property is the inter-sheet reference."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GraphicalLine(SchemaElement):
     """
     The polyline token defines one or more lines that may or may not represent
@@ -283,7 +299,7 @@ class GraphicalLine(SchemaElement):
     stroke_definition: StrokeDefinition = StrokeDefinition()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GraphicalText(PositionalElement):
     """
     The text token defines graphical text in a schematic.
@@ -343,7 +359,7 @@ class HierarchicalLabelShape(Enum):
             }
         return mappings[shape]
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HierarchicalLabel(PositionalElement):
     """
     The hierarchical_label section defines labels that are used by hierarchical
@@ -360,7 +376,7 @@ class HierarchicalLabel(PositionalElement):
     """The TEXT_EFFECTS section defines how the hierarchical label text is drawn."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HierarchicalSheetInstance(BaseElement):
     """ The symbol_instance token defines the per symbol information
         for the entire schematic. This section will only exist in
@@ -377,7 +393,7 @@ class HierarchicalSheetInstance(BaseElement):
     page: int = 0
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HierarchicalSheetPin(PositionalElement):
     """
     The pin token in a sheet object defines an electrical connection between
@@ -394,7 +410,7 @@ class HierarchicalSheetPin(PositionalElement):
     text_effects: TextEffects = TextEffects()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HierarchicalSheet(PositionalElement):
     """
     The sheet token defines a hierarchical sheet of the schematic.
@@ -416,7 +432,7 @@ class HierarchicalSheet(PositionalElement):
        have been automatically placed."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Image(SchemaElement):
     pts: List[Tuple[float, float]]
     scale: float = 0.0
@@ -429,7 +445,7 @@ class Image(SchemaElement):
 #        return Image('lskdfj', [(0, 0), (0, 0)], 1, '')
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Junction(PositionalElement):
     """
     The junction token defines a junction in the schematic. The junction
@@ -444,7 +460,7 @@ class Junction(PositionalElement):
     default junction color is used."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LibrarySymbol(SchemaElement):
     """
     The symbol token defines a symbol or sub-unit of a parent symbol.
@@ -505,7 +521,7 @@ class LibrarySymbol(SchemaElement):
                 _count.append(lib_unit)
         return len(_count)-1
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LocalLabel(PositionalElement):
     """
     The label token defines an wire or bus label name in a schematic.
@@ -517,7 +533,7 @@ class LocalLabel(PositionalElement):
     """The TEXT_EFFECTS section defines how the label text is drawn."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NoConnect(PositionalElement):
     """
     The no_connect token defines a unused pin connection in the schematic.
@@ -525,7 +541,7 @@ class NoConnect(PositionalElement):
     in the schematic.
     """
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Symbol(PositionalElement):
     """Symbol Object.
         The Symbol Object represents an instance of a LibrarySymbol.
@@ -539,7 +555,44 @@ class Symbol(PositionalElement):
     autoplaced: bool = False
     properties: List[Property] = field(default_factory=list)
     pins: List[PinRef] = field(default_factory=list)
-    library_symbol: LibrarySymbol|None = None
+    library_symbol: LibrarySymbol|None = field(default=None, metadata={'state': False})
+    """The library symbol, it is not written with the symbol."""
+    pin_table: Tuple[Tuple, List[Tuple[PinImpl, POS_T, POS_T]]]|None = field(
+        default=None, init=False, repr=False, compare=False)
+    """Cached pin positions in sheet coordinates, see transform.pin_positions."""
+    property_index: Tuple[List[Property], int, int, Dict[str, int]]|None = field(
+        default=None, init=False, repr=False, compare=False)
+    """Position of the properties by key, with the indexed list, its length
+    and the number of property keys set when it was built."""
+
+    def _property_position(self, name: str) -> int:
+        """
+        Get the position of the first property with the key.
+
+        The index is built again when the properties list was replaced
+        or its length changed, when a property key was set, which
+        includes creating a property, and when the found property has
+        another key. A key that is not in a valid index is not a key
+        of the properties.
+
+        :param name str: The Property Key.
+        :rtype int: The position or -1.
+        """
+        properties = self.properties
+        index = self.property_index
+        if (index is not None and index[0] is properties and
+                index[1] == len(properties) and index[2] == _property_keys):
+            pos = index[3].get(name, -1)
+            if pos < 0 or properties[pos].key == name:
+                return pos
+        return self._index_properties()[3].get(name, -1)
+
+    def _index_properties(self) -> Tuple[List[Property], int, int, Dict[str, int]]:
+        positions: Dict[str, int] = {}
+        for pos, prop in enumerate(self.properties):
+            positions.setdefault(prop.key, pos)
+        self.property_index = (self.properties, len(self.properties), _property_keys, positions)
+        return self.property_index
 
     def property(self, name: str) -> Property:
         """
@@ -549,10 +602,10 @@ class Symbol(PositionalElement):
         :rtype Property: The Property.
         :raises LookupError: When the property does not exist.
         """
-        for prop in self.properties:
-            if prop.key == name:
-                return prop
-        raise LookupError(f"property not found: {name}")
+        pos = self._property_position(name)
+        if pos < 0:
+            raise LookupError(f"property not found: {name}")
+        return self.properties[pos]
 
     def has_property(self, name: str) -> bool:
         """
@@ -561,10 +614,7 @@ class Symbol(PositionalElement):
         :param name str: The Property Key.
         :rtype bool: True if the Property exists.
         """
-        for prop in self.properties:
-            if prop.key == name:
-                return True
-        return False
+        return self._property_position(name) >= 0
 
     def reference(self):
         """Get the reference of the symbol with the unit as letter."""
@@ -593,8 +643,11 @@ class Symbol(PositionalElement):
         properties = []
         for prop in library_symbol.properties:
             if not prop.key.startswith('ki_'):
-                sym_property = deepcopy(prop)
-                if not sym_property.text_effects:
+                # the property and its text effects are changed per instance
+                sym_property = copy(prop)
+                if sym_property.text_effects:
+                    sym_property.text_effects = copy(sym_property.text_effects)
+                else:
                     sym_property.text_effects = TextEffects(hidden=False)
                 if prop.key == 'Reference':
                     sym_property.value = ref
@@ -611,7 +664,7 @@ class Symbol(PositionalElement):
                      pins=pins, library_symbol=library_symbol)
         return sym
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SymbolInstance(SchemaElement):
     """
     The symbol_instance token defines the per symbol information
@@ -632,7 +685,7 @@ class SymbolInstance(SchemaElement):
     footprint: str = ''
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Wire(SchemaElement):
     """
     The wire tokens define wires in the schematic. This section will not
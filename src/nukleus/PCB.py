@@ -2,28 +2,46 @@ from typing import Dict, List
 
 from .AbstractParser import AbstractParser
 from .ModelBase import BaseElement, TitleBlock
-from .ModelPcb import PcbLayer, TrackSegment, TrackVia, PcbGraphicalLine, PcbGeneral, PcbSetup, Net
+from .ModelPcb import Footprint, PcbLayer, TrackSegment, TrackVia, PcbGraphicalLine, PcbGeneral, PcbSetup, Net
+from .TrackStore import TrackStore
 
 
 class PCB(AbstractParser):
-    """PCB"""
-    def __init__(self, child: AbstractParser|None = None) -> None:
+    """
+    PCB
+
+    :param child AbstractParser|None: The next parser.
+    :param columnar bool: Store the track segments and vias in a
+                          TrackStore instead of the elements list.
+    """
+    def __init__(self, child: AbstractParser|None = None, columnar: bool = False) -> None:
         super().__init__(child)
         self.version: str = ""
         self.generator: str = ""
         self.uuid: str = ""
         self.paper: str = ""
-        self.title_block: TitleBlock = TitleBlock()
+        self.title_block: TitleBlock|None = None
         self.elements: List[BaseElement] = []
+        self.tracks: TrackStore|None = TrackStore() if columnar else None
+        """The track segments and vias when the columnar store is used."""
+        self._tracks_index = -1
 
-    def start(self, version: str, identifier: str, generator: str,
-              paper: str, title_block: TitleBlock):
+    def start(self, version: str, generator: str):
         self.version = version
-        self.uuid = identifier
         self.generator = generator
+        super().start(version, generator)
+
+    def visitIdentifier(self, identifier: str):
+        self.uuid = identifier
+        super().visitIdentifier(identifier)
+
+    def visitPaper(self, paper: str):
         self.paper = paper
+        super().visitPaper(paper)
+
+    def visitTitleBlock(self, title_block: TitleBlock):
         self.title_block = title_block
-        super().start(version, identifier, generator, paper, title_block)
+        super().visitTitleBlock(title_block)
 
     def visitPcbGeneral(self, general: PcbGeneral):
         """General Instance"""
@@ -35,6 +53,11 @@ class PCB(AbstractParser):
         self.elements.append(setup)
         super().visitPcbSetup(setup)
 
+    def visitFootprint(self, footprint: Footprint):
+        """Footprint Instance"""
+        self.elements.append(footprint)
+        super().visitFootprint(footprint)
+
     def startLayers(self):
         """Start Layers Instance"""
         super().startLayers()
@@ -50,14 +73,27 @@ class PCB(AbstractParser):
 
     def visitSegment(self, segment: TrackSegment):
         """Track Segment Instance"""
-        self.elements.append(segment)
+        if self.tracks is not None:
+            self._start_tracks()
+            self.tracks.append_segment(segment)
+        else:
+            self.elements.append(segment)
         super().visitSegment(segment)
 
     def visitVia(self, via: TrackVia):
         """Track via instance"""
-        self.elements.append(via)
+        if self.tracks is not None:
+            self._start_tracks()
+            self.tracks.append_via(via)
+        else:
+            self.elements.append(via)
         super().visitVia(via)
 
+    def _start_tracks(self):
+        # the tracks are produced at the position of the first track
+        if self._tracks_index == -1:
+            self._tracks_index = len(self.elements)
+
     def visitPcbGraphicalLine(self, graphical_line: PcbGraphicalLine):
         """PCB Graphical Line instance"""
         self.elements.append(graphical_line)
@@ -70,8 +106,15 @@ class PCB(AbstractParser):
 
     def produce(self, parser: AbstractParser):
         layers_started = False
-        parser.start(self.version, self.uuid, self.generator, self.paper, None)
-        for item in self.elements:
+        parser.start(self.version, self.generator)
+        if self.uuid:
+            parser.visitIdentifier(self.uuid)
+        parser.visitPaper(self.paper)
+        if self.title_block:
+            parser.visitTitleBlock(self.title_block)
+        for index, item in enumerate(self.elements):
+            if index == self._tracks_index:
+                self._produce_tracks(parser)
             if isinstance(item, PcbLayer):
                 if not layers_started:
                     parser.startLayers()
@@ -92,6 +135,20 @@ class PCB(AbstractParser):
                     parser.visitPcbGeneral(item)
                 elif isinstance(item, PcbSetup):
                     parser.visitPcbSetup(item)
+                elif isinstance(item, Net):
+                    parser.visitNet(item)
+                elif isinstance(item, Footprint):
+                    parser.visitFootprint(item)
                 else:
                     print(f'Uknown Element: {item}')
+        if self._tracks_index == len(self.elements):
+            self._produce_tracks(parser)
         parser.end()
+
+    def _produce_tracks(self, parser: AbstractParser):
+        assert self.tracks is not None, 'columnar store is not used'
+        for item in self.tracks:
+            if isinstance(item, TrackVia):
+                parser.visitVia(item)
+            else:
+                parser.visitSegment(item)
@@ -1,8 +1,8 @@
-from typing import Any, Dict, List, cast
+from typing import IO, Any, Dict, List, TypeVar, cast
 
 from .AbstractParser import AbstractParser
 from .ModelBase import (Justify, StrokeDefinition, TextEffects, TitleBlock,
-                        get_fill_type, rgb)
+                        get_fill_type, model_state, rgb)
 from .ModelPcb import *
 from .ModelSchema import (Arc, Bus, BusEntry, Circle, GlobalLabel,
                           GraphicalLine, GraphicalText, GraphicItem,
@@ -11,7 +11,10 @@ from .ModelSchema import (Arc, Bus, BusEntry, Circle, GlobalLabel,
                           HierarchicalSheetPin, Junction, LibrarySymbol,
                           LocalLabel, NoConnect, Pin, PinRef, Polyline,
                           Property, Rectangle, Symbol, SymbolInstance, Wire)
-from .SexpParser import SexpNode, SexpVisitor
+from .SexpParser import CHUNK_SIZE, SexpNode, SexpVisitor
+
+
+E = TypeVar('E')
 
 
 class ParserVisitor(SexpVisitor):
@@ -20,12 +23,28 @@ class ParserVisitor(SexpVisitor):
     def __init__(self, consumer: AbstractParser):
         self.libraries: Dict[str, LibrarySymbol] = {}
         self.consumer = consumer
+        self.spans = False
+        """The tree was loaded with spans, the elements get their source."""
 
         self.version = ''
         self.generator = ''
         self.paper = ''
         self.uuid = ''
 
+    def visit(self, sexp: SexpNode, level: int = 0, act_level: int = 0) -> None:
+        self.spans = hasattr(sexp, 'span')
+        super().visit(sexp, level, act_level)
+
+    def visit_stream(self, filep: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        self.spans = False
+        super().visit_stream(filep, chunk_size)
+
+    def _source(self, sexp: SexpNode, element: E) -> E:
+        """Set the parsed text and the state of a top level element."""
+        if self.spans:
+            element.source = (*sexp.span, model_state(element))  # type: ignore
+        return element
+
     @staticmethod
     def _rgb(sexp: SexpNode) -> rgb:
         return rgb(*[float(str(x)) for x in sexp['color'][0].values()[1:]])
@@ -313,52 +332,52 @@ class ParserVisitor(SexpVisitor):
             self.consumer.visitTitleBlock(TitleBlock(**values))
 
         elif name == 'bus':
-            self.consumer.visitBus(Bus(
+            self.consumer.visitBus(self._source(sexp, Bus(
                 identifier=sexp['uuid'][0].get(1, ''),
                 pts=sexp['pts'][0].pts(),
                 stroke_definition=ParserVisitor._get_stroke_definition(
-                    sexp['stroke'][0])))
+                    sexp['stroke'][0]))))
 
         elif name == 'bus_entry':
-            self.consumer.visitBusEntry(BusEntry(
+            self.consumer.visitBusEntry(self._source(sexp, BusEntry(
                 identifier=sexp['uuid'][0].get(1, ''),
                 pos=sexp['at'][0].pos(),
                 size=(sexp['size'][0].get(1, 0.0), sexp['size'][0].get(2, 0.0)),
                 stroke_definition=ParserVisitor._get_stroke_definition(
-                    sexp['stroke'][0])))
+                    sexp['stroke'][0]))))
 
         elif name == 'wire':
-            self.consumer.visitWire(Wire(
+            self.consumer.visitWire(self._source(sexp, Wire(
                 identifier=sexp['uuid'][0].get(1, ''),
                 pts=sexp['pts'][0].pts(),
                 stroke_definition=ParserVisitor._get_stroke_definition(
-                    sexp['stroke'][0])))
+                    sexp['stroke'][0]))))
 
         elif name == 'junction':
-            self.consumer.visitJunction(Junction(
+            self.consumer.visitJunction(self._source(sexp, Junction(
                 pos=sexp['at'][0].pos(),
                 angle=0,
                 identifier=sexp['uuid'][0].get(1, ''),
                 diameter=sexp['diameter'][0].get(1, 0.0),
-                color=ParserVisitor._rgb(sexp)))
+                color=ParserVisitor._rgb(sexp))))
 
         elif name == 'no_connect':
-            self.consumer.visitNoConnect(NoConnect(
+            self.consumer.visitNoConnect(self._source(sexp, NoConnect(
                 pos=sexp['at'][0].pos(),
                 angle=0,
-                identifier=sexp['uuid'][0].get(1, '')))
+                identifier=sexp['uuid'][0].get(1, ''))))
 
         elif name == 'label':
-            self.consumer.visitLocalLabel(LocalLabel(
+            self.consumer.visitLocalLabel(self._source(sexp, LocalLabel(
                 pos=sexp['at'][0].pos(),
                 angle=sexp['at'][0].get(3, 0.0),
                 identifier=sexp['uuid'][0].get(1, ''),
                 text=sexp.get(1, ''),
                 text_effects=self._get_text_effects(
-                    sexp['effects'][0])))
+                    sexp['effects'][0]))))
 
         elif name == 'hierarchical_label':
-            self.consumer.visitHierarchicalLabel(HierarchicalLabel(
+            self.consumer.visitHierarchicalLabel(self._source(sexp, HierarchicalLabel(
                 pos=sexp['at'][0].pos(),
                 angle=sexp['at'][0].get(3, 0.0),
                 identifier=sexp['uuid'][0].get(1, ''),
@@ -366,10 +385,10 @@ class ParserVisitor(SexpVisitor):
                 shape=HierarchicalLabelShape.shape(
                     sexp['shape'][0].get(1, '')),
                 text_effects=self._get_text_effects(
-                    sexp['effects'][0])))
+                    sexp['effects'][0]))))
 
         elif name == 'global_label':
-            self.consumer.visitGlobalLabel(GlobalLabel(
+            self.consumer.visitGlobalLabel(self._source(sexp, GlobalLabel(
                 pos=sexp['at'][0].pos(),
                 # [0][3][0])) if len(sexp['at'][0]) > 3 else 0,
                 angle=sexp['at'][0].get(3, 0.0),
@@ -379,30 +398,30 @@ class ParserVisitor(SexpVisitor):
                 autoplaced='fields_autoplaced' in sexp,
                 properties=[ParserVisitor._get_property(x)
                             for x in sexp['property']],
-                text_effects=self._get_text_effects(sexp['effects'][0])))
+                text_effects=self._get_text_effects(sexp['effects'][0]))))
 
         elif name == 'polyline':
-            self.consumer.visitGraphicalLine(GraphicalLine(
+            self.consumer.visitGraphicalLine(self._source(sexp, GraphicalLine(
                 identifier=sexp['uuid'][0].get(1, ''),
                 pts=sexp['pts'][0].pts(),
                 stroke_definition=ParserVisitor._get_stroke_definition(
-                    sexp['stroke'][0])))
+                    sexp['stroke'][0]))))
 
         elif name == 'text':
-            self.consumer.visitGraphicalText(GraphicalText(
+            self.consumer.visitGraphicalText(self._source(sexp, GraphicalText(
                 pos=sexp['at'][0].pos(),
                 angle=sexp['at'][0].get(3, 0.0),
                 identifier=sexp['uuid'][0].get(1, ''),
                 text=sexp.get(1, ''),
                 text_effects=self._get_text_effects(
-                    sexp['effects'][0])))
+                    sexp['effects'][0]))))
 
         elif name == 'symbol':
             pins_ref = [PinRef(number=x.get(1, ''), identifier=x['uuid'][0].get(
                 1, '')) for x in sexp['pin']]
             properties = [ParserVisitor._get_property(cast(SexpNode, prop))
                           for prop in sexp['property']]
-            self.consumer.visitSymbol(Symbol(
+            self.consumer.visitSymbol(self._source(sexp, Symbol(
                 pos=sexp['at'][0].pos(),
                 angle=sexp['at'][0].get(3, 0.0),
                 identifier=sexp['uuid'][0].get(1, ''),
@@ -419,7 +438,7 @@ class ParserVisitor(SexpVisitor):
                 autoplaced='fields_autoplaced' in sexp,
                 properties=properties,
                 pins=pins_ref,
-                library_symbol=self.libraries[str(sexp['lib_id'][0].get(1, ''))]))
+                library_symbol=self.libraries[str(sexp['lib_id'][0].get(1, ''))])))
 
         elif name == 'lib_symbols':
             self.consumer.startLibrarySymbols()
@@ -443,7 +462,7 @@ class ParserVisitor(SexpVisitor):
             properties = [ParserVisitor._get_property(
                 cast(SexpNode, prop)) for prop in sexp['property']]
 
-            self.consumer.visitHierarchicalSheet(HierarchicalSheet(
+            self.consumer.visitHierarchicalSheet(self._source(sexp, HierarchicalSheet(
                 pos=sexp['at'][0].pos(),
                 angle=sexp['at'][0].get(3, 0.0),
                 identifier=sexp['uuid'][0].get(1, ''),
@@ -452,7 +471,7 @@ class ParserVisitor(SexpVisitor):
                 stroke_definition=ParserVisitor._get_stroke_definition(
                     sexp['stroke'][0]),
                 fill=ParserVisitor._rgb(sexp['fill'][0]),
-                pins=pins, properties=properties))
+                pins=pins, properties=properties)))
 
         elif name == 'sheet_instances':
             self.consumer.startSheetInstances()
@@ -544,7 +563,7 @@ class ParserVisitor(SexpVisitor):
             #            ZONES: str = ''
             #            GROUPS: str = ''
             #            MODEL: str = ''
-            self.consumer.visitFootprint(Footprint())
+            self.consumer.visitFootprint(self._source(sexp, Footprint()))
 
         elif name == 'layers':
             self.consumer.startLayers()
@@ -559,7 +578,7 @@ class ParserVisitor(SexpVisitor):
             self.consumer.endLayers()
 
         elif name == 'segment':
-            self.consumer.visitSegment(TrackSegment(
+            self.consumer.visitSegment(self._source(sexp, TrackSegment(
                 start=(sexp['start'][0].get(1, 0.0),
                        sexp['start'][0].get(2, 0.0)),
                 end=(sexp['end'][0].get(1, 0.0), sexp['end'][0].get(2, 0.0)),
@@ -568,10 +587,10 @@ class ParserVisitor(SexpVisitor):
                 net=sexp['net'][0].get(1, 0),
                 tstamp=sexp['tstamp'][0].get(1, ''),
                 locked='locked' in sexp.values()
-            ))
+            )))
 
         elif name == 'via':
-            self.consumer.visitVia(TrackVia(
+            self.consumer.visitVia(self._source(sexp, TrackVia(
                 at=sexp['at'][0].pos(),
                 size=sexp['size'][0].get(1, 0.0),
                 drill=sexp['drill'][0].get(1, 0.0),
@@ -582,16 +601,16 @@ class ParserVisitor(SexpVisitor):
                 remove_unused_layers='remove_unused_layers' in sexp.values(),
                 keep_end_layers='keep_end_layers' in sexp.values(),
                 free='free' in sexp.values(),
-            ))
+            )))
 
         elif name == 'net':
-            self.consumer.visitNet(Net(
+            self.consumer.visitNet(self._source(sexp, Net(
                 ordinal=int(sexp.values()[1]),
                 netname=sexp.values()[2]
-            ))
+            )))
 
         elif name == 'gr_line':
-            self.consumer.visitPcbGraphicalLine(PcbGraphicalLine(
+            self.consumer.visitPcbGraphicalLine(self._source(sexp, PcbGraphicalLine(
                 start=(sexp['start'][0].get(1, 0.0),
                        sexp['start'][0].get(2, 0.0)),
                 end=(sexp['end'][0].get(1, 0.0), sexp['end'][0].get(2, 0.0)),
@@ -600,7 +619,7 @@ class ParserVisitor(SexpVisitor):
                 width=sexp['width'][0].get(1, 0.0),
                 layer=sexp['layer'][0].get(1, ''),
                 tstamp=sexp['tstamp'][0].get(1, ''),
-            ))
+            )))
 
         else:
             raise ValueError(f'unknown element in sexp: {name}:{sexp}')
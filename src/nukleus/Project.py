@@ -0,0 +1,313 @@
+from __future__ import annotations
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+
+from .AbstractNetlist import AbstractNetlist, DisjointSet, Net
+from .ModelSchema import (GlobalLabel, HierarchicalLabel, HierarchicalSheet,
+                          Symbol)
+from .ParserVisitor import ParserVisitor
+from .Schema import Schema
+from .transform import pin_positions
+
+SHEET_NAME = ('Sheet name', 'Sheetname')
+"""Property keys of the sheet name, KiCad 6 and KiCad 7."""
+
+SHEET_FILE = ('Sheet file', 'Sheetfile')
+"""Property keys of the sheet file, KiCad 6 and KiCad 7."""
+
+
+class RecursiveSheet(Exception):
+    """A sheet contains itself."""
+
+
+def _parse_sheet(filename: str) -> Schema:
+    """
+    Parse a schema file.
+
+    This runs in the worker processes of Project.
+
+    :param filename str: The schema filename.
+    :rtype Schema: The parsed schema.
+    """
+    schema = Schema()
+    with open(filename, 'r', encoding='utf-8') as file:
+        ParserVisitor(schema).visit_stream(file)
+    return schema
+
+
+def _sheet_property(sheet: HierarchicalSheet, keys: Tuple[str, ...]) -> str:
+    for prop in sheet.properties:
+        if prop.key in keys:
+            return prop.value
+    return ''
+
+
+def _is_power(symbol: Symbol) -> bool:
+    return (symbol.library_identifier.startswith('power:') or
+            (symbol.library_symbol is not None and symbol.library_symbol.extends == 'power'))
+
+
+def _sheets(schema: Schema) -> List[HierarchicalSheet]:
+    return [x for x in schema.elements if isinstance(x, HierarchicalSheet)]
+
+
+@dataclass(kw_only=True, slots=True)
+class SheetInstance:
+    """One use of a schema file in the sheet tree."""
+
+    path: str = '/'
+    """The uuid path of the instance, '/' for the root sheet."""
+    name: str = '/'
+    """The sheet names of the path like '/pic_sockets/'."""
+    filename: str = ''
+    """The absolute filename of the schema file."""
+    sheet: HierarchicalSheet|None = None
+    """The sheet in the parent schema, None for the root sheet."""
+    parent: str|None = None
+    """The path of the parent instance, None for the root sheet."""
+
+    def symbol_path(self, symbol: Symbol) -> str:
+        """
+        Get the path of a symbol in this instance.
+
+        :param symbol Symbol: A symbol of the instance schema.
+        :rtype str: The path as used in the symbol instances.
+        """
+        return f'{self.path.rstrip("/")}/{symbol.identifier}'
+
+
+class _SheetNetlist(AbstractNetlist):
+    """Netlist of one schema file with the hierarchical labels and sheet pins as points."""
+
+    def visitHierarchicalLabel(self, hierarchical_label: HierarchicalLabel):
+        self.add_points(hierarchical_label, [hierarchical_label.pos])
+        super().visitHierarchicalLabel(hierarchical_label)
+
+    def visitHierarchicalSheet(self, hierarchical_sheet: HierarchicalSheet):
+        self.add_points(hierarchical_sheet, [x.pos for x in hierarchical_sheet.pins])
+        super().visitHierarchicalSheet(hierarchical_sheet)
+
+
+class Project:
+    """
+    Hierarchical schematic project.
+
+    The sheet tree is followed from the root schema. Every schema file
+    is parsed once, also when it is used by several sheets. The child
+    sheets are parsed in parallel in a process pool.
+
+    :param filename str: The root schema file.
+    :param max_workers int|None: Maximum number of worker processes,
+                                 the number of processors when None.
+    :raises RecursiveSheet: When a sheet contains itself.
+    """
+
+    def __init__(self, filename: str, max_workers: int|None = None):
+        self.filename = os.path.abspath(filename)
+        self.schemas: Dict[str, Schema] = {}
+        """Parsed schema by absolute filename."""
+        self.instances: List[SheetInstance] = []
+        """The sheet instances, parents before their children."""
+        self._load(max_workers)
+        self._instance(SheetInstance(filename=self.filename), [])
+        self._references = {x.path: x.reference for x in self.root.symbol_instance}
+
+    @property
+    def root(self) -> Schema:
+        """The root schema."""
+        return self.schemas[self.filename]
+
+    def _children(self, filename: str) -> List[Tuple[HierarchicalSheet, str]]:
+        directory = os.path.dirname(filename)
+        return [(sheet, os.path.abspath(os.path.join(
+                    directory, _sheet_property(sheet, SHEET_FILE))))
+                for sheet in _sheets(self.schemas[filename])]
+
+    def _load(self, max_workers: int|None):
+        self.schemas[self.filename] = _parse_sheet(self.filename)
+        todo = [x for _, x in self._children(self.filename)]
+        todo = [x for x in dict.fromkeys(todo) if x not in self.schemas]
+        workers = min(len(todo), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            while todo:
+                filename = todo.pop(0)
+                if filename not in self.schemas:
+                    self.schemas[filename] = _parse_sheet(filename)
+                    todo.extend(x for _, x in self._children(filename))
+            return
+
+        # submit the children of a sheet as soon as it is parsed
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            submitted: Set[str] = set(self.schemas)
+            futures = {}
+            while todo or futures:
+                for filename in todo:
+                    if filename not in submitted:
+                        submitted.add(filename)
+                        futures[executor.submit(_parse_sheet, filename)] = filename
+                todo = []
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    filename = futures.pop(future)
+                    self.schemas[filename] = future.result()
+                    todo.extend(x for _, x in self._children(filename))
+
+    def _instance(self, instance: SheetInstance, ancestors: List[str]):
+        if instance.filename in ancestors:
+            raise RecursiveSheet('sheet contains itself', instance.filename)
+        self.instances.append(instance)
+        for sheet, filename in self._children(instance.filename):
+            self._instance(SheetInstance(
+                path=f'{instance.path.rstrip("/")}/{sheet.identifier}',
+                name=f'{instance.name}{_sheet_property(sheet, SHEET_NAME)}/',
+                filename=filename, sheet=sheet, parent=instance.path),
+                ancestors + [instance.filename])
+
+    def reference(self, instance: SheetInstance, symbol: Symbol) -> str:
+        """
+        Get the reference of a symbol in a sheet instance.
+
+        The reference is taken from the symbol instances of the root schema,
+        the reference property is used when the symbol has no instance.
+
+        :param instance SheetInstance: The sheet instance.
+        :param symbol Symbol: A symbol of the instance schema.
+        :rtype str: The reference.
+        """
+        return self._references.get(instance.symbol_path(symbol),
+                                    symbol.property('Reference').value)
+
+    def netlist(self) -> FlatNetlist:
+        """
+        Create the flat netlist of all sheet instances.
+
+        :rtype FlatNetlist: The netlist.
+        """
+        return FlatNetlist(self)
+
+
+class FlatNetlist:
+    """
+    Flat netlist of a hierarchical project.
+
+    Every schema file is netlisted once. The nets of the sheet instances
+    are joined by the sheet pins and the hierarchical labels of the child
+    sheets, and by the global labels and power symbols of all sheets.
+    Global names win over local names, and local names of the upper
+    sheets over the lower sheets. Local names of child sheets are
+    prefixed with the sheet path like '/pic_sockets/CLOCK'.
+
+    :param project Project: The loaded project.
+    """
+
+    def __init__(self, project: Project):
+        self.pin_nets: Dict[str, str] = {}
+        """Net identifier by pin key `reference:pin number`."""
+        self.nets: Dict[str, List[str]] = {}
+        """Pin keys by net identifier, without the not connected nets."""
+        self.references: Dict[str, List[Symbol]] = {}
+        """Symbols by instance reference."""
+        self._build(project)
+
+    def _build(self, project: Project):
+        sheets: Dict[str, _SheetNetlist] = {}
+        indexes: Dict[str, Dict[int, int]] = {}
+        for filename, schema in project.schemas.items():
+            netlist = _SheetNetlist()
+            schema.produce(netlist)
+            sheets[filename] = netlist
+            indexes[filename] = {}
+            for net in netlist.nets.values():
+                indexes[filename].setdefault(id(net), len(indexes[filename]))
+
+        nets = DisjointSet()
+        def key(instance: SheetInstance, net: Net) -> int:
+            return nets.add((instance.path, indexes[instance.filename][id(net)]))
+
+        by_path = {x.path: x for x in project.instances}
+        names: Dict[int, Tuple[int, int, int, str]] = {}
+        order = 0
+        globals_: Dict[str, int] = {}
+        for depth, instance in ((x.name.count('/') - 1, x) for x in project.instances):
+            netlist = sheets[instance.filename]
+            schema = project.schemas[instance.filename]
+            seen: Set[int] = set()
+            for net in netlist.nets.values():
+                if id(net) in seen:
+                    continue
+                seen.add(id(net))
+                _id = key(instance, net)
+                if net.identifier != 'NC' and not netlist.is_numbered(net):
+                    name = net.identifier if depth == 0 else f'{instance.name}{net.identifier}'
+                    names[_id] = min(names.get(_id, (2, 0, 0, '')), (1, depth, order, name))
+                    order += 1
+
+            # global labels and power symbols join the nets of all sheets
+            for element in schema.elements:
+                points: List[Tuple[Tuple[float, float], str]] = []
+                if isinstance(element, GlobalLabel):
+                    points.append((element.pos, element.text))
+                elif isinstance(element, Symbol) and _is_power(element):
+                    points.extend((pos, element.property('Value').value)
+                                  for _, pos, _ in pin_positions(element))
+                for pos, name in points:
+                    _id = key(instance, netlist.nets[pos])
+                    names[_id] = min(names.get(_id, (2, 0, 0, '')), (0, 0, order, name))
+                    order += 1
+                    if name in globals_:
+                        nets.union(globals_[name], _id)
+                    else:
+                        globals_[name] = _id
+
+            # the sheet pins join the hierarchical labels of the child sheet
+            if instance.sheet and instance.parent is not None:
+                parent = by_path[instance.parent]
+                parent_netlist = sheets[parent.filename]
+                labels: Dict[str, List[HierarchicalLabel]] = {}
+                for element in schema.elements:
+                    if isinstance(element, HierarchicalLabel):
+                        labels.setdefault(element.text, []).append(element)
+                for pin in instance.sheet.pins:
+                    for label in labels.get(pin.name, []):
+                        nets.union(key(parent, parent_netlist.nets[pin.pos]),
+                                   key(instance, netlist.nets[label.pos]))
+
+        # name the joined nets
+        identifiers: Dict[int, str] = {}
+        for _id in range(len(nets.parent)):
+            root = nets.find(_id)
+            if _id in names and (root not in names or names[_id] < names[root]):
+                names[root] = names[_id]
+        number = 1
+        for instance in project.instances:
+            netlist = sheets[instance.filename]
+            for net in netlist.nets.values():
+                root = nets.find(key(instance, net))
+                if root in identifiers:
+                    continue
+                if root in names:
+                    identifiers[root] = names[root][3]
+                elif net.identifier == 'NC':
+                    identifiers[root] = 'NC'
+                else:
+                    identifiers[root] = str(number)
+                    number += 1
+
+        for instance in project.instances:
+            netlist = sheets[instance.filename]
+            for symbol in project.schemas[instance.filename].elements:
+                if not isinstance(symbol, Symbol):
+                    continue
+                reference = project.reference(instance, symbol)
+                self.references.setdefault(reference, []).append(symbol)
+                for pin, pos, _ in pin_positions(symbol):
+                    identifier = identifiers[nets.find(key(instance, netlist.nets[pos]))]
+                    pin_key = f'{reference}:{pin.number[0]}'
+                    if self.pin_nets.get(pin_key) == identifier:
+                        # power pins that are repeated in every unit
+                        continue
+                    self.pin_nets[pin_key] = identifier
+                    if identifier != 'NC':
+                        self.nets.setdefault(identifier, []).append(pin_key)
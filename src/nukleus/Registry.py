@@ -1,3 +1,4 @@
+import os
 from typing import List, Type
 
 from nukleus.AbstractPlot import AbstractPlot
@@ -8,6 +9,10 @@ class Registry():
     spice_path: List[str] = []
     library_path: List[str] = []
     PLOTTER: Type[AbstractPlot] = PlotSvgWrite
+    cache_path: str|None = os.environ.get('NUKLEUS_CACHE') or None
+    """Directory for the library and result caches, None disables the caches.
+    The caches are disabled unless the NUKLEUS_CACHE environment variable
+    or set_cache_path sets a directory."""
 
     _instance = None
     def __new__(cls, *args, **kwargs):
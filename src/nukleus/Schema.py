@@ -1,6 +1,7 @@
-from typing import List, cast
+from typing import Dict, List, Tuple, Type, TypeVar, cast
 import uuid
 
+from .AbstractNetlist import AbstractNetlist
 from .AbstractParser import AbstractParser
 from .ModelBase import TitleBlock
 from .ModelSchema import (Bus, BusEntry, GlobalLabel, GraphicalLine,
@@ -10,6 +11,48 @@ from .ModelSchema import (Bus, BusEntry, GlobalLabel, GraphicalLine,
                     SymbolInstance, Wire)
 from .Library import Library
 
+E = TypeVar('E', bound=SchemaElement)
+
+class _ElementIndex:
+    """The elements of a schema by type, reference, library identifier and uuid."""
+
+    def __init__(self) -> None:
+        self.types: Dict[type, List[SchemaElement]] = {}
+        """The elements by their class."""
+        self.references: Dict[str, List[Symbol]] = {}
+        """The symbols by the value of the Reference property."""
+        self.libraries: Dict[str, List[Symbol]] = {}
+        """The symbols by library identifier, like 'Device:R'."""
+        self.uuids: Dict[str, List[SchemaElement]] = {}
+        """The elements by identifier."""
+
+    def add(self, element: SchemaElement):
+        self.types.setdefault(type(element), []).append(element)
+        self.uuids.setdefault(element.identifier, []).append(element)
+        if isinstance(element, Symbol):
+            self.libraries.setdefault(element.library_identifier, []).append(element)
+            if element.has_property('Reference'):
+                self.references.setdefault(
+                    element.property('Reference').value, []).append(element)
+
+    def remove(self, element: SchemaElement):
+        _discard(self.types, type(element), element)
+        _discard(self.uuids, element.identifier, element)
+        if isinstance(element, Symbol):
+            _discard(self.libraries, element.library_identifier, element)
+            if element.has_property('Reference'):
+                _discard(self.references, element.property('Reference').value, element)
+
+
+def _discard(index: Dict, key, element: SchemaElement):
+    """Remove an element by identity and drop the key when it was the last."""
+    elements = [x for x in index.get(key, []) if x is not element]
+    if elements:
+        index[key] = elements
+    else:
+        index.pop(key, None)
+
+
 class Schema(AbstractParser):
     """Kicad schema implementation."""
 
@@ -27,23 +70,87 @@ class Schema(AbstractParser):
         self.libraries: List[LibrarySymbol] = []
         self.sheet_instance: List[HierarchicalSheetInstance] = []
         self.symbol_instance: List[SymbolInstance] = []
+        self.netlist: AbstractNetlist|None = None
+        """Netlist that is updated when elements are appended or removed."""
+        self._index = _ElementIndex()
+        self._indexed: Tuple[List[SchemaElement], int] = (self.elements, 0)
+
+    def _element_index(self) -> _ElementIndex:
+        """
+        Get the element indexes.
+
+        The indexes follow append, remove and the visited elements. They
+        are built again when the elements list was replaced or changed
+        directly. Changing the reference, library identifier or uuid of
+        an element in the schema is not detected.
+
+        :rtype _ElementIndex: The indexes.
+        """
+        if self._indexed[0] is not self.elements or self._indexed[1] != len(self.elements):
+            self._index = _ElementIndex()
+            for element in self.elements:
+                self._index.add(element)
+            self._indexed = (self.elements, len(self.elements))
+        return self._index
+
+    def _add(self, element: SchemaElement):
+        """Append an element and update the indexes."""
+        self.elements.append(element)
+        if self._indexed[0] is self.elements and self._indexed[1] == len(self.elements) - 1:
+            self._indexed = (self.elements, len(self.elements))
+            self._index.add(element)
 
     def __contains__(self, name) -> bool:
-        for symbol in self.elements:
-            if isinstance(symbol, Symbol):
-                if(symbol.has_property("Reference") and
-                   symbol.property('Reference').value == name):
-                    return True
-        return False
+        return isinstance(name, str) and name in self._element_index().references
 
     def __getattr__(self, name) -> List[Symbol] | Symbol:
-        syms: List[Symbol] = []
-        for symbol in self.elements:
-            if isinstance(symbol, Symbol):
-                if(symbol.has_property("Reference") and
-                   symbol.property('Reference').value == name):
-                    syms.append(symbol)
-        return syms
+        if name.startswith('__'):
+            # keep the protocols like pickle working
+            raise AttributeError(name)
+        return list(self._element_index().references.get(name, []))
+
+    def find(self, type: Type[E]|None = None, lib: str|None = None,
+             reference: str|None = None, identifier: str|None = None) -> List[E]:
+        """
+        Find the elements that match all the given criteria.
+
+        The query is answered from the indexes, the elements are
+        returned in schema order.
+
+        :param type Type[E]|None: Element class, subclasses match too.
+        :param lib str|None: Library identifier of symbols, like 'Device:R'.
+        :param reference str|None: Reference of symbols, like 'R1'.
+        :param identifier str|None: The uuid of the element.
+        :rtype List[E]: The matching elements.
+        """
+        index = self._element_index()
+        candidates: List[List[SchemaElement]] = []
+        if lib is not None:
+            candidates.append(index.libraries.get(lib, []))
+        if reference is not None:
+            candidates.append(index.references.get(reference, []))
+        if identifier is not None:
+            candidates.append(index.uuids.get(identifier, []))
+        if type is not None:
+            classes = [x for x in index.types if issubclass(x, type)]
+            if len(classes) <= 1:
+                candidates.append(index.types[classes[0]] if classes else [])
+            elif not candidates:
+                candidates.append([x for x in self.elements if isinstance(x, type)])
+        if not candidates:
+            return cast(List[E], list(self.elements))
+        smallest = min(candidates, key=len)
+        result = []
+        for element in smallest:
+            if((type is None or isinstance(element, type)) and
+               (lib is None or (isinstance(element, Symbol) and
+                                element.library_identifier == lib)) and
+               (identifier is None or element.identifier == identifier) and
+               (reference is None or (isinstance(element, Symbol) and
+                                      element.has_property('Reference') and
+                                      element.property('Reference').value == reference))):
+                result.append(element)
+        return cast(List[E], result)
 
     def append(self, element: SchemaElement):
         """
@@ -56,9 +163,34 @@ class Schema(AbstractParser):
             self.libraries.append(element)
         elif isinstance(element, Symbol):
             self.symbol_instance.append(SymbolInstance(path=f'/{element.identifier}', reference=element.reference(), unit=element.unit, value=element.property('Value').value))
-            self.elements.append(element)
+            self._add(element)
+        else:
+            self._add(element)
+        if self.netlist:
+            self.netlist.add(element)
+
+    def remove(self, element: SchemaElement):
+        """
+        Remove an element from the schema.
+
+        :param element: Element to remove.
+        :type element: SchemaElement
+        :raises ValueError: When the element is not in the schema.
+        """
+        for index, item in enumerate(self.elements):
+            if item is element:
+                del self.elements[index]
+                if self._indexed[0] is self.elements and self._indexed[1] == len(self.elements) + 1:
+                    self._indexed = (self.elements, len(self.elements))
+                    self._index.remove(element)
+                break
         else:
-            self.elements.append(element)
+            raise ValueError(f'element not in schema: {element}')
+        if isinstance(element, Symbol):
+            self.symbol_instance = [x for x in self.symbol_instance
+                                    if x.path != f'/{element.identifier}']
+        if self.netlist:
+            self.netlist.remove(element)
 
     def start(self, version: str, generator: str):
         self.version = version
@@ -81,43 +213,43 @@ class Schema(AbstractParser):
         super().visitTitleBlock(title_block)
 
     def visitWire(self, wire: Wire):
-        self.elements.append(wire)
+        self._add(wire)
         super().visitWire(wire)
 
     def visitJunction(self, junction: Junction):
-        self.elements.append(junction)
+        self._add(junction)
         super().visitJunction(junction)
 
     def visitNoConnect(self, no_connect: NoConnect):
-        self.elements.append(no_connect)
+        self._add(no_connect)
         super().visitNoConnect(no_connect)
 
     def visitLocalLabel(self, local_label: LocalLabel):
-        self.elements.append(local_label)
+        self._add(local_label)
         super().visitLocalLabel(local_label)
 
     def visitGlobalLabel(self, global_label: GlobalLabel):
-        self.elements.append(global_label)
+        self._add(global_label)
         super().visitGlobalLabel(global_label)
 
     def visitGraphicalLine(self, graphical_line: GraphicalLine):
-        self.elements.append(graphical_line)
+        self._add(graphical_line)
         super().visitGraphicalLine(graphical_line)
 
     def visitGraphicalText(self, graphical_text: GraphicalText):
-        self.elements.append(graphical_text)
+        self._add(graphical_text)
         super().visitGraphicalText(graphical_text)
 
     def visitHierarchicalSheet(self, hierarchical_sheet: HierarchicalSheet):
-        self.elements.append(hierarchical_sheet)
+        self._add(hierarchical_sheet)
         super().visitHierarchicalSheet(hierarchical_sheet)
 
     def visitHierarchicalLabel(self, hierarchical_label: HierarchicalLabel):
-        self.elements.append(hierarchical_label)
+        self._add(hierarchical_label)
         super().visitHierarchicalLabel(hierarchical_label)
 
     def visitSymbol(self, symbol: Symbol):
-        self.elements.append(symbol)
+        self._add(symbol)
         super().visitSymbol(symbol)
 
     def visitLibrarySymbol(self, symbol: LibrarySymbol):
@@ -133,11 +265,11 @@ class Schema(AbstractParser):
         super().visitSymbolInstance(symbol)
 
     def visitBus(self, bus: Bus):
-        self.elements.append(bus)
+        self._add(bus)
         super().visitBus(bus)
 
     def visitBusEntry(self, bus_entry: BusEntry):
-        self.elements.append(bus_entry)
+        self._add(bus_entry)
         super().visitBusEntry(bus_entry)
 
     def produce(self, parser: AbstractParser):
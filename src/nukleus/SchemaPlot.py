@@ -18,7 +18,7 @@ from .ModelSchema import (Arc, Circle, GlobalLabel, Junction, LibrarySymbol,
                           LocalLabel, NoConnect, Pin, Polyline, Property,
                           Rectangle, SchemaElement, Symbol, Wire, isUnit)
 from .Theme import themes
-from .transform import transform
+from .transform import pin_positions, transform, transform_batch, totuple
 from .Typing import POS_T, PTS_T
 
 MIRROR = {
@@ -159,8 +159,48 @@ class SchemaPlot(AbstractParser):
 
         return pts
 
-    def _drawPolyline(self, plotter, symbol: Symbol, polyline: Polyline) -> None:
-        pts = transform(symbol, np.array(polyline.points))
+    @staticmethod
+    def _unit_points(symbol: Symbol, units: List[LibrarySymbol]) -> Dict[int, Any]:
+        """
+        Transform the points of the unit graphics and pin texts in one pass.
+
+        :param symbol Symbol: The symbol.
+        :param units List[LibrarySymbol]: The units to draw.
+        :rtype Dict[int, Any]: The points by id of the graphic or pin.
+        """
+        keys: List[int] = []
+        counts: List[int] = []
+        points: List[Any] = []
+        for unit in units:
+            for draw in unit.graphics:
+                if isinstance(draw, Polyline) and len(draw.points):
+                    keys.append(id(draw))
+                    counts.append(len(draw.points))
+                    points.extend(draw.points)
+                elif isinstance(draw, Rectangle):
+                    keys.append(id(draw))
+                    counts.append(2)
+                    points.extend(((draw.start_x, draw.start_y), (draw.end_x, draw.end_y)))
+            for pin in unit.pins:
+                keys.append(id(pin))
+                counts.append(2)
+                for length in (pin.length / 3, pin.length + 1):
+                    points.append((pin.pos[0] + (np.cos(math.radians(pin.angle)) * length),
+                                   pin.pos[1] + (np.sin(math.radians(pin.angle)) * length)))
+        if not points:
+            return {}
+        verts = transform_batch([symbol.pos], [symbol.angle], [symbol.mirror], points,
+                                np.zeros(len(points), dtype=int))
+        result: Dict[int, Any] = {}
+        start = 0
+        for key, count in zip(keys, counts):
+            result[key] = totuple(verts[start:start+count])
+            start += count
+        return result
+
+    def _drawPolyline(self, plotter, symbol: Symbol, polyline: Polyline, pts=None) -> None:
+        if pts is None:
+            pts = transform(symbol, np.array(polyline.points))
         theme = cast(StrokeDefinition, self.theme['component_outline'])
         stroke = _merge_stroke(polyline.stroke_definition, theme)
         plotter.polyline(
@@ -168,9 +208,10 @@ class SchemaPlot(AbstractParser):
             stroke['width']*self.scale,
             stroke['color'])
 
-    def _drawRectangle(self, plotter, symbol: Symbol, rectangle: Rectangle) -> None:
-        pts = transform(symbol, ((rectangle.start_x, rectangle.start_y),
-                                 (rectangle.end_x, rectangle.end_y)))
+    def _drawRectangle(self, plotter, symbol: Symbol, rectangle: Rectangle, pts=None) -> None:
+        if pts is None:
+            pts = transform(symbol, ((rectangle.start_x, rectangle.start_y),
+                                     (rectangle.end_x, rectangle.end_y)))
         theme = cast(StrokeDefinition, self.theme['component_outline'])
         stroke = _merge_stroke(rectangle.stroke_definition, theme)
         plotter.rectangle(
@@ -185,18 +226,27 @@ class SchemaPlot(AbstractParser):
                        circle.stroke_definition.width*self.scale,
                        circle.stroke_definition.color)
 
-    def _drawPin(self, plotter, symbol: Symbol, pin: Pin) -> None:
+    def _drawPin(self, plotter, symbol: Symbol, pin: Pin,
+                 pin_lines: Dict[str, Any] | None = None, pts=None) -> None:
         pin_pos = np.array(pin.pos)
-        pin_line = transform(symbol,
-                             (pin_pos, (pin_pos[0] + (np.cos(math.radians(pin.angle)) * pin.length),
-                                        pin_pos[1] + (np.sin(math.radians(pin.angle)) * pin.length))))
-        number_pos = transform(symbol,
-                               (pin_pos[0] + (np.cos(math.radians(pin.angle)) * pin.length / 3),
-                                pin_pos[1] + (np.sin(math.radians(pin.angle)) * pin.length / 3)))
+        cached = pin_lines.get(pin.number[0]) if pin_lines else None
+        if (cached and cached[0].pos == pin.pos and cached[0].angle == pin.angle and
+                cached[0].length == pin.length):
+            pin_line = cached[1:]
+        else:
+            pin_line = transform(symbol,
+                                 (pin_pos, (pin_pos[0] + (np.cos(math.radians(pin.angle)) * pin.length),
+                                            pin_pos[1] + (np.sin(math.radians(pin.angle)) * pin.length))))
+        if pts is not None:
+            number_pos, name_pos = pts
+        else:
+            number_pos = transform(symbol,
+                                   (pin_pos[0] + (np.cos(math.radians(pin.angle)) * pin.length / 3),
+                                    pin_pos[1] + (np.sin(math.radians(pin.angle)) * pin.length / 3)))
 
-        name_pos = transform(symbol,
-                             (pin_pos[0] + (np.cos(math.radians(pin.angle)) * (pin.length + 1)),
-                              pin_pos[1] + (np.sin(math.radians(pin.angle)) * (pin.length + 1))))
+            name_pos = transform(symbol,
+                                 (pin_pos[0] + (np.cos(math.radians(pin.angle)) * (pin.length + 1)),
+                                  pin_pos[1] + (np.sin(math.radians(pin.angle)) * (pin.length + 1))))
 
         stroke = _merge_stroke(None, cast(StrokeDefinition, self.theme['pin']))
         plotter.line(SchemaPlot._pos(pin_line, self.offset, self.scale),
@@ -496,25 +546,28 @@ class SchemaPlot(AbstractParser):
         if symbol.on_schema:
             assert symbol.library_identifier in self.library_symbols, 'library symbol is not set'
             sym = self.library_symbols[symbol.library_identifier]
-            for subsym in sym.units:
-                if isUnit(subsym, symbol.unit):
-                    for draw in subsym.graphics:
-                        if isinstance(draw, Polyline):
+            pin_lines = ({x[0].number[0]: x for x in pin_positions(symbol)}
+                         if symbol.library_symbol else {})
+            units = [x for x in sym.units if isUnit(x, symbol.unit)]
+            points = SchemaPlot._unit_points(symbol, units)
+            for subsym in units:
+                for draw in subsym.graphics:
+                    if isinstance(draw, Polyline):
 #                        if len(draw.points) > 2:
 #                            self.geometry.append(shapely.geometry.Polygon(transform(symbol, draw.points)))
 #                        else:
-                            self._drawPolyline(plotter, symbol, draw)
-                        elif isinstance(draw, Rectangle):
-                            self._drawRectangle(plotter, symbol, draw)
-                        elif isinstance(draw, Arc):
-                            pass  # TODO self._drawArc(symbol, draw)
-                        elif isinstance(draw, Circle):
-                            self._drawCircle(plotter, symbol, draw)
-                        else:
-                            print(f"unknown graph type: {draw}")
-
-                    for pin in subsym.pins:
-                        self._drawPin(plotter, symbol, pin)
+                        self._drawPolyline(plotter, symbol, draw, points.get(id(draw)))
+                    elif isinstance(draw, Rectangle):
+                        self._drawRectangle(plotter, symbol, draw, points.get(id(draw)))
+                    elif isinstance(draw, Arc):
+                        pass  # TODO self._drawArc(symbol, draw)
+                    elif isinstance(draw, Circle):
+                        self._drawCircle(plotter, symbol, draw)
+                    else:
+                        print(f"unknown graph type: {draw}")
+
+                for pin in subsym.pins:
+                    self._drawPin(plotter, symbol, pin, pin_lines, points.get(id(pin)))
 
             # Add the visible text properties
             for field in symbol.properties:
@@ -1,30 +1,72 @@
 from __future__ import annotations
+import re
 from abc import abstractmethod
-from typing import TypeVar, Iterator, List, Tuple
+from typing import IO, Dict, TypeVar, Iterator, List
+
+from .Typing import POS_T, PTS_T, SOURCE_T
+
+INDEX_SIZE = 8
+"""Nodes with this number of items or more index their children."""
 
-from .Typing import POS_T, PTS_T
 
 class SexpNode():
     """Sexp Node Implementation
 
     This class is used to represent a single node in an s-expressionself.
     It can be used to represent a list of nodes or a single nodeself.
+    The root and the top level nodes of a tree loaded with spans have a
+    span attribute with the parsed text and their position in it.
     """
+    __slots__ = ('sexp', '_indexed', '_index', 'span')
+
     def __init__(self):
         self.sexp: List[SexpNode|str] = []
+        self._indexed: int = -1
+        self._index: Dict[str, List[SexpNode]] = {}
+
+    def _update_index(self) -> None:
+        """
+        Index the child nodes by their first token.
+
+        The index is created on the first lookup and created again when
+        items are appended to sexp.
+        """
+        index: Dict[str, List[SexpNode]] = {}
+        for node in self.sexp:
+            if isinstance(node, SexpNode) and node.sexp:
+                key = node.sexp[0]
+                if key in index:
+                    index[key].append(node)  # type: ignore
+                else:
+                    index[key] = [node]  # type: ignore
+        self._index = index
+        self._indexed = len(self.sexp)
 
     def __contains__(self, key: str) -> bool:
-        return len(self[key]) > 0
+        if len(self.sexp) < INDEX_SIZE:
+            for node in self.sexp:
+                if isinstance(node, SexpNode) and node.sexp[0] == key:
+                    return True
+            return False
+        if self._indexed != len(self.sexp):
+            self._update_index()
+        return key in self._index
 
     def __getitem__(self, key: str|int|slice) -> List[SexpNode]:
-        res: List[SexpNode] = []
-        for node in self.sexp:
-            if isinstance(node, SexpNode) and node.sexp[0] == key:
-                res.append(node)
-        return res
+        """
+        Get the child nodes by the first token.
+
+        The returned list is shared with the index and must not be modified.
+        """
+        if len(self.sexp) < INDEX_SIZE:
+            return [node for node in self.sexp
+                    if isinstance(node, SexpNode) and node.sexp[0] == key]
+        if self._indexed != len(self.sexp):
+            self._update_index()
+        return self._index.get(key, [])  # type: ignore
 
     def __iter__(self) -> Iterator[SexpNode]:
-        return iter([x for x in self.sexp if isinstance(x, SexpNode)])
+        return iter([node for node in self.sexp if isinstance(node, SexpNode)])
 
     def __repr__(self):
         return f'({self.sexp})'
@@ -33,12 +75,8 @@ class SexpNode():
         return len(self.sexp)
 
     def values(self) -> List[str]:
-        """Return the string value of this Node"""
-        res: List[str] = []
-        for node in self.sexp:
-            if isinstance(node, str):
-                res.append(node)
-        return res
+        """Return the string values of this Node"""
+        return [x for x in self.sexp if isinstance(x, str)]
 
     def pos(self) -> POS_T:
         """Return the POS_T from this Node"""
@@ -75,58 +113,158 @@ class SexpNode():
 
         return default
 
-def load_tree(sexp: str) -> SexpNode:
+
+_TOKENS = re.compile(
+    r'\(|\)|"(?:[^"\\]|\\.)*(?:"|\\?\Z)|[^ \t\r\n()"][^ \t\r\n)]*')
+"""Tokenizer for the sexp strings.
+
+A token is either a bracket, a quoted string including the quotes or an
+atom. Escape sequences in quoted strings are kept as they are. A quoted
+string that is not terminated matches to the end of the input."""
+
+CHUNK_SIZE = 65536
+"""Default number of characters read at once by iter_nodes."""
+
+
+def load_tree(sexp: str, spans: bool = False) -> SexpNode:
     """
     Load the sexp string to List
 
+    The string is split into tokens by a regular expression and the tree
+    is built with an explicit stack, the depth of the tree is not limited
+    by the recursion limit.
+
     :param input str: Input string.
+    :param spans bool: Keep the position of the top level nodes, see
+                       SexpNode.span. The string is referenced, not copied.
     :rtype SEXP_T: The parsed result.
+    :raises ValueError: When the brackets are not balanced.
     """
-    length = len(sexp)
-
-    def traverse(index: int) -> Tuple[SexpNode, int]:
-        res = SexpNode()
-        #items = []
-        buffer: List[str] = []
-        item = sexp[index]
-
-        while item != ")":
-            if item in [' ', '\n', '\r']:
-                pass
-            elif item == '(':
-                subtree, index = traverse(index + 1)
-                res.sexp.append(subtree)
-
-            elif item == '"':
-                buffer = []
-                index += 1
-                while index < length:
-                    if sexp[index] == '"':
-                        break
-                    if sexp[index] == '\\':
-                        buffer.append(sexp[index])
-                        index += 1
-                    buffer.append(sexp[index])
-                    index += 1
-                res.sexp.append("".join(buffer))
-            else:
-                buffer = []
-                while index < length:
-                    if sexp[index] == ')':
-                        res.sexp.append("".join(buffer))
-                        index -= 1
-                        break
-                    if sexp[index] in [' ', '\n', '\r']:
-                        res.sexp.append("".join(buffer))
-                        break
-                    buffer.append(sexp[index])
-                    index += 1
+    if spans:
+        return _load_spans(sexp)
+    root = SexpNode()
+    current = root.sexp
+    stack: List[List[SexpNode|str]] = []
+    push = stack.append
+    pop = stack.pop
+    for token in _TOKENS.findall(sexp, sexp.find('(') + 1):
+        if token == '(':
+            node = SexpNode()
+            current.append(node)
+            push(current)
+            current = node.sexp
+        elif token == ')':
+            if not stack:
+                return root
+            current = pop()
+        elif token[0] == '"':
+            current.append(token[1:-1])
+        else:
+            current.append(token)
+
+    raise ValueError('unbalanced brackets in sexp string')
+
+
+def _line_start(sexp: str, pos: int) -> int:
+    """The start of the line when only whitespace is before pos."""
+    start = sexp.rfind('\n', 0, pos) + 1
+    return pos if sexp[start:pos].strip() else start
 
-            index += 1
-            item = sexp[index]
-        return res, index
 
-    return traverse(sexp.find('(')+1)[0]
+def _load_spans(sexp: str) -> SexpNode:
+    root = SexpNode()
+    root.span = (sexp, 0, len(sexp))
+    top = root
+    top_start = 0
+    current = root.sexp
+    stack: List[List[SexpNode|str]] = []
+    push = stack.append
+    pop = stack.pop
+    for match in _TOKENS.finditer(sexp, sexp.find('(') + 1):
+        token = match.group()
+        if token == '(':
+            node = SexpNode()
+            current.append(node)
+            if not stack:
+                top, top_start = node, match.start()
+            push(current)
+            current = node.sexp
+        elif token == ')':
+            if not stack:
+                return root
+            current = pop()
+            if not stack:
+                span: SOURCE_T = (sexp, _line_start(sexp, top_start), match.end())
+                top.span = span
+        elif token[0] == '"':
+            current.append(token[1:-1])
+        else:
+            current.append(token)
+
+    raise ValueError('unbalanced brackets in sexp string')
+
+
+def _read_tokens(filep: IO[str], chunk_size: int) -> Iterator[str]:
+    buffer = ''
+    while True:
+        chunk = filep.read(chunk_size)
+        if not chunk:
+            yield from _TOKENS.findall(buffer)
+            return
+        buffer += chunk
+        tokens = _TOKENS.findall(buffer)
+        # the last token may continue in the next chunk.
+        if tokens and buffer.endswith(tokens[-1]):
+            buffer = tokens.pop()
+        else:
+            buffer = ''
+        yield from tokens
+
+
+def iter_nodes(filep: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[SexpNode]:
+    """
+    Read the sexp from a file object and yield the top level nodes.
+
+    The file is read in chunks and every node below the root is yielded
+    as soon as it is complete. Only the node that is currently parsed is
+    held in memory.
+
+    :param filep IO[str]: The input file.
+    :param chunk_size int: Number of characters to read at once.
+    :rtype Iterator[SexpNode]: The top level nodes.
+    :raises ValueError: When the brackets are not balanced.
+    """
+    root = SexpNode()
+    top = root
+    current = root.sexp
+    stack: List[List[SexpNode|str]] = []
+    push = stack.append
+    pop = stack.pop
+    tokens = _read_tokens(filep, chunk_size)
+    for token in tokens:
+        if token == '(':
+            break
+    for token in tokens:
+        if token == '(':
+            node = SexpNode()
+            if stack:
+                current.append(node)
+            else:
+                top = node
+            push(current)
+            current = node.sexp
+        elif token == ')':
+            if not stack:
+                return
+            current = pop()
+            if not stack:
+                yield top
+        elif token[0] == '"':
+            current.append(token[1:-1])
+        else:
+            current.append(token)
+
+    raise ValueError('unbalanced brackets in sexp string')
 
 
 class SexpVisitor():
@@ -150,6 +288,13 @@ class SexpVisitor():
         self._visit(sexp, level, act_level)
         self.end()
 
+    def visit_stream(self, filep: IO[str], chunk_size: int = CHUNK_SIZE) -> None:
+        """Visit the top level nodes while the file is read."""
+        self.start()
+        for node in iter_nodes(filep, chunk_size):
+            self.node(str(node.sexp[0]), node)
+        self.end()
+
     def _visit(self, sexp: SexpNode, level: int = 0, act_level: int=0) -> None:
         for node in sexp.sexp:
             if isinstance(node, SexpNode):
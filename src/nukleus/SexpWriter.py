@@ -1,4 +1,5 @@
-from typing import List
+import functools
+from typing import Callable, Dict, List, TextIO, Tuple
 
 from .AbstractParser import AbstractParser
 from .ModelBase import *
@@ -17,13 +18,114 @@ def ffmt(number: float) -> int|float:
     return number
 
 
+class _Indent(Dict[int, str]):
+    """The indentation prefixes by level, created once."""
+
+    def __missing__(self, level: int) -> str:
+        prefix = '  ' * level
+        self[level] = prefix
+        return prefix
+
+
+INDENT = _Indent()
+"""Cached indentation prefixes."""
+
+
+class _NumberFormat(Dict[float, str]):
+    """
+    The formatted numbers by value.
+
+    Coordinates on a grid repeat all over a document, they are formatted
+    once and then looked up. The table stops growing at limit entries.
+    0 and -0.0 are the same key, -0.0 is written like 0.
+
+    :param function Callable[[float], str]: Formats a number.
+    :param limit int: The maximum number of entries.
+    """
+
+    def __init__(self, function: Callable[[float], str], limit: int = 1 << 16) -> None:
+        super().__init__()
+        self.function = function
+        self.limit = limit
+        self[0] = function(0)
+
+    def __missing__(self, number: float) -> str:
+        string = self.function(number)
+        if len(self) < self.limit:
+            self[number] = string
+        return string
+
+
+FFMT = _NumberFormat(lambda number: str(ffmt(number)))
+"""Numbers like f'{ffmt(number)}', without decimal places when integral."""
+
+GFMT = _NumberFormat(lambda number: format(number, 'g'))
+"""Numbers like f'{number:g}'."""
+
+
+def _pts(pts: List[Tuple[float, float]]) -> str:
+    return ''.join([f' (xy {GFMT[x]} {GFMT[y]})' for x, y in pts])
+
+
+def _passthrough(method: Callable) -> Callable:
+    """
+    Copy the parsed text of an element instead of writing it again.
+
+    Elements loaded with spans keep their source until they are replaced
+    or the source is reset. The text is written as it was read when the
+    state of the element is the same as when it was parsed.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def visit(self: 'SexpWriter', element):
+        if (element.source is None or not self.passthrough or
+                model_state(element) != element.source[3]):
+            method(self, element)
+            return
+        text, start, end, _ = element.source
+        if text[start] == '(':
+            self._line(INDENT[self.indent] + text[start:end])
+        else:
+            self._line(text[start:end])
+        getattr(AbstractParser, name)(self, element)
+    return visit
+
+
 class SexpWriter(AbstractParser):
-    """Write the schema to the output file"""
+    """
+    Write the schema to the output file.
+
+    Without a stream the lines are collected in content and returned
+    by str(). With a stream the lines are buffered and written when
+    the buffer is full and at the end, the memory does not grow with
+    the size of the document.
+
+    With passthrough the elements with a source, from a tree loaded
+    with spans, are copied from the parsed text and only the new and
+    replaced elements are written from the model. Elements changed in
+    place are found by their state, see ModelBase.model_state, and are
+    written from the model as well. Without passthrough every element
+    is written from the model.
+
+    :param child AbstractParser|None: The next parser.
+    :param out TextIO|None: The text stream to write to.
+    :param buffer_lines int: Number of lines buffered before they are written.
+    :param passthrough bool: Copy the source of the elements.
+    """
 
-    def __init__(self, child: AbstractParser|None = None):
+    def __init__(self, child: AbstractParser|None = None,
+                 out: TextIO|None = None, buffer_lines: int = 4096,
+                 passthrough: bool = False):
         super().__init__(child)
+        self.passthrough = passthrough
         self.content: List[str] = []
+        """The lines of the document, only the unwritten lines with a stream."""
         self.indent: int = 1
+        self.out = out
+        self.buffer_lines = buffer_lines
+        self._written = False
+        self._line = self.content.append if out is None else self._buffered
 
         self.version = ''
         self.identifier = ''
@@ -32,32 +134,26 @@ class SexpWriter(AbstractParser):
 
     @staticmethod
     def _stroke_definition(stroke_definition: StrokeDefinition|None, indent: int) -> str:
-        string: str = ''
-        if stroke_definition:
-            string += f'{"  " * indent}(stroke '
-            string += f'(width {stroke_definition.width:g}) '
-            string += f'(type {stroke_definition.stroke_type}) '
-            string += f'(color {ffmt(stroke_definition.color.r)} '
-            string += f'{ffmt(stroke_definition.color.g)} '
-            string += f'{ffmt(stroke_definition.color.b)} '
-            string += f'{ffmt(stroke_definition.color.a)}))'
-
-        return string
+        if not stroke_definition:
+            return ''
+        color = stroke_definition.color
+        return (f'{INDENT[indent]}(stroke (width {GFMT[stroke_definition.width]}) '
+                f'(type {stroke_definition.stroke_type}) '
+                f'(color {FFMT[color.r]} {FFMT[color.g]} {FFMT[color.b]} {FFMT[color.a]}))')
 
     @staticmethod
     def _text_effects(text_effects: TextEffects|None, indent: int) -> str:
         string: str = ''
         if text_effects:
-            string += f'{"  " * indent}(effects '
+            string += f'{INDENT[indent]}(effects '
             string += '' if text_effects.face == '' else f'(face {text_effects.face}) '
-            string += f'(font (size {text_effects.font_height:g} {text_effects.font_width:g})'
+            string += f'(font (size {GFMT[text_effects.font_height]} {GFMT[text_effects.font_width]})'
             if text_effects.font_thickness != 0:
                 string += f' (thickness {text_effects.font_thickness})'
             for style in text_effects.font_style:
                 string += f' {style}'
             string += ')'
             if len(text_effects.justify) > 0 and not Justify.CENTER in text_effects.justify:
-                print(f' (justify {Justify.string(text_effects.justify)})')
                 string += f' (justify {Justify.string(text_effects.justify)})'
             if text_effects.hidden:
                 string += ' hide'
@@ -66,314 +162,328 @@ class SexpWriter(AbstractParser):
 
     def _property(self, property: Property|None, indent: int):
         if property:
-            self.content.append(
-                f'{"  " * indent}(property "{property.key}" "{property.value}" '
-                f'(id {property.id}) (at {ffmt(property.pos[0])} '
-                f'{ffmt(property.pos[1])} {ffmt(property.angle)})'
-            )
+            head = (f'{INDENT[indent]}(property "{property.key}" "{property.value}" '
+                    f'(id {property.id}) (at {FFMT[property.pos[0]]} '
+                    f'{FFMT[property.pos[1]]} {FFMT[property.angle]})')
             if property.text_effects:
-                self.content.append(self._text_effects(
+                self._line(head)
+                self._line(self._text_effects(
                     property.text_effects, indent=indent + 1))
-                self.content.append(f'{"  " * indent})')
+                self._line(f'{INDENT[indent]})')
             else:
-                self.content[-1] += ')'
+                self._line(head + ')')
 
     def _hierarchical_sheet_pin(self, pin: HierarchicalSheetPin|None, indent: int):
         assert pin, "HierarchicalSheetPin is not set"
-        self.content.append(f'{"  " * indent}(pin "{pin.name}" '
-                       f'{pin.pin_type} (at {ffmt(pin.pos[0])} {ffmt(pin.pos[1])} {ffmt(pin.angle)})')
-        self.content.append(self._text_effects(pin.text_effects, indent=indent+1))
-        self.content.append(f'{"  " * (indent + 1)}(uuid {pin.identifier})')
-        self.content.append(f'{"  " * indent})')
+        self._line(f'{INDENT[indent]}(pin "{pin.name}" '
+                       f'{pin.pin_type} (at {FFMT[pin.pos[0]]} {FFMT[pin.pos[1]]} {FFMT[pin.angle]})')
+        self._line(self._text_effects(pin.text_effects, indent=indent+1))
+        self._line(f'{INDENT[indent + 1]}(uuid {pin.identifier})')
+        self._line(f'{INDENT[indent]})')
 
     def _pin(self, pin: Pin|None, indent: int):
         if pin:
-            string = f'{"  " * indent}(pin {pin.type} {pin.style} (at {pin.pos[0]:g} '
-            string += f'{pin.pos[1]:g} {pin.angle:g}) (length {pin.length:g})'
+            string = f'{INDENT[indent]}(pin {pin.type} {pin.style} (at {GFMT[pin.pos[0]]} '
+            string += f'{GFMT[pin.pos[1]]} {GFMT[pin.angle]}) (length {GFMT[pin.length]})'
             if pin.hidden:
                 string += ' hide'
-            self.content.append(string)
-            self.content.append(
-                f'{"  " * (indent + 1)}(name "{pin.name[0]}" '
+            self._line(string)
+            self._line(
+                f'{INDENT[indent + 1]}(name "{pin.name[0]}" '
                 f'{self._text_effects(pin.name[1], indent=0)})')
-            self.content.append(
-                f'{"  " * (indent + 1)}(number "{pin.number[0]}" '
+            self._line(
+                f'{INDENT[indent + 1]}(number "{pin.number[0]}" '
                 f'{self._text_effects(pin.number[1], indent=0)})')
-            self.content.append(f'{"  " * indent})')
+            self._line(f'{INDENT[indent]})')
 
     def _graph(self, graph: GraphicItem, indent: int):
         if isinstance(graph, Polyline):
-            self.content.append(f'{"  " * indent}(polyline')
-            self.content.append(f'{"  " * (indent + 1)}(pts')
+            self._line(f'{INDENT[indent]}(polyline')
+            self._line(f'{INDENT[indent + 1]}(pts')
             for _pts in graph.points:
-                self.content.append(f'{"  " * (indent + 2)}(xy {ffmt(_pts[0])} {ffmt(_pts[1])})')
-            self.content.append(f'{"  " * (indent + 1)})')
-            self.content.append(self._stroke_definition(graph.stroke_definition, indent=indent+1))
-            self.content.append(
-                f'{"  " * (indent + 1)}(fill (type {get_fill_str(graph.fill)}))')
-            self.content.append(f'{"  " * indent})')
+                self._line(f'{INDENT[indent + 2]}(xy {FFMT[_pts[0]]} {FFMT[_pts[1]]})')
+            self._line(f'{INDENT[indent + 1]})')
+            self._line(self._stroke_definition(graph.stroke_definition, indent=indent+1))
+            self._line(
+                f'{INDENT[indent + 1]}(fill (type {get_fill_str(graph.fill)}))')
+            self._line(f'{INDENT[indent]})')
 
         elif isinstance(graph, Rectangle):
-            self.content.append(f'{"  " * indent}(rectangle (start '
-                           f'{graph.start_x:g} {graph.start_y:g})'
-                           f' (end {graph.end_x:g} {graph.end_y:g})')
-            self.content.append(self._stroke_definition(graph.stroke_definition, indent=indent+1))
-            self.content.append(
-                f'{"  " * (indent + 1)}(fill (type {get_fill_str(graph.fill)}))')
-            self.content.append(f'{"  " * indent})')
+            self._line(f'{INDENT[indent]}(rectangle (start '
+                           f'{GFMT[graph.start_x]} {GFMT[graph.start_y]})'
+                           f' (end {GFMT[graph.end_x]} {GFMT[graph.end_y]})')
+            self._line(self._stroke_definition(graph.stroke_definition, indent=indent+1))
+            self._line(
+                f'{INDENT[indent + 1]}(fill (type {get_fill_str(graph.fill)}))')
+            self._line(f'{INDENT[indent]})')
 
         elif isinstance(graph, Circle):
-            self.content.append(f'{"  " * indent}(circle '
-                                f'(center {ffmt(graph.center[0])} {ffmt(graph.center[1])}) '
-                                f'(radius {ffmt(graph.radius)})')
-            self.content.append(self._stroke_definition(graph.stroke_definition, indent=indent+1))
-            self.content.append(
-                f'{"  " * (indent + 1)}(fill (type {get_fill_str(graph.fill)}))')
-            self.content.append(f'{"  " * indent})')
+            self._line(f'{INDENT[indent]}(circle '
+                       f'(center {FFMT[graph.center[0]]} {FFMT[graph.center[1]]}) '
+                       f'(radius {FFMT[graph.radius]})')
+            self._line(self._stroke_definition(graph.stroke_definition, indent=indent+1))
+            self._line(
+                f'{INDENT[indent + 1]}(fill (type {get_fill_str(graph.fill)}))')
+            self._line(f'{INDENT[indent]})')
 
         elif isinstance(graph, Arc):
-            self.content.append(f'{"  " * indent}(arc '
-                                f'(start {ffmt(graph.start[0])} {ffmt(graph.start[1])}) '
-                                f'(mid {ffmt(graph.mid[0])} {ffmt(graph.mid[1])}) '
-                                f'(end {ffmt(graph.end[0])} {ffmt(graph.end[1])})')
-            self.content.append(self._stroke_definition(graph.stroke_definition, indent=indent+1))
-            self.content.append(
-                f'{"  " * (indent + 1)}(fill (type {get_fill_str(graph.fill)}))')
-            self.content.append(f'{"  " * indent})')
+            self._line(f'{INDENT[indent]}(arc '
+                       f'(start {FFMT[graph.start[0]]} {FFMT[graph.start[1]]}) '
+                       f'(mid {FFMT[graph.mid[0]]} {FFMT[graph.mid[1]]}) '
+                       f'(end {FFMT[graph.end[0]]} {FFMT[graph.end[1]]})')
+            self._line(self._stroke_definition(graph.stroke_definition, indent=indent+1))
+            self._line(
+                f'{INDENT[indent + 1]}(fill (type {get_fill_str(graph.fill)}))')
+            self._line(f'{INDENT[indent]})')
 
         elif isinstance(graph, Text):
-            self.content.append(f'{"  " * indent}(text "{graph.text} '
-                                f' (at {ffmt(graph.pos[0])} {ffmt(graph.pos[1])} '
-                                f'{ffmt(graph.angle)})')
-            self.content.append(self._text_effects(graph.text_effects, indent=indent+1))
-            self.content.append(f'{"  " * indent})')
+            self._line(f'{INDENT[indent]}(text "{graph.text} '
+                       f' (at {FFMT[graph.pos[0]]} {FFMT[graph.pos[1]]} '
+                       f'{FFMT[graph.angle]})')
+            self._line(self._text_effects(graph.text_effects, indent=indent+1))
+            self._line(f'{INDENT[indent]})')
+
+    def _buffered(self, line: str):
+        self.content.append(line)
+        if len(self.content) >= self.buffer_lines:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered lines to the stream."""
+        if self.out is None or not self.content:
+            return
+        if self._written:
+            self.out.write('\n')
+        self.out.write('\n'.join(self.content))
+        self.content.clear()
+        self._written = True
 
     def __str__(self) -> str:
+        if self._written:
+            raise ValueError('the content was written to the stream')
         return '\n'.join(self.content)
 
     def end(self):
-        self.content.append(')')
+        self._line(')')
+        self.flush()
         super().end()
 
     def startSheetInstances(self):
-        self.content.append(f'{"  " * self.indent}(sheet_instances')
+        self._line(f'{INDENT[self.indent]}(sheet_instances')
         self.indent += 1
         super().startSheetInstances()
 
     def endSheetInstances(self):
         self.indent -= 1
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().endSheetInstances()
 
     def startSymbolInstances(self):
-        self.content.append(f'{"  " * self.indent}(symbol_instances')
+        self._line(f'{INDENT[self.indent]}(symbol_instances')
         self.indent += 1
         super().startSymbolInstances()
 
     def endSymbolInstances(self):
         self.indent -= 1
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().endSymbolInstances()
 
     def start(self, version: str, generator: str):
-        self.content.append(
+        self._line(
             f"(kicad_sch (version {version}) (generator {generator})")
-        self.content.append('')
+        self._line('')
         self.version = version
         self.generator = generator
         super().start(version, generator)
 
     def visitIdentifier(self, identifier: str):
         """The schema identifier"""
-        self.content.append(f"  (uuid {identifier})")
-        self.content.append('')
+        self._line(f"  (uuid {identifier})")
+        self._line('')
         super().visitIdentifier(identifier)
 
     def visitPaper(self, paper: str):
         """The schema paper size."""
-        self.content.append(f"  (paper \"{paper}\")")
-        self.content.append('')
+        self._line(f"  (paper \"{paper}\")")
+        self._line('')
         super().visitPaper(paper)
 
     def visitTitleBlock(self, title_block: TitleBlock):
         """The schema title block."""
-        self.content.append("  (title_block")
-        self.content.append(f"    (title \"{title_block.title}\")")
-        self.content.append(f"    (date \"{title_block.date}\")")
-        self.content.append(f"    (rev \"{title_block.rev}\")")
+        self._line("  (title_block")
+        self._line(f"    (title \"{title_block.title}\")")
+        self._line(f"    (date \"{title_block.date}\")")
+        self._line(f"    (rev \"{title_block.rev}\")")
         if title_block.company != '':
-            self.content.append(f"    (company \"{title_block.company}\")")
+            self._line(f"    (company \"{title_block.company}\")")
         for com in sorted(title_block.comment.keys()):
-            self.content.append(f"    (comment {com} \"{title_block.comment[com]}\")")
-        self.content.append("  )")
-        self.content.append("")
+            self._line(f"    (comment {com} \"{title_block.comment[com]}\")")
+        self._line("  )")
+        self._line("")
         super().visitTitleBlock(title_block)
 
+    @_passthrough
     def visitBus(self, bus: Bus):
-        string = ''
-        string += f'{"  " * self.indent}(bus (pts'
-        for _pt in bus.pts:
-            string += f' (xy {_pt[0]:g} {_pt[1]:g})'
-        string += ')'
-        self.content.append(string)
-        self.content.append(self._stroke_definition(bus.stroke_definition, indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent+1)}(uuid {bus.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]}(bus (pts{_pts(bus.pts)})')
+        self._line(self._stroke_definition(bus.stroke_definition, indent=self.indent+1))
+        self._line(f'{INDENT[self.indent+1]}(uuid {bus.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitBus(bus)
 
+    @_passthrough
     def visitBusEntry(self, bus_entry: BusEntry):
-        self.content.append(f'{"  " * self.indent}(bus_entry (at {bus_entry.pos[0]} '
+        self._line(f'{INDENT[self.indent]}(bus_entry (at {bus_entry.pos[0]} '
                        f'{bus_entry.pos[1]}) '
                        f'(size {bus_entry.size[0]} '
                        f'{bus_entry.size[1]})')
-        self.content.append(self._stroke_definition(bus_entry.stroke_definition,
-                            indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent+1)}(uuid {bus_entry.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(self._stroke_definition(bus_entry.stroke_definition,
+                   indent=self.indent+1))
+        self._line(f'{INDENT[self.indent+1]}(uuid {bus_entry.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitBusEntry(bus_entry)
 
+    @_passthrough
     def visitWire(self, wire: Wire):
-        string = ''
-        string += f'{"  " * self.indent}(wire (pts'
-        for _pt in wire.pts:
-            string += f' (xy {_pt[0]:g} {_pt[1]:g})'
-        string += ')'
-        self.content.append(string)
-        self.content.append(self._stroke_definition(wire.stroke_definition, indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent+1)}(uuid {wire.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]}(wire (pts{_pts(wire.pts)})')
+        self._line(self._stroke_definition(wire.stroke_definition, indent=self.indent+1))
+        self._line(f'{INDENT[self.indent+1]}(uuid {wire.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitWire(wire)
 
+    @_passthrough
     def visitJunction(self, junction: Junction):
-        self.content.append(f'{"  " * self.indent}(junction (at '
-                       f'{junction.pos[0]:g} {junction.pos[1]:g}) '
-                       f'(diameter {junction.diameter:g}) '
-                       f'(color {ffmt(junction.color.r)} {ffmt(junction.color.g)} '
-                       f'{ffmt(junction.color.b)} {ffmt(junction.color.a)})')
-        self.content.append(f'{"  " * (self.indent + 1)}(uuid {junction.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]}(junction (at '
+                       f'{GFMT[junction.pos[0]]} {GFMT[junction.pos[1]]}) '
+                       f'(diameter {GFMT[junction.diameter]}) '
+                       f'(color {FFMT[junction.color.r]} {FFMT[junction.color.g]} '
+                       f'{FFMT[junction.color.b]} {FFMT[junction.color.a]})')
+        self._line(f'{INDENT[self.indent + 1]}(uuid {junction.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitJunction(junction)
 
+    @_passthrough
     def visitNoConnect(self, no_connect: NoConnect):
-        self.content.append(f'{"  " * self.indent}'
+        self._line(f'{INDENT[self.indent]}'
                f'(no_connect (at {no_connect.pos[0]} {no_connect.pos[1]}) '
                f'(uuid {no_connect.identifier}))')
         super().visitNoConnect(no_connect)
 
+    @_passthrough
     def visitLocalLabel(self, local_label: LocalLabel):
-        self.content.append(
-            f'{"  " * self.indent}(label "{local_label.text}" '
-            f'(at {local_label.pos[0]:g} {ffmt(local_label.pos[1])} {ffmt(local_label.angle)})')
-        self.content.append(self._text_effects(local_label.text_effects, indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent + 1)}(uuid {local_label.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(
+            f'{INDENT[self.indent]}(label "{local_label.text}" '
+            f'(at {GFMT[local_label.pos[0]]} {FFMT[local_label.pos[1]]} {FFMT[local_label.angle]})')
+        self._line(self._text_effects(local_label.text_effects, indent=self.indent+1))
+        self._line(f'{INDENT[self.indent + 1]}(uuid {local_label.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitLocalLabel(local_label)
 
+    @_passthrough
     def visitGlobalLabel(self, global_label: GlobalLabel):
-        self.content.append(
-            f'{"  " * self.indent}(global_label "{global_label.text}" '
+        self._line(
+            f'{INDENT[self.indent]}(global_label "{global_label.text}" '
                 f'(shape {global_label.shape}) '
-                f'(at {ffmt(global_label.pos[0])} '
-                f'{ffmt(global_label.pos[1])} '
-                f'{ffmt(global_label.angle)})'
+                f'(at {FFMT[global_label.pos[0]]} '
+                f'{FFMT[global_label.pos[1]]} '
+                f'{FFMT[global_label.angle]})'
             f'{"" if not global_label.autoplaced else " (fields_autoplaced)"}'
         )
-        self.content.append(self._text_effects(global_label.text_effects, indent=self.indent + 1))
-        self.content.append(f'{"  " * (self.indent + 1)}(uuid {global_label.identifier})')
+        self._line(self._text_effects(global_label.text_effects, indent=self.indent + 1))
+        self._line(f'{INDENT[self.indent + 1]}(uuid {global_label.identifier})')
         for prop in global_label.properties:
             self._property(prop, indent=self.indent + 1)
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitGlobalLabel(global_label)
 
+    @_passthrough
     def visitHierarchicalLabel(self, hierarchical_label: HierarchicalLabel):
-        self.content.append(
-            f'{"  " * self.indent}(hierarchical_label "{hierarchical_label.text}" '
+        self._line(
+            f'{INDENT[self.indent]}(hierarchical_label "{hierarchical_label.text}" '
             f'(shape {HierarchicalLabelShape.string(hierarchical_label.shape)}) '
-            f'(at {ffmt(hierarchical_label.pos[0])} {ffmt(hierarchical_label.pos[1])} '
-            f'{ffmt(hierarchical_label.angle)})')
-        self.content.append(self._text_effects(hierarchical_label.text_effects,
-                            indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent + 1)}(uuid {hierarchical_label.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+            f'(at {FFMT[hierarchical_label.pos[0]]} {FFMT[hierarchical_label.pos[1]]} '
+            f'{FFMT[hierarchical_label.angle]})')
+        self._line(self._text_effects(hierarchical_label.text_effects,
+                   indent=self.indent+1))
+        self._line(f'{INDENT[self.indent + 1]}(uuid {hierarchical_label.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitHierarchicalLabel(hierarchical_label)
 
+    @_passthrough
     def visitGraphicalLine(self, graphical_line: GraphicalLine):
-        string = ''
-        string += f'{"  " * self.indent}(polyline (pts'
-        for _pt in graphical_line.pts:
-            string += f' (xy {_pt[0]:g} {_pt[1]:g})'
-        string += ')'
-        self.content.append(string)
-        self.content.append(self._stroke_definition(
+        self._line(f'{INDENT[self.indent]}(polyline (pts{_pts(graphical_line.pts)})')
+        self._line(self._stroke_definition(
             graphical_line.stroke_definition, indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent+1)}(uuid {graphical_line.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent+1]}(uuid {graphical_line.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitGraphicalLine(graphical_line)
 
+    @_passthrough
     def visitGraphicalText(self, graphical_text: GraphicalText):
-        self.content.append( f'{"  " * self.indent}(text "{graphical_text.text}" '
-                             f'(at {ffmt(graphical_text.pos[0])} '
-                             f'{ffmt(graphical_text.pos[1])} {ffmt(graphical_text.angle)})')
-        self.content.append(self._text_effects(graphical_text.text_effects, indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent+1)}(uuid {graphical_text.identifier})')
-        self.content.append(f'{"  " * self.indent})')
+        self._line( f'{INDENT[self.indent]}(text "{graphical_text.text}" '
+                             f'(at {FFMT[graphical_text.pos[0]]} '
+                             f'{FFMT[graphical_text.pos[1]]} {FFMT[graphical_text.angle]})')
+        self._line(self._text_effects(graphical_text.text_effects, indent=self.indent+1))
+        self._line(f'{INDENT[self.indent+1]}(uuid {graphical_text.identifier})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitGraphicalText(graphical_text)
 
+    @_passthrough
     def visitHierarchicalSheet(self, hierarchical_sheet: HierarchicalSheet):
-        self.content.append(f'{"  " * self.indent}(sheet (at {hierarchical_sheet.pos[0]} '
+        self._line(f'{INDENT[self.indent]}(sheet (at {hierarchical_sheet.pos[0]} '
                        f'{hierarchical_sheet.pos[1]}) '
                        f'(size {hierarchical_sheet.size[0]} '
                        f'{hierarchical_sheet.size[1]})'
                        f' {"(fields_autoplaced)" if hierarchical_sheet.autoplaced else ""}')
-        self.content.append(self._stroke_definition(
+        self._line(self._stroke_definition(
             hierarchical_sheet.stroke_definition, indent=self.indent+1))
-        self.content.append(f'{"  " * (self.indent + 1)}'
-                            f'(fill (color {ffmt(hierarchical_sheet.fill.r)} '
-                            f'{ffmt(hierarchical_sheet.fill.g)} '
-                            f'{ffmt(hierarchical_sheet.fill.b)} '
-                            f'{ffmt(hierarchical_sheet.fill.a)}))')
-        self.content.append(f'{"  " * (self.indent + 1)}(uuid {hierarchical_sheet.identifier})')
+        self._line(f'{INDENT[self.indent + 1]}'
+                   f'(fill (color {FFMT[hierarchical_sheet.fill.r]} '
+                   f'{FFMT[hierarchical_sheet.fill.g]} '
+                   f'{FFMT[hierarchical_sheet.fill.b]} '
+                   f'{FFMT[hierarchical_sheet.fill.a]}))')
+        self._line(f'{INDENT[self.indent + 1]}(uuid {hierarchical_sheet.identifier})')
         for prop in hierarchical_sheet.properties:
             self._property(prop, indent=self.indent+1)
         for pin in hierarchical_sheet.pins:
             self._hierarchical_sheet_pin(pin, indent=self.indent+1)
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitHierarchicalSheet(hierarchical_sheet)
 
+    @_passthrough
     def visitSymbol(self, symbol: Symbol):
-        sexp_symbol = f'{"  " * self.indent}(symbol (lib_id "{symbol.library_identifier}")'
-        sexp_symbol += f' (at {ffmt(symbol.pos[0])} {ffmt(symbol.pos[1])} {ffmt(symbol.angle)})'
+        sexp_symbol = f'{INDENT[self.indent]}(symbol (lib_id "{symbol.library_identifier}")'
+        sexp_symbol += f' (at {FFMT[symbol.pos[0]]} {FFMT[symbol.pos[1]]} {FFMT[symbol.angle]})'
         sexp_symbol += '' if symbol.mirror == '' else f' (mirror {symbol.mirror})'
         sexp_symbol += '' if symbol.unit == 0 else f' (unit {symbol.unit})'
-        self.content.append(sexp_symbol)
-        sexp_symbol = f'{"  " * (self.indent + 1)}(in_bom {"yes" if symbol.in_bom else "no"}) '
+        self._line(sexp_symbol)
+        sexp_symbol = f'{INDENT[self.indent + 1]}(in_bom {"yes" if symbol.in_bom else "no"}) '
         sexp_symbol += f'(on_board {"yes" if symbol.on_board else "no"})'
         sexp_symbol += ' (fields_autoplaced)' if symbol.autoplaced else ''
-        self.content.append(sexp_symbol)
-        self.content.append(f'{"  " * (self.indent + 1)}(uuid {symbol.identifier})')
+        self._line(sexp_symbol)
+        self._line(f'{INDENT[self.indent + 1]}(uuid {symbol.identifier})')
         for prop in symbol.properties:
             self._property(prop, indent=self.indent+1)
 
         for pin in symbol.pins:
-            self.content.append(f'{"  " * (self.indent + 1)}'
+            self._line(f'{INDENT[self.indent + 1]}'
                 f'(pin "{pin.number}" (uuid {pin.identifier}))')
 
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitSymbol(symbol)
 
     def startLibrarySymbols(self):
-        self.content.append("  (lib_symbols")
+        self._line("  (lib_symbols")
         self.indent += 1
         super().startLibrarySymbols()
 
     def endLibrarySymbols(self):
         self.indent -= 1
-        self.content.append('  )')
+        self._line('  )')
         super().endLibrarySymbols()
 
     def _subsymbol(self, symbol: LibrarySymbol, indent: int):
-        sexp_symbol = f'{"  " * indent}(symbol "{symbol.identifier}"'
-        self.content.append(sexp_symbol)
+        sexp_symbol = f'{INDENT[indent]}(symbol "{symbol.identifier}"'
+        self._line(sexp_symbol)
         for prop in symbol.properties:
             self._property(prop, indent=indent+1)
 
@@ -383,22 +493,22 @@ class SexpWriter(AbstractParser):
         for pin in symbol.pins:
             self._pin(pin, indent=indent+1)
 
-        self.content.append(f'{"  " * indent})')
+        self._line(f'{INDENT[indent]})')
 
     def visitLibrarySymbol(self, symbol: LibrarySymbol):
-        sexp_symbol = f'{"  " * self.indent}(symbol "{symbol.identifier}"'
+        sexp_symbol = f'{INDENT[self.indent]}(symbol "{symbol.identifier}"'
         if symbol.extends != '':
             sexp_symbol += f' ({symbol.extends})'
         if symbol.pin_numbers_hide:
             sexp_symbol += ' (pin_numbers hide)'
         if symbol.pin_names_offset != -1:
-            sexp_symbol += f' (pin_names (offset {symbol.pin_names_offset:g})'
+            sexp_symbol += f' (pin_names (offset {GFMT[symbol.pin_names_offset]})'
             if symbol.pin_names_hide:
                 sexp_symbol += ' hide'
             sexp_symbol += ')'
         sexp_symbol += f' (in_bom {"yes" if symbol.in_bom else "no"}) '
         sexp_symbol += f'(on_board {"yes" if symbol.on_board else "no"})'
-        self.content.append(sexp_symbol)
+        self._line(sexp_symbol)
         for prop in symbol.properties:
             self._property(prop, indent=self.indent+1)
 
@@ -411,166 +521,169 @@ class SexpWriter(AbstractParser):
         for uit in symbol.units:
             self._subsymbol(uit, indent=self.indent+1)
 
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitLibrarySymbol(symbol)
 
     def visitSheetInstance(self, sheet: HierarchicalSheetInstance):
-        self.content.append(f'{"  " * self.indent}(path "{sheet.path}" '
+        self._line(f'{INDENT[self.indent]}(path "{sheet.path}" '
             f'(page "{sheet.page}"))')
         super().visitSheetInstance(sheet)
 
     def visitSymbolInstance(self, symbol: SymbolInstance):
-        self.content.append(f'{"  " * self.indent}(path "{symbol.path}"')
-        self.content.append(f'{"  " * (self.indent + 1)}'
-                            f'(reference "{symbol.reference}") (unit {symbol.unit}) '
+        self._line(f'{INDENT[self.indent]}(path "{symbol.path}"')
+        self._line(f'{INDENT[self.indent + 1]}'
+                   f'(reference "{symbol.reference}") (unit {symbol.unit}) '
                        f'(value "{symbol.value}") (footprint "{symbol.footprint}")')
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitSymbolInstance(symbol)
 
 
 
     def visitPcbGeneral(self, general: PcbGeneral):
         """General Instance"""
-        self.content.append(f'{"  " * self.indent}(general ')
+        self._line(f'{INDENT[self.indent]}(general ')
         for key, value in general.values.items():
-            self.content.append(f'{"  " * (self.indent+1)}({key} {value})')
-        self.content.append(f'{"  " * self.indent})')
+            self._line(f'{INDENT[self.indent+1]}({key} {value})')
+        self._line(f'{INDENT[self.indent]})')
         super().visitPcbGeneral(general)
 
     def _stackup_layer_settings(self, stackup_layer_settings: StackUpLayerSettings):
         pass # TODO
 
     def visitPcbSetup(self, setup: PcbSetup):
-        self.content.append(f'{"  " * (self.indent)}(setup ')
+        self._line(f'{INDENT[self.indent]}(setup ')
         if setup.stackup_settings:
             pass #TODO StackupSettings|None = None
-        self.content.append(f'{"  " * (self.indent+1)}'
-                            f'(pad_to_mask_clearance {setup.pad_to_mask_clearance})')
+        self._line(f'{INDENT[self.indent+1]}'
+                   f'(pad_to_mask_clearance {setup.pad_to_mask_clearance})')
         if setup.solder_mask_min_width != '':
-            self.content.append(f'{"  " * (self.indent+1)}'
+            self._line(f'{INDENT[self.indent+1]}'
                                 f'(solder_mask_min_width {setup.solder_mask_min_width})')
         if setup.pad_to_paste_clearance != '':
-            self.content.append(f'{"  " * (self.indent+1)}'
+            self._line(f'{INDENT[self.indent+1]}'
                                 f'(pad_to_paste_clearance {setup.pad_to_paste_clearance})')
         if setup.pad_to_paste_clearance_ratio != '':
-            self.content.append(f'{"  " * (self.indent+1)}'
+            self._line(f'{INDENT[self.indent+1]}'
                                 f'(pad_to_paste_clearance_ratio {setup.pad_to_paste_clearance_ratio})')
         if len(setup.aux_axis_origin) > 0:
-            self.content.append(f'{"  " * (self.indent+1)}'
+            self._line(f'{INDENT[self.indent+1]}'
                                 f'(aux_axis_origin {setup.aux_axis_origin[0]} {setup.aux_axis_origin[1]})')
         if len(setup.grid_origin) > 0:
-            self.content.append(f'{"  " * (self.indent+1)}'
+            self._line(f'{INDENT[self.indent+1]}'
                                 f'(grid_origin {setup.grid_origin[0]} {setup.grid_origin[1]})')
 
         if setup.plot_settings:
-            self.content.append(f'{"  " * (self.indent+1)}(pcbplotparams')
+            self._line(f'{INDENT[self.indent+1]}(pcbplotparams')
             if setup.plot_settings.layerselection != '':
-                self.content.append(f'{"  " * (self.indent+2)}'
+                self._line(f'{INDENT[self.indent+2]}'
                                     f'(layerselection {setup.plot_settings.layerselection})')
             if setup.plot_settings.disableapertmacros != '':
-                self.content.append(f'{"  " * (self.indent+2)}'
+                self._line(f'{INDENT[self.indent+2]}'
                                     f'(disableapertmacros {setup.plot_settings.disableapertmacros})')
             if setup.plot_settings.usegerberextensions != '':
-                self.content.append(f'{"  " * (self.indent+2)}(usegerberextensions {setup.plot_settings.usegerberextensions})')
+                self._line(f'{INDENT[self.indent+2]}(usegerberextensions {setup.plot_settings.usegerberextensions})')
             if setup.plot_settings.usegerberattributes != '':
-                self.content.append(f'{"  " * (self.indent+2)}(usegerberattributes {setup.plot_settings.usegerberattributes})')
+                self._line(f'{INDENT[self.indent+2]}(usegerberattributes {setup.plot_settings.usegerberattributes})')
             if setup.plot_settings.usegerberadvancedattributes != '':
-                self.content.append(f'{"  " * (self.indent+2)}(usegerberadvancedattributes {setup.plot_settings.usegerberadvancedattributes})')
+                self._line(f'{INDENT[self.indent+2]}(usegerberadvancedattributes {setup.plot_settings.usegerberadvancedattributes})')
             if setup.plot_settings.creategerberjobfile != '':
-                self.content.append(f'{"  " * (self.indent+2)}(creategerberjobfile {setup.plot_settings.creategerberjobfile})')
+                self._line(f'{INDENT[self.indent+2]}(creategerberjobfile {setup.plot_settings.creategerberjobfile})')
             if setup.plot_settings.svguseinch != '':
-                self.content.append(f'{"  " * (self.indent+2)}(svguseinch {setup.plot_settings.svguseinch})')
+                self._line(f'{INDENT[self.indent+2]}(svguseinch {setup.plot_settings.svguseinch})')
             if setup.plot_settings.svgprecision != '':
-                self.content.append(f'{"  " * (self.indent+2)}(svgprecision {setup.plot_settings.svgprecision})')
+                self._line(f'{INDENT[self.indent+2]}(svgprecision {setup.plot_settings.svgprecision})')
             if setup.plot_settings.excludeedgelayer != '':
-                self.content.append(f'{"  " * (self.indent+2)}(excludeedgelayer {setup.plot_settings.excludeedgelayer})')
+                self._line(f'{INDENT[self.indent+2]}(excludeedgelayer {setup.plot_settings.excludeedgelayer})')
             if setup.plot_settings.plotframeref != '':
-                self.content.append(f'{"  " * (self.indent+2)}(plotframeref {setup.plot_settings.plotframeref})')
+                self._line(f'{INDENT[self.indent+2]}(plotframeref {setup.plot_settings.plotframeref})')
             if setup.plot_settings.viasonmask != '':
-                self.content.append(f'{"  " * (self.indent+2)}(viasonmask {setup.plot_settings.viasonmask})')
+                self._line(f'{INDENT[self.indent+2]}(viasonmask {setup.plot_settings.viasonmask})')
             if setup.plot_settings.mode != '':
-                self.content.append(f'{"  " * (self.indent+2)}(mode {setup.plot_settings.mode})')
+                self._line(f'{INDENT[self.indent+2]}(mode {setup.plot_settings.mode})')
             if setup.plot_settings.useauxorigin != '':
-                self.content.append(f'{"  " * (self.indent+2)}(useauxorigin {setup.plot_settings.useauxorigin})')
+                self._line(f'{INDENT[self.indent+2]}(useauxorigin {setup.plot_settings.useauxorigin})')
             if setup.plot_settings.hpglpennumber != '':
-                self.content.append(f'{"  " * (self.indent+2)}(hpglpennumber {setup.plot_settings.hpglpennumber})')
+                self._line(f'{INDENT[self.indent+2]}(hpglpennumber {setup.plot_settings.hpglpennumber})')
             if setup.plot_settings.hpglpenspeed != '':
-                self.content.append(f'{"  " * (self.indent+2)}(hpglpenspeed {setup.plot_settings.hpglpenspeed})')
+                self._line(f'{INDENT[self.indent+2]}(hpglpenspeed {setup.plot_settings.hpglpenspeed})')
             if setup.plot_settings.hpglpendiameter != '':
-                self.content.append(f'{"  " * (self.indent+2)}(hpglpendiameter {setup.plot_settings.hpglpendiameter})')
+                self._line(f'{INDENT[self.indent+2]}(hpglpendiameter {setup.plot_settings.hpglpendiameter})')
             if setup.plot_settings.dxfpolygonmode != '':
-                self.content.append(f'{"  " * (self.indent+2)}(dxfpolygonmode {setup.plot_settings.dxfpolygonmode})')
+                self._line(f'{INDENT[self.indent+2]}(dxfpolygonmode {setup.plot_settings.dxfpolygonmode})')
             if setup.plot_settings.dxfimperialunits != '':
-                self.content.append(f'{"  " * (self.indent+2)}(dxfimperialunits {setup.plot_settings.dxfimperialunits})')
+                self._line(f'{INDENT[self.indent+2]}(dxfimperialunits {setup.plot_settings.dxfimperialunits})')
             if setup.plot_settings.dxfusepcbnewfont != '':
-                self.content.append(f'{"  " * (self.indent+2)}(dxfusepcbnewfont {setup.plot_settings.dxfusepcbnewfont})')
+                self._line(f'{INDENT[self.indent+2]}(dxfusepcbnewfont {setup.plot_settings.dxfusepcbnewfont})')
             if setup.plot_settings.psnegative != '':
-                self.content.append(f'{"  " * (self.indent+2)}(psnegative {setup.plot_settings.psnegative})')
+                self._line(f'{INDENT[self.indent+2]}(psnegative {setup.plot_settings.psnegative})')
             if setup.plot_settings.psa4output != '':
-                self.content.append(f'{"  " * (self.indent+2)}(psa4output {setup.plot_settings.psa4output})')
+                self._line(f'{INDENT[self.indent+2]}(psa4output {setup.plot_settings.psa4output})')
             if setup.plot_settings.plotreference != '':
-                self.content.append(f'{"  " * (self.indent+2)}(plotreference {setup.plot_settings.plotreference})')
+                self._line(f'{INDENT[self.indent+2]}(plotreference {setup.plot_settings.plotreference})')
             if setup.plot_settings.plotvalue != '':
-                self.content.append(f'{"  " * (self.indent+2)}(plotvalue {setup.plot_settings.plotvalue})')
+                self._line(f'{INDENT[self.indent+2]}(plotvalue {setup.plot_settings.plotvalue})')
             if setup.plot_settings.plotinvisibletext != '':
-                self.content.append(f'{"  " * (self.indent+2)}(plotinvisibletext {setup.plot_settings.plotinvisibletext})')
+                self._line(f'{INDENT[self.indent+2]}(plotinvisibletext {setup.plot_settings.plotinvisibletext})')
             if setup.plot_settings.sketchpadsonfab != '':
-                self.content.append(f'{"  " * (self.indent+2)}(sketchpadsonfab {setup.plot_settings.sketchpadsonfab})')
+                self._line(f'{INDENT[self.indent+2]}(sketchpadsonfab {setup.plot_settings.sketchpadsonfab})')
             if setup.plot_settings.subtractmaskfromsilk != '':
-                self.content.append(f'{"  " * (self.indent+2)}(subtractmaskfromsilk {setup.plot_settings.subtractmaskfromsilk})')
+                self._line(f'{INDENT[self.indent+2]}(subtractmaskfromsilk {setup.plot_settings.subtractmaskfromsilk})')
             if setup.plot_settings.outputformat != '':
-                self.content.append(f'{"  " * (self.indent+2)}(outputformat {setup.plot_settings.outputformat})')
+                self._line(f'{INDENT[self.indent+2]}(outputformat {setup.plot_settings.outputformat})')
             if setup.plot_settings.mirror != '':
-                self.content.append(f'{"  " * (self.indent+2)}(mirror {setup.plot_settings.mirror})')
+                self._line(f'{INDENT[self.indent+2]}(mirror {setup.plot_settings.mirror})')
             if setup.plot_settings.drillshape != '':
-                self.content.append(f'{"  " * (self.indent+2)}(drillshape {setup.plot_settings.drillshape})')
+                self._line(f'{INDENT[self.indent+2]}(drillshape {setup.plot_settings.drillshape})')
             if setup.plot_settings.scaleselection != '':
-                self.content.append(f'{"  " * (self.indent+2)}(scaleselection {setup.plot_settings.scaleselection})')
+                self._line(f'{INDENT[self.indent+2]}(scaleselection {setup.plot_settings.scaleselection})')
             if setup.plot_settings.outputdirectory != '':
-                self.content.append(f'{"  " * (self.indent+2)}(outputdirectory {setup.plot_settings.outputdirectory})')
-            self.content.append(f'{"  " * (self.indent+1)})')
+                self._line(f'{INDENT[self.indent+2]}(outputdirectory {setup.plot_settings.outputdirectory})')
+            self._line(f'{INDENT[self.indent+1]})')
         super().visitPcbSetup(setup)
 
+    @_passthrough
     def visitFootprint(self, footprint: Footprint):
         """Footprint Instance"""
         super().visitFootprint(footprint)
 
     def startLayers(self):
-        self.content.append(f'{"  " * self.indent}(layers ')
+        self._line(f'{INDENT[self.indent]}(layers ')
         super().startLayers()
 
     def endLayers(self):
-        self.content.append(f'{"  " * self.indent})')
+        self._line(f'{INDENT[self.indent]})')
         super().endLayers()
 
     def visitLayer(self, layer: PcbLayer):
         username = ')' if layer.user_name == '' else f'"{layer.user_name})'
-        self.content.append(f'{"  " * (self.indent+1)}({layer.ordinal} '
-                            f'"{layer.canonical_name}" '
-                            f'{layer.type} {username}')
+        self._line(f'{INDENT[self.indent+1]}({layer.ordinal} '
+                   f'"{layer.canonical_name}" '
+                   f'{layer.type} {username}')
         super().visitLayer(layer)
 
+    @_passthrough
     def visitSegment(self, segment: TrackSegment):
-        self.content.append(f'{"  " * (self.indent+1)}(segment '
-                            f'(start {segment.start[0]} {segment.start[1]}) '
-                            f'(start {segment.end[0]} {segment.end[1]}) '
-                            f'(width {segment.width}) '
-                            f'(layer "{segment.layer}") '
-                            f'{"locked " if segment.locked else ""}'
-                            f'(net {segment.net}) '
-                            f'(tstamp {segment.tstamp}))')
+        self._line(f'{INDENT[self.indent+1]}(segment '
+                   f'(start {FFMT[segment.start[0]]} {FFMT[segment.start[1]]}) '
+                   f'(start {FFMT[segment.end[0]]} {FFMT[segment.end[1]]}) '
+                   f'(width {FFMT[segment.width]}) '
+                   f'(layer "{segment.layer}") '
+                   f'{"locked " if segment.locked else ""}'
+                   f'(net {segment.net}) '
+                   f'(tstamp {segment.tstamp}))')
         super().visitSegment(segment)
 
+    @_passthrough
     def visitVia(self, via: TrackVia):
         layers = ''
         for layer in via.layers:
             layers += f'" {layer}"'
-        self.content.append(f'{"  " * (self.indent+1)}(via '
-                            f'(at {via.at[0]} {via.at[1]}) '
-                            f'(size {via.size}) '
-                            f'(drill {via.drill}) '
-                            f'(net {via.net}) '
-                            f'(tstamp {via.tstamp}) ')
+        self._line(f'{INDENT[self.indent+1]}(via '
+                   f'(at {FFMT[via.at[0]]} {FFMT[via.at[1]]}) '
+                   f'(size {FFMT[via.size]}) '
+                   f'(drill {FFMT[via.drill]}) '
+                   f'(net {via.net}) '
+                   f'(tstamp {via.tstamp}) ')
         super().visitVia(via)
 
 #TODO
@@ -586,16 +699,18 @@ class SexpWriter(AbstractParser):
 #    net: int = 0
 #    tstamp: str = ''
 
+    @_passthrough
     def visitNet(self, net: Net):
-        self.content.append(f'{"  " * (self.indent+1)}(net '
-                            f'{net.ordinal} '
-                            f'"{net.netname}")')
+        self._line(f'{INDENT[self.indent+1]}(net '
+                   f'{net.ordinal} '
+                   f'"{net.netname}")')
         super().visitNet(net)
 
+    @_passthrough
     def visitPcbGraphicalLine(self, graphical_line: PcbGraphicalLine):
-        self.content.append(f'{"  " * (self.indent+1)}(gr_line '
-                            f'(start {graphical_line.start[0]} {graphical_line.start[1]}) '
-                            f'(end {graphical_line.end[0]} {graphical_line.end[1]}) '
-                            f'(layer "{graphical_line.layer}") '
-                            f'(tstamp "{graphical_line.tstamp})')
+        self._line(f'{INDENT[self.indent+1]}(gr_line '
+                   f'(start {FFMT[graphical_line.start[0]]} {FFMT[graphical_line.start[1]]}) '
+                   f'(end {FFMT[graphical_line.end[0]]} {FFMT[graphical_line.end[1]]}) '
+                   f'(layer "{graphical_line.layer}") '
+                   f'(tstamp "{graphical_line.tstamp})')
         super().visitPcbGraphicalLine(graphical_line)
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .ModelPcb import TrackSegment, TrackVia
+
+SEGMENT_DTYPE = np.dtype([
+    ('start', 'f8', (2,)),
+    ('end', 'f8', (2,)),
+    ('width', 'f8'),
+    ('layer', 'u2'),
+    ('net', 'i4'),
+    ('locked', '?'),
+])
+"""Columns of the track segments."""
+
+VIA_DTYPE = np.dtype([
+    ('at', 'f8', (2,)),
+    ('size', 'f8'),
+    ('drill', 'f8'),
+    ('layers', 'u2'),
+    ('via_type', 'u2'),
+    ('net', 'i4'),
+    ('locked', '?'),
+    ('remove_unused_layers', '?'),
+    ('keep_end_layers', '?'),
+    ('free', '?'),
+])
+"""Columns of the track vias."""
+
+_SEGMENT = 0
+_VIA = 1
+
+
+class TrackStore():
+    """
+    Columnar store for the track segments and vias of a PCB.
+
+    The segments and vias are stored in structured numpy arrays.
+    Layer names, via layer sets and via types are stored as ids
+    into lookup tables. The model objects are only created when
+    the store is iterated.
+    """
+
+    def __init__(self) -> None:
+        self.layers: List[str] = []
+        """Layer names, the segment layer column is the index in this list."""
+        self.layer_sets: List[Tuple[str, ...]] = []
+        """Via layer sets, the via layers column is the index in this list."""
+        self.via_types: List[str] = []
+        """Via types, the via_type column is the index in this list."""
+        self._layer_ids: Dict[str, int] = {}
+        self._layer_set_ids: Dict[Tuple[str, ...], int] = {}
+        self._via_type_ids: Dict[str, int] = {}
+        self._segments = np.zeros(0, dtype=SEGMENT_DTYPE)
+        self._vias = np.zeros(0, dtype=VIA_DTYPE)
+        self._segment_rows: List[Tuple] = []
+        self._via_rows: List[Tuple] = []
+        self._segment_tstamps: List[str] = []
+        self._via_tstamps: List[str] = []
+        self._order: List[int] = []
+
+    @staticmethod
+    def _id(key, ids: Dict, values: List) -> int:
+        res = ids.get(key)
+        if res is None:
+            res = len(values)
+            ids[key] = res
+            values.append(key)
+        return res
+
+    def layer_id(self, layer: str) -> int:
+        """
+        Get the id of a layer name.
+
+        :param layer str: The layer name.
+        :rtype int: The layer id or -1 if no segment is on the layer.
+        """
+        return self._layer_ids.get(layer, -1)
+
+    def append_segment(self, segment: TrackSegment) -> None:
+        """
+        Add a track segment.
+
+        :param segment TrackSegment: The track segment.
+        """
+        self._segment_rows.append((
+            segment.start, segment.end, segment.width,
+            TrackStore._id(segment.layer, self._layer_ids, self.layers),
+            segment.net, segment.locked))
+        self._segment_tstamps.append(segment.tstamp)
+        self._order.append(_SEGMENT)
+
+    def append_via(self, via: TrackVia) -> None:
+        """
+        Add a track via.
+
+        :param via TrackVia: The track via.
+        """
+        self._via_rows.append((
+            via.at, via.size, via.drill,
+            TrackStore._id(tuple(via.layers), self._layer_set_ids, self.layer_sets),
+            TrackStore._id(via.via_type, self._via_type_ids, self.via_types),
+            via.net, via.locked, via.remove_unused_layers,
+            via.keep_end_layers, via.free))
+        self._via_tstamps.append(via.tstamp)
+        self._order.append(_VIA)
+
+    @property
+    def segments(self) -> np.ndarray:
+        """The track segments as structured array with SEGMENT_DTYPE."""
+        if self._segment_rows:
+            self._segments = np.concatenate(
+                (self._segments, np.array(self._segment_rows, dtype=SEGMENT_DTYPE)))
+            self._segment_rows = []
+        return self._segments
+
+    @property
+    def vias(self) -> np.ndarray:
+        """The track vias as structured array with VIA_DTYPE."""
+        if self._via_rows:
+            self._vias = np.concatenate(
+                (self._vias, np.array(self._via_rows, dtype=VIA_DTYPE)))
+            self._via_rows = []
+        return self._vias
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def segment_mask(self, net: int|None = None, layer: str|None = None) -> np.ndarray:
+        """
+        Select the segments by net and layer.
+
+        :param net int|None: The net ordinal, all nets when None.
+        :param layer str|None: The layer name, all layers when None.
+        :rtype np.ndarray: Boolean mask for the segments array.
+        """
+        segments = self.segments
+        mask = np.ones(len(segments), dtype=bool)
+        if net is not None:
+            mask &= segments['net'] == net
+        if layer is not None:
+            mask &= segments['layer'] == self.layer_id(layer)
+        return mask
+
+    def via_mask(self, net: int|None = None, layer: str|None = None) -> np.ndarray:
+        """
+        Select the vias by net and layer.
+
+        :param net int|None: The net ordinal, all nets when None.
+        :param layer str|None: A layer the via connects, all layers when None.
+        :rtype np.ndarray: Boolean mask for the vias array.
+        """
+        vias = self.vias
+        mask = np.ones(len(vias), dtype=bool)
+        if net is not None:
+            mask &= vias['net'] == net
+        if layer is not None:
+            sets = [i for i, layers in enumerate(self.layer_sets) if layer in layers]
+            mask &= np.isin(vias['layers'], sets)
+        return mask
+
+    def track_length(self) -> Dict[int, float]:
+        """
+        Total length of the segments per net.
+
+        :rtype Dict[int, float]: Track length by net ordinal.
+        """
+        segments = self.segments
+        if len(segments) == 0:
+            return {}
+        length = np.hypot(*(segments['end'] - segments['start']).T)
+        nets, inverse = np.unique(segments['net'], return_inverse=True)
+        total = np.bincount(inverse, weights=length)
+        return dict(zip(nets.tolist(), total.tolist()))
+
+    def segment_bounds(self) -> np.ndarray:
+        """
+        Bounding boxes of the segments including the track width.
+
+        :rtype np.ndarray: Array with one (min_x, min_y, max_x, max_y) row per segment.
+        """
+        segments = self.segments
+        half = segments['width'][:, None] / 2
+        return np.hstack((np.minimum(segments['start'], segments['end']) - half,
+                          np.maximum(segments['start'], segments['end']) + half))
+
+    def via_bounds(self) -> np.ndarray:
+        """
+        Bounding boxes of the vias.
+
+        :rtype np.ndarray: Array with one (min_x, min_y, max_x, max_y) row per via.
+        """
+        vias = self.vias
+        half = vias['size'][:, None] / 2
+        return np.hstack((vias['at'] - half, vias['at'] + half))
+
+    def bounds(self, mask: np.ndarray|None = None) -> Tuple[float, float, float, float]|None:
+        """
+        Bounding box of the segments and vias.
+
+        :param mask np.ndarray|None: Segment mask to limit the segments.
+        :rtype Tuple[float, float, float, float]|None: The bounding box or None when empty.
+        """
+        boxes = self.segment_bounds()
+        if mask is not None:
+            boxes = boxes[mask]
+        else:
+            boxes = np.vstack((boxes, self.via_bounds()))
+        if len(boxes) == 0:
+            return None
+        return (float(boxes[:, 0].min()), float(boxes[:, 1].min()),
+                float(boxes[:, 2].max()), float(boxes[:, 3].max()))
+
+    def segment(self, index: int) -> TrackSegment:
+        """
+        Create the model object of a segment.
+
+        :param index int: The segment index.
+        :rtype TrackSegment: The track segment.
+        """
+        row = self.segments[index]
+        return TrackSegment(
+            start=(float(row['start'][0]), float(row['start'][1])),
+            end=(float(row['end'][0]), float(row['end'][1])),
+            width=float(row['width']),
+            layer=self.layers[row['layer']],
+            locked=bool(row['locked']),
+            net=int(row['net']),
+            tstamp=self._segment_tstamps[index])
+
+    def via(self, index: int) -> TrackVia:
+        """
+        Create the model object of a via.
+
+        :param index int: The via index.
+        :rtype TrackVia: The track via.
+        """
+        row = self.vias[index]
+        return TrackVia(
+            via_type=self.via_types[row['via_type']],
+            locked=bool(row['locked']),
+            at=(float(row['at'][0]), float(row['at'][1])),
+            size=float(row['size']),
+            drill=float(row['drill']),
+            layers=list(self.layer_sets[row['layers']]),
+            remove_unused_layers=bool(row['remove_unused_layers']),
+            keep_end_layers=bool(row['keep_end_layers']),
+            free=bool(row['free']),
+            net=int(row['net']),
+            tstamp=self._via_tstamps[index])
+
+    def __iter__(self) -> Iterator[TrackSegment|TrackVia]:
+        """Create the model objects in the order they were added."""
+        segment_index = 0
+        via_index = 0
+        for kind in self._order:
+            if kind == _SEGMENT:
+                yield self.segment(segment_index)
+                segment_index += 1
+            else:
+                yield self.via(via_index)
+                via_index += 1
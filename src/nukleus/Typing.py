@@ -1,4 +1,9 @@
-from typing import Tuple, TypeAlias, List
+from typing import Any, Tuple, TypeAlias, List
 
 POS_T: TypeAlias = Tuple[float, float]
 PTS_T: TypeAlias = List[POS_T]
+SOURCE_T: TypeAlias = Tuple[str, int, int]
+"""The parsed text with the start and end of an element in it."""
+PARSED_T: TypeAlias = Tuple[str, int, int, Any]
+"""The parsed text with the start and end of an element in it and the
+state of the element when it was parsed, see ModelBase.model_state."""
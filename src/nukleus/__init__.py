@@ -1,22 +1,25 @@
 from os import wait
-from typing import IO, List
+from typing import IO, Dict, List
 
 from nukleus.AbstractParser import AbstractParser
 from nukleus.draw.Draw import Draw
 
 from .Schema import Schema
-from .SexpParser import SexpNode, load_tree
+from .SexpParser import SexpNode
 from .SexpWriter import SexpWriter
 from .ParserVisitor import ParserVisitor
 from .SchemaPlot import SchemaPlot
 from .plot.PlotSvgWrite import PlotSvgWrite
 from .Circuit import Circuit
 from .AbstractNetlist import AbstractNetlist #TODO remove
+from .Bom import Bom
+from .Cache import cached
 from .spice import *
 from .SpiceModel import load_spice_models
 from .SchemaDraw import SchemaDraw
 from .Registry import Registry
 from .Notebook import Notebook
+from .Project import Project
 from .transform import get_pins as pins
 
 def get_spice_path():
@@ -31,19 +34,65 @@ def get_library_path():
 def set_library_path(paths: List[str]):
     Registry().library_path = paths
 
+def get_cache_path():
+    return Registry().cache_path
+
+def set_cache_path(path: str|None):
+    Registry().cache_path = path
+
+def load_schema(path: str, encoding: str='utf-8') -> Schema:
+    """
+    Load a schema, the parsed schema is cached by the file content.
+
+    :param path str: The schema file.
+    :param encoding str: The file encoding.
+    :rtype Schema: The schema, replay it with Schema.produce.
+    """
+    def build() -> Schema:
+        result = Schema()
+        with open(path, 'r', encoding=encoding) as filep:
+            ParserVisitor(result).visit_stream(filep)
+        return result
+    return cached('schema', path, build, (encoding,))
+
+def load_netlist(path: str) -> AbstractNetlist:
+    """
+    Load the netlist of a schema, cached by the file content.
+
+    :param path str: The schema file.
+    :rtype AbstractNetlist: The netlist.
+    """
+    def build() -> AbstractNetlist:
+        netlist = AbstractNetlist()
+        load_schema(path).produce(netlist)
+        return netlist
+    return cached('netlist', path, build)
+
+def load_bom(path: str, grouped: bool=True) -> Dict:
+    """
+    Load the BOM of a schema, cached by the file content.
+
+    :param path str: The schema file.
+    :param grouped bool: Group the symbols with the same value.
+    :rtype Dict: The result of Bom.bom.
+    """
+    def build() -> Dict:
+        bom = Bom(grouped)
+        load_schema(path).produce(bom)
+        return bom.bom()
+    return cached('bom', path, build, (grouped,))
+
 
 class schema():
     def __init__(self, path: str, consumer: AbstractParser, encoding: str='utf-8') -> None:
         self.path = path
         self.encoding = encoding
-        self.tree: SexpNode|None = None
         self.consumer = consumer
 
     def __enter__(self):
         with open(self.path, 'r', encoding=self.encoding) as filep:
-            self.tree = load_tree(filep.read())
             parser = ParserVisitor(self.consumer)
-            parser.visit(self.tree)
+            parser.visit_stream(filep)
             return self.consumer
 
     def __exit__(self, exc_type, exc_value, exc_tb):
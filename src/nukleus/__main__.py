@@ -2,6 +2,7 @@ import argparse
 import logging
 from os import wait
 import sys
+from typing import List
 import matplotlib.pyplot as plt
 import matplotlib
 
@@ -13,6 +14,7 @@ from rich import print, inspect
 import nukleus
 from nukleus.AbstractParser import AbstractParser
 from nukleus.Bom import Bom
+from nukleus.Dispatcher import Dispatcher
 from nukleus.SexpWriter import SexpWriter
 from .Registry import Registry
 from .plot.PlotMatplotlib import PlotMatplotlib
@@ -46,48 +48,47 @@ def main() -> int:
     args = parser.parse_args()
     inspect(args)
 
-    action: AbstractParser|None = None
+    consumers: List[AbstractParser] = []
     if 'dump' in args.action:
-        sexp = action = SexpWriter(action)
+        consumers.append(SexpWriter(out=sys.stdout))
 
     if 'bom' in args.action:
-        bom = action = Bom(True, action)
+        bom = Bom(True)
+        consumers.append(bom)
 
     if 'erc' in args.action:
-        erc = action = ERC(action)
+        erc = ERC()
+        consumers.append(erc)
 
     if 'plot' in args.action:
         if args.plotter == 'PlotSvgWrite':
             from .plot.PlotSvgWrite import PlotSvgWrite
             Registry().PLOTTER = PlotSvgWrite
-            action = SchemaPlot(args.output, 297, 210, 600, child=action)
+            consumers.append(SchemaPlot(args.output, 297, 210, 600))
 
         if args.plotter == 'PlotMatplotlib':
             from .plot.PlotMatplotlib import PlotMatplotlib
             Registry().PLOTTER = PlotMatplotlib
             schem_fig, schem_ax = plt.subplots(figsize=(8, 6))
-            action = SchemaPlot(schem_ax, 297, 210, 600, child=action)
+            consumers.append(SchemaPlot(schem_ax, 297, 210, 600))
 
         if args.plotter == 'PlotOpenCV':
             from .plot.PlotOpenCV import PlotOpenCV
             Registry().PLOTTER = PlotOpenCV
-            action = SchemaPlot(args.output, 297, 210, 600, child=action)
+            consumers.append(SchemaPlot(args.output, 297, 210, 600))
 
         if args.plotter == 'PlotCairo':
             from .plot.PlotCairo import PlotCairo
             Registry().PLOTTER = PlotCairo
-            action = SchemaPlot(args.output, 297, 210, 600, child=action)
+            consumers.append(SchemaPlot(args.output, 297, 210, 600))
 
     if args.input.endswith('.kicad_sch'):
-        assert action, "No Action Set"
-        with nukleus.schema(args.input, action) as _:
+        assert consumers, "No Action Set"
+        with nukleus.schema(args.input, Dispatcher(consumers)) as _:
             pass
     #if args.input.endswith('.kicad_pcb'):
     #    pcb = load_pcb(args.input)
 
-    if 'dump' in args.action:
-        print(str(sexp))
-
     if 'bom' in args.action:
         print(bom.bom())
 
@@ -3,6 +3,7 @@ import logging
 import os
 import shutil
 from pathlib import Path
+from typing import List
 
 import SCons.Builder
 import SCons.Tool
@@ -16,6 +17,7 @@ from ..SchemaPlot import SchemaPlot
 from ..PlotPcb import drc, pcb, pdf
 from ..Reports import combine_reports, report_parser
 from ..AbstractParser import AbstractParser
+from ..Dispatcher import Dispatcher
 
 def get_schema_name(filename):
     if not filename.endswith('.kicad_pro'):
@@ -67,16 +69,13 @@ def _board_name(name: str) -> str:
 
 
 def scons_bom(source, target, env):
-    visitor: AbstractParser|None = None
-    bom = Bom(child=visitor)
-    with nukleus.schema(source[0].abspath, bom) as _:
-        pass
+    result = nukleus.load_bom(source[0].abspath)
 
     _report = {}
     if 'project_name' in env:
-        _report = {env['project_name']: {_board_name(source[0].name): bom.bom()}}
+        _report = {env['project_name']: {_board_name(source[0].name): result}}
     else:
-        _report = {_board_name(source[0].name): bom.bom()}
+        _report = {_board_name(source[0].name): result}
 
     with open(target[0].abspath, 'w') as file:
         file.write(json.dumps(_report))
@@ -127,27 +126,26 @@ def scons_reports(target, source, env):
 
 def scons_schema(target, source, env):
     visitor = SchemaPlot(target[0].abspath, 297, 210, 600, child=None) #TODO make filename configurable
-    with nukleus.schema(source[0].abspath, visitor) as _:
-        pass
+    nukleus.load_schema(source[0].abspath).produce(visitor)
 
 def scons_nukleus(target, source, env):
     files = []
     reports = []
-    visitor: AbstractParser|None = None
+    consumers: List[AbstractParser] = []
     bom: Bom|None = None
     for build_target in env['NUKLEUS_TARGETS']:
         print(build_target)
         if build_target == 'schema':
             schema_name = f'{target[0].abspath}-schema.svg'
-            visitor = SchemaPlot(schema_name, 297, 210, 600, child=visitor) #TODO make filename configurable
+            consumers.append(SchemaPlot(schema_name, 297, 210, 600)) #TODO make filename configurable
             target.append(schema_name)
         if build_target == 'bom':
-            bom = visitor = Bom(child=visitor)
+            bom = Bom()
+            consumers.append(bom)
 
-    if not visitor:
+    if not consumers:
         raise ValueError('no target set')
-    with nukleus.schema(get_schema_name(source[0].abspath), visitor) as _:
-        pass
+    nukleus.load_schema(get_schema_name(source[0].abspath)).produce(Dispatcher(consumers))
 
     if bom:
         bom_file = parse_bom(source, target, env, bom.bom())
@@ -1,15 +1,15 @@
 import math
 import re
 from collections import deque
-from typing import Dict, List, cast
+from typing import Dict, List, Sequence, Tuple, cast
 import glob
 
 import numpy as np
 from nptyping import Float, NDArray, Shape  # type: ignore
 
 from .ModelBase import Justify, TextEffects
-from .ModelSchema import (Arc, Circle, GlobalLabel, Pin, PinList, Polyline,
-                          Rectangle, Symbol, isUnit)
+from .ModelSchema import (Arc, Circle, GlobalLabel, Pin, PinImpl, PinList,
+                          Polyline, Rectangle, Symbol, isUnit)
 from .Typing import POS_T, PTS_T
 
 
@@ -33,6 +33,66 @@ MIRROR = {
 }
 
 
+def _rotation(angle: float) -> np.ndarray:
+    theta = np.deg2rad(-angle)
+    return np.array([[math.cos(theta), -math.sin(theta)],
+                     [math.sin(theta), math.cos(theta)]])
+
+
+ROTATION = {angle: _rotation(angle) for angle in (0, 90, 180, 270)}
+"""Rotation matrices of the symbol angles used by KiCad."""
+
+MATRIX: Dict[Tuple[float, str], Tuple[int, int, int, int]] = {
+    (angle, mirror): cast(Tuple[int, int, int, int], tuple(
+        int(x) for x in np.rint(rot * MIRROR[mirror][[0, 3]]).flatten()))
+    for angle, rot in ROTATION.items() for mirror in MIRROR}
+"""
+Combined rotation and mirror matrices of the KiCad angles and mirrors.
+
+A point (x, y) is transformed to (x * m[0] + y * m[2], x * m[1] + y * m[3]).
+"""
+
+NM = 1000000
+"""Nanometers per millimeter."""
+
+
+def _matrix(angle: float, mirror: str) -> Tuple[float, float, float, float]:
+    matrix = MATRIX.get((angle, mirror))
+    if matrix is None:
+        return cast(Tuple[float, float, float, float],
+                    tuple((_rotation(angle) * MIRROR[mirror][[0, 3]]).flatten()))
+    return matrix
+
+
+def to_nm(pos: POS_T) -> Tuple[int, int]:
+    """
+    Convert a position to integer nanometers.
+
+    :param pos POS_T: Position in millimeters.
+    :rtype Tuple[int, int]: Position in nanometers.
+    """
+    return (round(pos[0] * NM), round(pos[1] * NM))
+
+
+def transform_nm(pos: Tuple[int, int], angle: float, mirror: str,
+                 points: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Transform points in integer nanometers.
+
+    The transformation is exact for the KiCad angles. Other angles
+    are rounded to the nanometer.
+
+    :param pos Tuple[int, int]: Position of the symbol in nanometers.
+    :param angle float: Angle of the symbol in degrees.
+    :param mirror str: Mirror of the symbol.
+    :param points Sequence[Tuple[int, int]]: Points relative to the symbol in nanometers.
+    :rtype List[Tuple[int, int]]: The transformed points in nanometers.
+    """
+    m = _matrix(angle, mirror)
+    return [(pos[0] + round(x * m[0] + y * m[2]), pos[1] + round(x * m[1] + y * m[3]))
+            for x, y in points]
+
+
 def totuple(a: NDArray[Shape["2, 2"], Float]):  # type: ignore
     if len(a) == 0:
         return a
@@ -84,23 +144,19 @@ def transform(symbol: Symbol | Pin | GlobalLabel, path=(0, 0)) -> PTS_T:
     :raises TypeError: When the element is not a Symbol or Pin.
     """
     if isinstance(symbol, Symbol):
-        theta = np.deg2rad(-symbol.angle)
-        trans = np.reshape(MIRROR[symbol.mirror], (2, 2)).T
-        rot = np.array([[math.cos(theta), -math.sin(theta)],
-                        [math.sin(theta), math.cos(theta)]])
-
-        verts = np.matmul(path, rot)
-        verts = np.matmul(verts, trans)
-        verts = (symbol.pos + verts)
-        verts = np.round(verts, 3)
-        return cast(PTS_T, totuple(verts))
+        if isinstance(path, np.ndarray):
+            path = path.tolist()
+        single = len(path) == 2 and not hasattr(path[0], '__len__')
+        verts = transform_nm(to_nm(symbol.pos), symbol.angle, symbol.mirror,
+                             [to_nm(path)] if single else [to_nm(x) for x in path])
+        if single:
+            return cast(PTS_T, (verts[0][0] / NM, verts[0][1] / NM))
+        return cast(PTS_T, tuple((x / NM, y / NM) for x, y in verts))
 
     if isinstance(symbol, Pin):
-        theta = np.deg2rad(symbol.angle)
-        rot = np.array([math.cos(theta), math.sin(theta)])
-        verts = np.array([symbol.pos, symbol.pos + rot * symbol.length])
-        verts = np.round(verts, 3)
-        return cast(PTS_T, totuple(verts))
+        start = to_nm(symbol.pos)
+        end = transform_nm(start, symbol.angle, 'x', [to_nm((symbol.length, 0))])[0]
+        return cast(PTS_T, ((start[0] / NM, start[1] / NM), (end[0] / NM, end[1] / NM)))
 
 #    if isinstance(symbol, Footprint):
 #        theta = np.deg2rad(symbol.angle)
@@ -123,6 +179,52 @@ def transform(symbol: Symbol | Pin | GlobalLabel, path=(0, 0)) -> PTS_T:
     raise TypeError(f'unknown type {type(symbol)}')
 
 
+def transform_batch(pos, angle, mirror: Sequence[str], points, index=None) -> np.ndarray:
+    """
+    Transform the points of many symbols in one pass.
+
+    The points are given relative to their symbol, like the path
+    of `transform`. The calculation is done in integer nanometers
+    and the result is equal to `transform`.
+
+    :param pos ArrayLike: Positions of the N symbols, shape (N, 2).
+    :param angle ArrayLike: Angles of the N symbols in degrees.
+    :param mirror Sequence[str]: Mirror of the N symbols.
+    :param points ArrayLike: The stacked points, shape (K, 2).
+    :param index ArrayLike|None: Symbol of every point, shape (K,).
+                                 Defaults to one point per symbol.
+    :rtype np.ndarray: The transformed points, shape (K, 2).
+    """
+    points = np.rint(np.asarray(points, dtype=float).reshape(-1, 2) * NM)
+    keys: Dict[Tuple[float, str], int] = {}
+    codes = [keys.setdefault(key, len(keys))
+             for key in zip(np.asarray(angle, dtype=float).tolist(), mirror)]
+    table = np.empty((len(keys), 2, 2))
+    for (_angle, _mirror), code in keys.items():
+        table[code] = np.reshape(_matrix(_angle, _mirror), (2, 2))
+    mats = table[codes]
+    pos = np.rint(np.asarray(pos, dtype=float).reshape(-1, 2) * NM)
+    if index is not None:
+        mats = mats[index]
+        pos = pos[index]
+    return (pos + np.rint(np.einsum('kj,kji->ki', points, mats))) / NM
+
+
+def pin_lines(pins: Sequence[Pin]) -> np.ndarray:
+    """
+    Get the start and end points of pins.
+
+    :param pins Sequence[Pin]: The pins.
+    :rtype np.ndarray: The pin lines, shape (N, 2, 2).
+    """
+    if not pins:
+        return np.empty((0, 2, 2))
+    starts = np.array([pin.pos for pin in pins], dtype=float)
+    ends = transform_batch(starts, [pin.angle for pin in pins], ['x'] * len(pins),
+                           [(pin.length, 0) for pin in pins])
+    return np.stack((np.rint(starts * NM) / NM, ends), axis=1)
+
+
 def symbol_size(symbol: Symbol):
     """
     Calculate the Symbol size.
@@ -147,8 +249,7 @@ def symbol_size(symbol: Symbol):
                 else:
                     #raise TypeError(f'unknown type {type(graph)}')
                     print(f"TypeError(f'unknown type {type(graph)}')")
-            for pin in unit.pins:
-                sizes.append(transform(pin))
+            sizes.extend(pin_lines(unit.pins))
 
     if len(sizes) == 0:
         return np.array([[0, 0], [0, 0]])
@@ -170,6 +271,32 @@ def get_pins(symbol: Symbol) -> PinList:
     return _pins
 
 
+def pin_positions(symbol: Symbol) -> List[Tuple[PinImpl, POS_T, POS_T]]:
+    """
+    Get the pins of a symbol with their sheet coordinates.
+
+    The connection points and the pin ends of all pins are transformed
+    in one matrix operation. The table is cached on the symbol and
+    calculated again when the symbol is moved, rotated, mirrored or
+    changes its unit or library symbol.
+
+    :param symbol Symbol: The symbol.
+    :rtype List[Tuple[PinImpl, POS_T, POS_T]]: Pin, connection point and pin end.
+    """
+    key = (id(symbol), symbol.pos, symbol.angle, symbol.mirror,
+           symbol.unit, id(symbol.library_symbol))
+    if symbol.pin_table and symbol.pin_table[0] == key:
+        return symbol.pin_table[1]
+
+    pins = list(get_pins(symbol))
+    verts = transform_batch([symbol.pos], [symbol.angle], [symbol.mirror],
+                            pin_lines(pins), np.zeros(len(pins) * 2, dtype=int))
+    table = [(pin, cast(POS_T, totuple(verts[2 * i])), cast(POS_T, totuple(verts[2 * i + 1])))
+             for i, pin in enumerate(pins)]
+    symbol.pin_table = (key, table)
+    return table
+
+
 def pinPosition(symbol) -> List[int]:
     positions = pinByPositions(symbol)
     return [len(positions['west']), len(positions['south']),
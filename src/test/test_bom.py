@@ -20,3 +20,13 @@ class TestParserPlot(unittest.TestCase):
         self.assertEqual(1, len(res))
         self.assertEqual(4, len(res['bom']))
         self.assertEqual(['C1', 'C2'], res['bom'][0]['ref'])
+
+    def test_bom_stream(self):
+        import nukleus
+        bom = Bom()
+        with nukleus.schema('samples/files/summe_v6/main.kicad_sch', bom) as _:
+            pass
+
+        res = bom.bom()
+        self.assertEqual(4, len(res['bom']))
+        self.assertEqual(['C1', 'C2'], res['bom'][0]['ref'])
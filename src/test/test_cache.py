@@ -0,0 +1,83 @@
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append('src')
+sys.path.append('../src')
+
+import nukleus
+from nukleus.Cache import file_hash, read_cache, version, write_cache
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.Registry import Registry
+
+SCHEMA = 'samples/files/summe_v6/main.kicad_sch'
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_path = Registry().cache_path
+        self.tmp = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp, 'main.kicad_sch')
+        shutil.copy(SCHEMA, self.filename)
+        Registry().cache_path = os.path.join(self.tmp, 'cache')
+
+    def tearDown(self):
+        Registry().cache_path = self.cache_path
+        shutil.rmtree(self.tmp)
+
+    def test_warm(self):
+        bom = nukleus.load_bom(self.filename)
+        netlist = nukleus.load_netlist(self.filename)
+        with patch.object(ParserVisitor, 'visit_stream', side_effect=AssertionError('parsed')):
+            self.assertEqual(bom, nukleus.load_bom(self.filename))
+            self.assertEqual(['C1', 'C2'], nukleus.load_bom(self.filename)['bom'][0]['ref'])
+            self.assertEqual(len(netlist.nets), len(nukleus.load_netlist(self.filename).nets))
+            self.assertEqual('IN_1', nukleus.load_netlist(self.filename).nets[(96.52, 45.72)].identifier)
+            self.assertEqual(len(nukleus.load_schema(self.filename).elements),
+                             len(nukleus.load_schema(SCHEMA).elements))
+            # the grouping is part of the key, the cached schema is used
+            self.assertNotEqual(bom, nukleus.load_bom(self.filename, grouped=False))
+
+    def test_content(self):
+        nukleus.load_schema(self.filename)
+        self.assertEqual(file_hash(SCHEMA), file_hash(self.filename))
+        with open(self.filename, 'a', encoding='utf-8') as file:
+            file.write('\n')
+        self.assertNotEqual(file_hash(SCHEMA), file_hash(self.filename))
+        with patch.object(ParserVisitor, 'visit_stream', side_effect=AssertionError('parsed')):
+            with self.assertRaises(AssertionError):
+                nukleus.load_schema(self.filename)
+
+    def test_disabled(self):
+        Registry().cache_path = None
+        self.assertEqual(4, len(nukleus.load_bom(self.filename)['bom']))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, 'cache')))
+
+    def test_default(self):
+        env = {k: v for k, v in os.environ.items() if k != 'NUKLEUS_CACHE'}
+        code = 'from nukleus.Registry import Registry; print(Registry().cache_path)'
+        for value, expected in ((None, 'None'), (self.tmp, self.tmp)):
+            if value:
+                env['NUKLEUS_CACHE'] = value
+            result = subprocess.run([sys.executable, '-c', code], env=env, cwd='src',
+                                    capture_output=True, text=True, check=True)
+            self.assertEqual(expected, result.stdout.strip())
+
+    def test_errors(self):
+        cache_file = os.path.join(self.tmp, 'cache', 'entry.pickle')
+        write_cache(cache_file, ('key',), lambda: None)
+        self.assertEqual([], os.listdir(os.path.join(self.tmp, 'cache')))
+        self.assertIsNone(read_cache(cache_file, ('key',)))
+        # an entry of a module that does not exist anymore
+        with open(cache_file, 'wb') as file:
+            file.write(b'(cnomodule\nKey\nt.')
+        self.assertIsNone(read_cache(cache_file, ('key',)))
+
+    def test_version(self):
+        self.assertEqual(version(), version())
+        self.assertNotEqual('unknown', version())
@@ -0,0 +1,65 @@
+import sys
+import unittest
+
+sys.path.append('src')
+sys.path.append('../src')
+
+from nukleus.AbstractNetlist import AbstractNetlist
+from nukleus.AbstractParser import AbstractParser
+from nukleus.Bom import Bom
+from nukleus.Dispatcher import Dispatcher, produce
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.Schema import Schema
+from nukleus.SexpParser import load_tree
+from nukleus.SexpWriter import SexpWriter
+
+
+def load() -> Schema:
+    schema = Schema()
+    with open('samples/files/summe_v6/main.kicad_sch') as f:
+        ParserVisitor(schema).visit(load_tree(f.read()))
+    return schema
+
+
+class _Idle(AbstractParser):
+    pass
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def test_table(self):
+        idle = _Idle(None)
+        netlist = AbstractNetlist()
+        dispatcher = Dispatcher([idle, netlist])
+        self.assertEqual([netlist.visitWire], dispatcher.table['visitWire'])
+        self.assertEqual([], dispatcher.table['visitPcbSetup'])
+        # a consumer with a child is called for every callback
+        chained = _Idle(AbstractNetlist())
+        self.assertEqual([chained.visitPcbSetup],
+                         Dispatcher([idle, chained]).table['visitPcbSetup'])
+
+    def test_dispatch(self):
+        schema = load()
+        expected_bom = Bom()
+        expected_netlist = AbstractNetlist()
+        schema.produce(expected_bom)
+        schema.produce(expected_netlist)
+        bom = Bom()
+        netlist = AbstractNetlist()
+        writer = SexpWriter()
+        schema.produce(Dispatcher([bom, netlist], child=writer))
+        self.assertEqual(expected_bom.bom(), bom.bom())
+        self.assertEqual(sorted(x.identifier for x in expected_netlist.nets.values()),
+                         sorted(x.identifier for x in netlist.nets.values()))
+        expected = SexpWriter()
+        schema.produce(expected)
+        self.assertEqual(str(expected), str(writer))
+
+    def test_threads(self):
+        schema = load()
+        boms = [Bom(), Bom()]
+        writers = [SexpWriter(), SexpWriter()]
+        produce(schema, boms + writers)
+        self.assertEqual(boms[0].bom(), boms[1].bom())
+        self.assertEqual(4, len(boms[0].bom()['bom']))
+        self.assertEqual(str(writers[0]), str(writers[1]))
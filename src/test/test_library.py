@@ -0,0 +1,206 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append('src')
+sys.path.append('../src')
+
+from nukleus.Library import Library, LibrarySymbolNotFound, save_libraries
+from nukleus.Registry import Registry
+
+
+class TestLibraryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_path = Registry().cache_path
+        self.tmp = tempfile.mkdtemp()
+        self.library = os.path.join(self.tmp, 'library')
+        os.makedirs(self.library)
+        shutil.copy('samples/files/symbols/Device.kicad_sym', self.library)
+        Registry().cache_path = os.path.join(self.tmp, 'cache')
+
+    def tearDown(self):
+        save_libraries()
+        Registry().cache_path = self.cache_path
+        shutil.rmtree(self.tmp)
+
+    def test_warm_cache(self):
+        library = Library([self.library])
+        expected = library.get('Device:R')
+        library.save()
+        self.assertEqual(1, len(os.listdir(os.path.join(self.tmp, 'cache'))))
+        with patch('nukleus.Library.load_tree', side_effect=AssertionError('parsed')):
+            self.assertEqual(expected, Library([self.library]).get('Device:R'))
+
+    def test_save_once(self):
+        library = Library([self.library])
+        with patch('nukleus.Library.write_cache') as write_cache:
+            for name in ('R', 'C', 'L', 'D'):
+                library.get(f'Device:{name}')
+            self.assertEqual(1, write_cache.call_count)  # the index
+            library.save()
+            library.save()
+            self.assertEqual(2, write_cache.call_count)
+            self.assertEqual(4, len(write_cache.call_args[0][3]))
+
+    def test_invalidate(self):
+        Library([self.library]).get('Device:R')
+        filename = os.path.join(self.library, 'Device.kicad_sym')
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        with patch('nukleus.Library.load_tree', side_effect=AssertionError('parsed')):
+            with self.assertRaises(AssertionError):
+                Library([self.library]).get('Device:R')
+
+    def test_corrupt_cache(self):
+        Library([self.library]).get('Device:R')
+        cache = os.path.join(self.tmp, 'cache')
+        for name in os.listdir(cache):
+            with open(os.path.join(cache, name), 'wb') as file:
+                file.write(b'corrupt')
+        self.assertEqual('R', Library([self.library]).get('Device:R').identifier)
+
+    def test_disabled(self):
+        Registry().cache_path = None
+        self.assertEqual('R', Library([self.library]).get('Device:R').identifier)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, 'cache')))
+
+
+class TestLibraryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_path = Registry().cache_path
+        Registry().cache_path = None
+
+    def tearDown(self):
+        Registry().cache_path = self.cache_path
+
+    def test_lazy(self):
+        lib = Library(['samples/files/symbols/'])
+        symbol = lib.get('Device:R')
+        self.assertEqual('R', symbol.identifier)
+        self.assertEqual(['R'], list(lib.libraries['Device'].symbols.keys()))
+        self.assertEqual(566, len(lib.libraries['Device'].index))
+
+    def test_extends(self):
+        lib = Library(['samples/files/symbols/'])
+        symbol = lib.get('Amplifier_Operational:TL072')
+        self.assertEqual('LM2904', symbol.extends)
+        self.assertEqual(['LM2904', 'TL072'],
+                         sorted(lib.libraries['Amplifier_Operational'].symbols.keys()))
+        self.assertEqual(3, len(symbol.units))
+
+    def test_not_found(self):
+        lib = Library(['samples/files/symbols/'])
+        with self.assertRaises(LibrarySymbolNotFound):
+            lib.get('Device:NOT_A_SYMBOL')
+        with self.assertRaises(LibrarySymbolNotFound):
+            lib.get('NOT_A_LIBRARY:R')
+
+    def test_shared(self):
+        lib = Library(['samples/files/symbols/'])
+        first = lib.get('Device:R')
+        Library.get.cache_clear()
+        second = lib.get('Device:R')
+        cached = lib.libraries['Device'].get('R')
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertIs(first.units, second.units)
+        self.assertIs(first.pins, second.pins)
+        self.assertIs(cached.units, second.units)
+        second.identifier = 'Device:R'
+        second.in_bom = not cached.in_bom
+        self.assertEqual('R', cached.identifier)
+        self.assertEqual(first.in_bom, cached.in_bom)
+        self.assertEqual('R', first.identifier)
+
+    def test_extends_shared(self):
+        lib = Library(['samples/files/symbols/'])
+        symbol = lib.get('Amplifier_Operational:TL072')
+        self.assertIs(lib.get('Amplifier_Operational:LM2904').units, symbol.units)
+        self.assertEqual([], lib.libraries['Amplifier_Operational'].get('TL072').units)
+
+
+class TestLibrarySearch(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_path = Registry().cache_path
+        self.tmp = tempfile.mkdtemp()
+        self.library = os.path.join(self.tmp, 'library')
+        os.makedirs(self.library)
+        shutil.copy('samples/files/symbols/Amplifier_Operational.kicad_sym', self.library)
+        Registry().cache_path = os.path.join(self.tmp, 'cache')
+
+    def tearDown(self):
+        Registry().cache_path = self.cache_path
+        shutil.rmtree(self.tmp)
+
+    def test_search(self):
+        lib = Library([self.library])
+        result = lib.search('lm290', 'prefix')
+        self.assertIn('Amplifier_Operational:LM2902', result)
+        self.assertIn('Amplifier_Operational:LM2904', result)
+        self.assertNotIn('Amplifier_Operational:TL072', result)
+        self.assertIn('Amplifier_Operational:TL072', lib.search('dual opamp'))
+        self.assertNotIn('Amplifier_Operational:TL071', lib.search('dual opamp'))
+        self.assertEqual(['Amplifier_Operational:TL072'], lib.search('^TL072$', 'regex')[:1])
+        self.assertEqual([], lib.search('opamp nothing'))
+        with self.assertRaises(ValueError):
+            lib.search('opamp', 'glob')
+
+    def test_persistent(self):
+        Library([self.library]).search('opamp')
+        with patch('nukleus.Library._symbol_texts', side_effect=AssertionError('parsed')):
+            self.assertIn('Amplifier_Operational:TL072', Library([self.library]).search('tl07'))
+
+    def test_update(self):
+        lib = Library([self.library])
+        self.assertEqual([], lib.search('resistor'))
+        shutil.copy('samples/files/symbols/Device.kicad_sym', self.library)
+        self.assertIn('Device:R', lib.search('resistor'))
+        os.remove(os.path.join(self.library, 'Device.kicad_sym'))
+        self.assertEqual([], lib.search('resistor'))
+
+
+class TestLibraryPreload(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_path = Registry().cache_path
+        self.tmp = tempfile.mkdtemp()
+        Registry().cache_path = self.tmp
+
+    def tearDown(self):
+        Registry().cache_path = self.cache_path
+        shutil.rmtree(self.tmp)
+
+    def test_preload(self):
+        lib = Library(['samples/files/symbols/'])
+        lib.preload(['Transistor_BJT', 'power'], max_workers=2)
+        self.assertTrue(lib.libraries['power'].complete)
+        self.assertTrue(lib.libraries['Transistor_BJT'].complete)
+        with patch('nukleus.Library.load_tree', side_effect=AssertionError('parsed')):
+            self.assertEqual('BC547', lib.get('Transistor_BJT:BC547').identifier)
+            other = Library(['samples/files/symbols/'])
+            other.preload(['power'])
+            self.assertEqual('GND', other.get('power:GND').identifier)
+
+    def test_preload_equal(self):
+        lib = Library(['samples/files/symbols/'])
+        lib.preload(['power', 'Transistor_BJT'])
+        Registry().cache_path = None
+        self.assertEqual(Library(['samples/files/symbols/']).get('power:GND'),
+                         lib.get('power:GND'))
+
+    def test_preload_all(self):
+        lib = Library(['samples/files/symbols/'])
+        lib.preload_all(max_workers=2)
+        self.assertEqual(['Amplifier_Operational', 'Amplifier_Operational_copy', 'Device',
+                          'Transistor_BJT', 'power'], sorted(lib.libraries.keys()))
+        self.assertTrue(all(x.complete for x in lib.libraries.values()))
+
+    def test_preload_not_found(self):
+        with self.assertRaises(LibrarySymbolNotFound):
+            Library(['samples/files/symbols/']).preload(['NOT_A_LIBRARY'])
@@ -273,3 +273,13 @@ dielectric_constraints='', edge_connector='', castellated_pads='', edge_plating=
         with patch.object(PCB, 'visitFootprint', return_value=None) as mock_method:
             text_effects = visitor.node('footprint', sexp_str)
             mock_method.assert_called_once_with(Footprint(tedit=123))
+
+    def test_load_pcb(self):
+        pcb = PCB()
+        with open('samples/files/produkt/main.kicad_pcb', 'r') as file:
+            ParserVisitor(pcb).visit_stream(file)
+        self.assertEqual('20211014', pcb.version)
+        self.assertEqual('pcbnew', pcb.generator)
+        segments = [x for x in pcb.elements if isinstance(x, TrackSegment)]
+        self.assertEqual(240, len(segments))
+        self.assertFalse(hasattr(segments[0], '__dict__'))
@@ -1,14 +1,18 @@
 from os import wait
 import sys
 import unittest
+from unittest.mock import patch
 import numpy as np
 from pprint import pprint
 sys.path.append("src")
 sys.path.append("../src")
 
 from nukleus.Library import Library
-from nukleus.ModelSchema import Symbol, Property, TextEffects
-from nukleus.transform import isUnit, totuple, pinPosition, pinByPositions, placeFields
+from nukleus.ModelSchema import Junction, PositionalElement, Symbol, Property, TextEffects, Wire
+from nukleus.Schema import Schema
+from nukleus.transform import (isUnit, totuple, pinPosition, pinByPositions, placeFields,
+                               get_pins, pin_positions, transform, transform_batch,
+                               transform_nm, to_nm, MATRIX)
 
 
 class TestUtilsPlaceFields(unittest.TestCase):
@@ -31,6 +35,130 @@ class TestUtilsPlaceFields(unittest.TestCase):
         self.assertFalse(isUnit(lib_sym.units[1], 1))
         self.assertFalse(isUnit(lib_sym.units[2], 1))
 
+    def test_pin_positions(self):
+        lib = Library(['samples/files/symbols/'])
+        lib_sym = lib.get('Device:R')
+        symbol = Symbol(library_identifier="Device:R", library_symbol=lib_sym,
+                        pos=(100.33, 50.8), angle=90, mirror='x', unit=1)
+        table = pin_positions(symbol)
+        self.assertIs(table, pin_positions(symbol))
+        for (pin, pos, end), expected in zip(table, get_pins(symbol)):
+            self.assertEqual(expected.number, pin.number)
+            self.assertEqual(transform(symbol, transform(expected)), (pos, end))
+        symbol.pos = (0, 0)
+        self.assertIsNot(table, pin_positions(symbol))
+        self.assertEqual(((-3.81, 0), (-2.54, 0)), pin_positions(symbol)[0][1:])
+
+    def test_property_index(self):
+        symbol = Symbol(properties=[Property(key='Reference', value='R1'),
+                                    Property(key='Value', value='1k'),
+                                    Property(key='Value', value='2k')])
+        self.assertEqual('1k', symbol.property('Value').value)
+        self.assertFalse(symbol.has_property('Footprint'))
+        symbol.properties.append(Property(key='Footprint', value='R_0603'))
+        self.assertEqual('R_0603', symbol.property('Footprint').value)
+        symbol.properties[1] = Property(key='Datasheet', value='')
+        self.assertEqual('2k', symbol.property('Value').value)
+        symbol.properties = [Property(key='Reference', value='R2')]
+        self.assertEqual('R2', symbol.property('Reference').value)
+        with self.assertRaises(LookupError):
+            symbol.property('Value')
+
+    def test_property_index_in_place(self):
+        symbol = Symbol(properties=[Property(key='Reference', value='R1'),
+                                    Property(key='Value', value='1k')])
+        self.assertFalse(symbol.has_property('Spice_Primitive'))
+        # replace an item of the list
+        symbol.properties[1] = Property(key='Spice_Primitive', value='R')
+        self.assertTrue(symbol.has_property('Spice_Primitive'))
+        self.assertEqual('R', symbol.property('Spice_Primitive').value)
+        self.assertFalse(symbol.has_property('Value'))
+        # rename a property
+        symbol.properties[1].key = 'Footprint'
+        self.assertTrue(symbol.has_property('Footprint'))
+        self.assertEqual('R', symbol.property('Footprint').value)
+        self.assertFalse(symbol.has_property('Spice_Primitive'))
+
+    def test_property_index_miss(self):
+        symbol = Symbol(properties=[Property(key='Reference', value='R1'),
+                                    Property(key='Value', value='1k')])
+        self.assertFalse(symbol.has_property('Spice_Primitive'))
+        with patch.object(Symbol, '_index_properties', side_effect=AssertionError('rebuilt')):
+            for _ in range(3):
+                self.assertFalse(symbol.has_property('Spice_Primitive'))
+                self.assertFalse(symbol.has_property('Spice_Netlist_Enabled'))
+            self.assertEqual('1k', symbol.property('Value').value)
+        # a new property key is found
+        symbol.properties[1] = Property(key='Spice_Primitive', value='R')
+        self.assertTrue(symbol.has_property('Spice_Primitive'))
+
+    def test_reference_index(self):
+        schema = Schema()
+        first = Symbol(properties=[Property(key='Reference', value='R1')])
+        second = Symbol(properties=[Property(key='Reference', value='R1')])
+        schema.visitSymbol(first)
+        schema.visitWire(Wire(pts=[(0.0, 0.0), (2.54, 0.0)]))
+        schema.visitSymbol(second)
+        self.assertIn('R1', schema)
+        self.assertNotIn('R2', schema)
+        self.assertEqual([first, second], schema.R1)
+        schema.remove(first)
+        self.assertEqual(1, len(schema.R1))
+        self.assertIs(second, schema.R1[0])
+        schema.elements.append(Symbol(properties=[Property(key='Reference', value='R2')]))
+        self.assertIn('R2', schema)
+        schema.remove(second)
+        self.assertNotIn('R1', schema)
+
+    def test_find(self):
+        schema = Schema()
+        r1 = Symbol(library_identifier='Device:R', properties=[Property(key='Reference', value='R1')])
+        c1 = Symbol(library_identifier='Device:C', properties=[Property(key='Reference', value='C1')])
+        r2 = Symbol(library_identifier='Device:R', properties=[Property(key='Reference', value='R2')])
+        wire = Wire(pts=[(0.0, 0.0), (2.54, 0.0)])
+        junction = Junction(pos=(0.0, 0.0))
+        schema.visitSymbol(r1)
+        schema.visitWire(wire)
+        schema.visitSymbol(c1)
+        schema.visitJunction(junction)
+        schema.visitSymbol(r2)
+        self.assertEqual([r1, c1, r2], schema.find(type=Symbol))
+        self.assertEqual([r1, r2], schema.find(type=Symbol, lib='Device:R'))
+        self.assertEqual([r2], schema.find(lib='Device:R', reference='R2'))
+        self.assertEqual([], schema.find(lib='Device:C', reference='R2'))
+        self.assertEqual([wire], schema.find(identifier=wire.identifier))
+        self.assertEqual([r1, c1, junction, r2], schema.find(type=PositionalElement))
+        self.assertEqual([junction], schema.find(type=PositionalElement, identifier=junction.identifier))
+        self.assertEqual(5, len(schema.find()))
+        schema.remove(r1)
+        self.assertEqual([r2], schema.find(lib='Device:R'))
+        self.assertEqual([], schema.find(identifier=r1.identifier))
+        # direct changes of the elements list rebuild the indexes
+        schema.elements = [r1, wire]
+        self.assertEqual([r1], schema.find(type=Symbol))
+        self.assertEqual([], schema.find(type=Junction))
+
+    def test_transform_batch(self):
+        symbols = [Symbol(pos=(10.16, 20.32), angle=angle, mirror=mirror)
+                   for angle in (0, 90, 180, 270, 30) for mirror in ('', 'x', 'y')]
+        points = [(1.27, 2.54), (-3.81, 0), (0.5, -0.25)]
+        result = transform_batch([x.pos for x in symbols], [x.angle for x in symbols],
+                                 [x.mirror for x in symbols], points * len(symbols),
+                                 np.repeat(np.arange(len(symbols)), len(points)))
+        for i, symbol in enumerate(symbols):
+            self.assertEqual(transform(symbol, points),
+                             totuple(result[i * len(points):(i + 1) * len(points)]))
+
+    def test_transform_exact(self):
+        self.assertEqual(12, len(MATRIX))
+        self.assertEqual((317500, -25400), to_nm((0.3175, -0.0254)))
+        self.assertEqual([(1025400, 1682500)],
+                         transform_nm((1000000, 2000000), 90, '', [(317500, -25400)]))
+        symbol = Symbol(pos=(0.1, 0.2), angle=180, mirror='y')
+        self.assertEqual((0.4175, 0.1746), transform(symbol, (0.3175, -0.0254)))
+        self.assertEqual(((0.7, 0.5), (0.1, 0.5)),
+                         transform(Symbol(pos=(0.1, 0.2), angle=270), [(0.3, 0.6), (0.3, 0)]))
+
     def test_get_pins_by_pos(self):
         lib = Library(['samples/files/symbols/'])
         lib_sym = lib.get('Device:R')
@@ -121,6 +121,109 @@ class TestNetlist(unittest.TestCase):
         #nx.draw(netlist.graph, with_labels=True, font_weight='bold')
         #plt.show()
 
+    def test_t_junction(self):
+        netlist = AbstractNetlist()
+        netlist.visitWire(Wire(pts=[(0.0, 0.0), (12.7, 0.0)]))
+        netlist.visitWire(Wire(pts=[(5.08, 0.0), (5.08, 5.08)]))
+        netlist.visitWire(Wire(pts=[(0.0, 5.08), (12.7, 5.08)]))
+        netlist.end()
+        self.assertEqual(1, len(set(netlist.nets.values())))
+
+    def test_label_on_wire(self):
+        netlist = AbstractNetlist()
+        netlist.visitLocalLabel(LocalLabel(pos=(7.62, 0.0), text='OUTPUT'))
+        netlist.visitWire(Wire(pts=[(0.0, 0.0), (25.4, 0.0)]))
+        netlist.visitWire(Wire(pts=[(0.0, 2.54), (25.4, 2.54)]))
+        netlist.end()
+        self.assertEqual('OUTPUT', netlist.nets[(0.0, 0.0)].identifier)
+        self.assertNotEqual('OUTPUT', netlist.nets[(0.0, 2.54)].identifier)
+
+    def test_label_on_wire_sheet(self):
+        with open('samples/files/pic_programmer/pic_sockets.kicad_sch') as f:
+            schema = Schema(['samples/files/symbols'])
+            ParserVisitor(schema).visit(load_tree(f.read()))
+            netlist = AbstractNetlist()
+            schema.produce(netlist)
+            self.assertEqual('CLOCK-RB6', netlist.nets[(48.26, 50.8)].identifier)
+
+    def test_pin_nets(self):
+        with open('samples/files/summe_v6/main.kicad_sch') as f:
+            schema = Schema()
+            ParserVisitor(schema).visit(load_tree(f.read()))
+            netlist = AbstractNetlist()
+            schema.produce(netlist)
+            keys = [key for key, _ in netlist.ref_pins['R5']]
+            self.assertEqual(['IN_1', 'OUTPUT'], sorted(netlist.pin_nets[x] for x in keys))
+            self.assertIsNone(netlist._graph)
+            graph = netlist.graph
+            self.assertIs(graph, netlist.graph)
+            self.assertEqual(sorted(keys), sorted(x[2] for x in graph.edges('R5', keys=True)))
+            self.assertEqual(len(netlist.pin_nets), graph.number_of_edges())
+
+    def test_incremental(self):
+        def partition(netlist):
+            nets = {id(x): x for x in netlist.nets.values()}.values()
+            return sorted((sorted(x.coords), x.identifier if not x.identifier.isdigit() else '')
+                          for x in nets)
+
+        with open('samples/files/summe_v6/main.kicad_sch') as f:
+            schema = Schema()
+            ParserVisitor(schema).visit(load_tree(f.read()))
+            netlist = AbstractNetlist()
+            schema.produce(netlist)
+            schema.netlist = netlist
+            wire = [x for x in schema.elements if isinstance(x, Wire)][0]
+            symbol = schema.R5[0]
+            numbers = {x.identifier for x in netlist.nets.values()}
+
+            schema.remove(wire)
+            schema.remove(symbol)
+            expected = AbstractNetlist()
+            schema.produce(expected)
+            self.assertEqual(partition(expected), partition(netlist))
+            self.assertNotIn('R5', netlist.ref_pins)
+            self.assertEqual(set(expected.pin_nets), set(netlist.pin_nets))
+            self.assertFalse([x for x in netlist.nodes.values()
+                              if x is wire or getattr(x, 'parent', None) is symbol])
+
+            schema.append(wire)
+            schema.append(symbol)
+            self.assertEqual(numbers, {x.identifier for x in netlist.nets.values()})
+            keys = [key for key, _ in netlist.ref_pins['R5']]
+            self.assertEqual(['IN_1', 'OUTPUT'], sorted(netlist.pin_nets[x] for x in keys))
+            with self.assertRaises(LookupError):
+                netlist.remove(Wire(pts=[(0.0, 0.0), (2.54, 0.0)]))
+
+    def test_add_points(self):
+        with open('samples/files/summe_v6/main.kicad_sch') as f:
+            schema = Schema()
+            ParserVisitor(schema).visit(load_tree(f.read()))
+            netlist = AbstractNetlist()
+            schema.produce(netlist)
+            label = HierarchicalLabel(text='A', pos=(500.0, 500.0))
+
+            netlist.add_points(label, [label.pos])
+            self.assertTrue(netlist.is_numbered(netlist.nets[label.pos]))
+            self.assertFalse(netlist.is_numbered(
+                [x for x in netlist.nets.values() if x.identifier == 'OUTPUT'][0]))
+            netlist.remove(label)
+            self.assertNotIn(label.pos, netlist.nets)
+
+    def test_incremental_spice(self):
+        with open('samples/files/summe_v6/main.kicad_sch') as f:
+            schema = Schema()
+            ParserVisitor(schema).visit(load_tree(f.read()))
+            nukleus.set_spice_path(['samples/files/spice'])
+            circuit = Circuit()
+            schema.produce(circuit)
+            schema.netlist = circuit
+            symbol = schema.R5[0]
+            schema.remove(symbol)
+            self.assertEqual(['R3 1 INPUT 100k', 'R4 IN_1 1 100k'],
+                             sorted(str(x) for x in circuit.netlist if str(x).startswith('R')))
+            schema.append(symbol)
+            self.assertIn('R5 IN_1 OUTPUT 1k', [str(x) for x in circuit.netlist])
+
     def test_no_connect(self):
         with open('samples/files/summe_v6/main.kicad_sch') as f:
             tree = load_tree(f.read())
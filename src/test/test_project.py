@@ -0,0 +1,88 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append('src')
+sys.path.append('../src')
+
+from nukleus.Project import Project, RecursiveSheet
+
+PROJECT = sys.modules['nukleus.Project']
+
+ROOT = 'samples/files/pic_programmer/pic_programmer.kicad_sch'
+SHEET_UUID = '00000000-0000-0000-0000-00004804a5e2'
+
+
+def add_sheets(filename: str, sheets):
+    """Copy the sheet of the root schema for every uuid and file in sheets."""
+    with open(filename, 'r', encoding='utf-8') as file:
+        data = file.read()
+    start = data.index('  (sheet (at')
+    end = data.index('  (sheet_instances')
+    block = data[start:end]
+    copies = [block.replace(SHEET_UUID, uuid).replace('pic_sockets.kicad_sch', name)
+              for uuid, name in sheets]
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write(data[:end] + ''.join(copies) + data[end:])
+
+
+class TestProject(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        shutil.copy(ROOT, self.tmp)
+        shutil.copy('samples/files/pic_programmer/pic_sockets.kicad_sch', self.tmp)
+        shutil.copy('samples/files/pic_programmer/pic_sockets.kicad_sch',
+                    os.path.join(self.tmp, 'pic_sockets_b.kicad_sch'))
+        self.root = os.path.join(self.tmp, 'pic_programmer.kicad_sch')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_hierarchy(self):
+        project = Project(ROOT)
+        self.assertEqual(['/', '/pic_sockets/'], [x.name for x in project.instances])
+        self.assertEqual([None, '/'], [x.parent for x in project.instances])
+        netlist = project.netlist()
+        # the hierarchical labels join the nets of the child sheet
+        self.assertEqual('DATA-RB7', netlist.pin_nets['U5:13'])
+        self.assertEqual('DATA-RB7', netlist.pin_nets['U2:12'])
+        self.assertIn('U5:13', netlist.nets['DATA-RB7'])
+        # global power symbols
+        self.assertEqual('GND', netlist.pin_nets['#PWR07:1'])
+        self.assertEqual(len(set(netlist.nets['VCC'])), len(netlist.nets['VCC']))
+        self.assertEqual(4, len(netlist.references['U2']))
+        self.assertEqual(1, len(netlist.references['U5']))
+
+    def test_shared(self):
+        add_sheets(self.root, [('00000000-0000-0000-0000-00004804a5e3', 'pic_sockets.kicad_sch'),
+                               ('00000000-0000-0000-0000-00004804a5e4', 'pic_sockets_b.kicad_sch')])
+        parsed = []
+        parse = PROJECT._parse_sheet
+        def count(filename):
+            parsed.append(filename)
+            return parse(filename)
+        with patch.object(PROJECT, '_parse_sheet', side_effect=count):
+            project = Project(self.root, max_workers=1)
+        self.assertEqual(3, len(parsed))
+        self.assertEqual(3, len(project.schemas))
+        self.assertEqual(4, len(project.instances))
+        self.assertEqual('/00000000-0000-0000-0000-00004804a5e3', project.instances[2].path)
+        self.assertIs(project.schemas[project.instances[1].filename],
+                      project.schemas[project.instances[2].filename])
+
+    def test_parallel(self):
+        add_sheets(self.root, [('00000000-0000-0000-0000-00004804a5e4', 'pic_sockets_b.kicad_sch')])
+        serial = Project(self.root, max_workers=1)
+        parallel = Project(self.root, max_workers=2)
+        self.assertEqual(sorted(serial.schemas.keys()), sorted(parallel.schemas.keys()))
+        self.assertEqual(serial.netlist().pin_nets, parallel.netlist().pin_nets)
+
+    def test_recursive(self):
+        child = os.path.join(self.tmp, 'pic_sockets.kicad_sch')
+        shutil.copy(self.root, child)
+        with self.assertRaises(RecursiveSheet):
+            Project(self.root, max_workers=1)
@@ -4,6 +4,7 @@ sys.path.append('src')
 sys.path.append('../src')
 
 import unittest
+from io import StringIO
 
 from nukleus.SexpParser import *
 
@@ -46,6 +47,66 @@ class TestSexpParser(unittest.TestCase):
             res = load_tree(file.read())
             self.assertEqual(14, len(res['wire']))
 
+    def test_get_node_index(self):
+        res = load_tree('(a ' + ' '.join(f'(b {i})' for i in range(20)) + ' (c d))')
+        self.assertEqual(20, len(res['b']))
+        self.assertEqual('19', res['b'][19].get(1, ''))
+        self.assertTrue('c' in res)
+        self.assertFalse('d' in res)
+        self.assertEqual([], res['d'])
+
+    def test_get_node_index_append(self):
+        res = load_tree('(a ' + ' '.join(f'(b {i})' for i in range(20)) + ')')
+        self.assertFalse('c' in res)
+        res.sexp.append(load_tree('(c d)'))
+        self.assertTrue('c' in res)
+        self.assertEqual('d', res['c'][0].get(1, ''))
+
+    def test_quoted_string(self):
+        res = load_tree('(property "Value" "R (1k)" (id 1)) ')
+        self.assertEqual(['property', 'Value', 'R (1k)'], res.values())
+        self.assertEqual('1', res['id'][0].get(1, ''))
+
+    def test_quoted_string_escape(self):
+        res = load_tree(r'(text "say \"hello\" \\" (at 1 2))')
+        self.assertEqual(r'say \"hello\" \\', res.get(1, ''))
+        self.assertEqual((1.0, 2.0), res['at'][0].pos())
+
+    def test_empty_string(self):
+        res = load_tree('(property "" "")')
+        self.assertEqual(['property', '', ''], res.values())
+
+    def test_deep_tree(self):
+        depth = 10000
+        res = load_tree('(a ' * depth + ')' * depth)
+        for _ in range(depth-1):
+            res = res['a'][0]
+        self.assertEqual(['a'], res.values())
+
+    def test_unbalanced(self):
+        with self.assertRaises(ValueError):
+            load_tree('(a (b c)')
+
+    def test_iter_nodes(self):
+        with open("samples/files/summe_v6/main.kicad_sch", "r") as file:
+            tree = load_tree(file.read())
+        for chunk_size in (1, 7, 4096):
+            with open("samples/files/summe_v6/main.kicad_sch", "r") as file:
+                nodes = list(iter_nodes(file, chunk_size))
+            self.assertEqual([repr(x) for x in tree], [repr(x) for x in nodes])
+
+    def test_iter_nodes_quoted_string(self):
+        text = r'(kicad_sch (a "x \"(y) z" b) (c "long quoted string") (d))'
+        nodes = list(iter_nodes(StringIO(text), 3))
+        self.assertEqual(3, len(nodes))
+        self.assertEqual(r'x \"(y) z', nodes[0].get(1, ''))
+        self.assertEqual('long quoted string', nodes[1].get(1, ''))
+        self.assertEqual(['d'], nodes[2].values())
+
+    def test_iter_nodes_unbalanced(self):
+        with self.assertRaises(ValueError):
+            list(iter_nodes(StringIO('(kicad_sch (a b)'), 4))
+
 #    def test_visit(self):
 #        with open("samples/files/main/main.kicad_sch", "r") as file:
 #            res = load_tree(file.read())
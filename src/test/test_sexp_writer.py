@@ -1,3 +1,4 @@
+import dataclasses
 from io import StringIO
 from sys import path
 from typing import ByteString
@@ -7,13 +8,14 @@ from unittest.mock import patch
 import sys
 from nukleus.PCB import PCB
 
-from nukleus.SexpWriter import SexpWriter
+from nukleus.SexpWriter import FFMT, GFMT, SexpWriter, _NumberFormat, ffmt
 sys.path.append('src')
 sys.path.append('../../src')
 
 from nukleus.Schema import Schema
 from nukleus.ModelBase import *
 from nukleus.ModelSchema import *
+from nukleus.ModelPcb import TrackSegment, TrackVia
 from nukleus.ParserVisitor import ParserVisitor
 from nukleus.SexpParser import *
 
@@ -81,8 +83,110 @@ class TestSexpWriter(unittest.TestCase):
                 self.maxDiff = None
                 self.assertEqual(text, result)
 
+    def test_stream(self):
+        with open('samples/files/all_elements/all_elements.kicad_sch', 'r') as infile:
+            schema_tree = load_tree(infile.read())
+        writer = SexpWriter()
+        ParserVisitor(writer).visit(schema_tree)
+        out = StringIO()
+        stream = SexpWriter(out=out, buffer_lines=10)
+        ParserVisitor(stream).visit(schema_tree)
+        self.assertEqual(str(writer), out.getvalue())
+        self.assertEqual([], stream.content)
+        with self.assertRaises(ValueError):
+            str(stream)
+
+    def test_number_format(self):
+        for number in (0, 0.0, 1, 1.0, -2.54, 1.27, 0.1 + 0.2, 123456789.5, 1e-5, 3):
+            self.assertEqual(f'{ffmt(number)}', FFMT[number])
+            self.assertEqual(f'{number:g}', GFMT[number])
+            # second lookup from the table
+            self.assertEqual(f'{number:g}', GFMT[number])
+        self.assertEqual('0', GFMT[-0.0])
+        table = _NumberFormat(str, limit=2)
+        self.assertEqual(['1.5', '2.5', '3.5'], [table[1.5], table[2.5], table[3.5]])
+        self.assertEqual(2, len(table))
+        writer = SexpWriter()
+        writer.visitSegment(TrackSegment(start=(150.0, 50.8), end=(0.1 + 0.2, 50.8), width=0.25))
+        writer.visitVia(TrackVia(at=(150.0, 50.8), size=0.8, drill=0.4))
+        self.assertIn('(start 150 50.8) ', writer.content[0])
+        self.assertIn(f'{ffmt(0.1 + 0.2)} 50.8) (width 0.25) ', writer.content[0])
+        self.assertIn('(at 150 50.8) (size 0.8) (drill 0.4) ', writer.content[1])
 
+    def test_passthrough(self):
+        with open('samples/files/all_elements/all_elements.kicad_sch', 'r') as file:
+            orig = file.read()
+        schema = Schema()
+        ParserVisitor(schema).visit(load_tree(orig, spans=True))
+        wire = next(x for x in schema.elements if isinstance(x, Wire))
+        text, start, end, _ = wire.source
+        self.assertIs(orig, text)
+        self.assertTrue(text[start:end].strip().startswith('(wire'))
+        self.assertTrue(text[start:end].endswith(')'))
+        # replace one wire, the other elements are copied
+        moved = dataclasses.replace(wire, pts=[(1.27, 2.54), (3.81, 2.54)])
+        self.assertIsNone(moved.source)
+        schema.elements[schema.elements.index(wire)] = moved
+        writer = SexpWriter(passthrough=True)
+        schema.produce(writer)
+        result = str(writer)
+        self.assertNotIn(text[start:end], result)
+        self.assertIn('(wire (pts (xy 1.27 2.54) (xy 3.81 2.54))', result)
+        for element in schema.elements:
+            if element is not moved:
+                source, begin, stop, _ = element.source
+                self.assertIn(source[begin:stop], result)
+        # without passthrough the model is written
+        expected = SexpWriter()
+        ParserVisitor(expected).visit(load_tree(orig))
+        writer = SexpWriter()
+        schema.elements[schema.elements.index(moved)] = wire
+        schema.produce(writer)
+        self.assertEqual(str(expected), str(writer))
+
+    def test_passthrough_in_place(self):
+        with open('samples/files/all_elements/all_elements.kicad_sch', 'r') as file:
+            schema = Schema()
+            ParserVisitor(schema).visit(load_tree(file.read(), spans=True))
+        symbol = next(x for x in schema.elements if isinstance(x, Symbol))
+        label = next(x for x in schema.elements if isinstance(x, LocalLabel))
+        wire = next(x for x in schema.elements if isinstance(x, Wire))
+        symbol.property('Value').value = 'CHANGED'
+        symbol.pos = (101.6, 50.8)
+        label.text_effects.font_height = 2.54
+        wire.pts[0] = (1.27, 2.54)
+        expected = SexpWriter()
+        schema.produce(expected)
+        writer = SexpWriter(passthrough=True)
+        schema.produce(writer)
+        self.assertEqual(str(expected), str(writer))
+        self.assertIn('(property "Value" "CHANGED"', str(writer))
+        self.assertIn('(at 101.6 50.8 ', str(writer))
+        self.assertIn('(xy 1.27 2.54)', str(writer))
+        # the unchanged elements are still copied
+        for element in schema.elements:
+            if element not in (symbol, label, wire) and element.source:
+                text, start, end, _ = element.source
+                self.assertIn(text[start:end], str(writer))
 
+    def test_passthrough_pcb(self):
+        with open('samples/files/produkt/main.kicad_pcb', 'r') as file:
+            orig = file.read()
+        pcb = PCB()
+        ParserVisitor(pcb).visit(load_tree(orig, spans=True))
+        writer = SexpWriter(passthrough=True)
+        pcb.produce(writer)
+        lines = str(writer).splitlines()
+        for token in ('  (segment ', '  (via ', '  (footprint ', '  (net '):
+            self.assertEqual([x for x in orig.splitlines() if x.startswith(token)],
+                             [x for x in lines if x.startswith(token)])
+        segment = next(x for x in pcb.elements if isinstance(x, TrackSegment))
+        segment.width = 0.5
+        writer = SexpWriter(passthrough=True)
+        pcb.produce(writer)
+        self.assertNotIn(segment.source[0][segment.source[1]:segment.source[2]].strip(),
+                         str(writer))
+        self.assertIn(f'(width 0.5) (layer "{segment.layer}")', str(writer))
 
     def test_parse_produkt_pcb(self):
         with open('samples/files/produkt/main.kicad_pcb', 'r') as infile:
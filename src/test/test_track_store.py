@@ -0,0 +1,91 @@
+import sys
+import unittest
+import math
+
+sys.path.append('src')
+sys.path.append('../src')
+
+from nukleus.AbstractParser import AbstractParser
+from nukleus.ModelPcb import TrackSegment, TrackVia
+from nukleus.ParserVisitor import ParserVisitor
+from nukleus.PCB import PCB
+
+BOARD = 'samples/files/produkt/main.kicad_pcb'
+
+
+class _Collect(AbstractParser):
+    def __init__(self):
+        super().__init__(None)
+        self.items = []
+
+    def visitSegment(self, segment: TrackSegment):
+        self.items.append(segment)
+
+    def visitVia(self, via: TrackVia):
+        self.items.append(via)
+
+
+def load(columnar: bool) -> PCB:
+    pcb = PCB(columnar=columnar)
+    with open(BOARD, 'r') as file:
+        ParserVisitor(pcb).visit_stream(file)
+    return pcb
+
+
+class TestTrackStore(unittest.TestCase):
+
+    def setUp(self):
+        self.pcb = load(False)
+        self.columnar = load(True)
+        self.segments = [x for x in self.pcb.elements if isinstance(x, TrackSegment)]
+        self.vias = [x for x in self.pcb.elements if isinstance(x, TrackVia)]
+
+    def test_elements(self):
+        tracks = self.columnar.tracks
+        assert tracks
+        self.assertEqual(len(self.segments), len(tracks.segments))
+        self.assertEqual(len(self.vias), len(tracks.vias))
+        self.assertFalse(any(isinstance(x, (TrackSegment, TrackVia))
+                             for x in self.columnar.elements))
+
+    def test_produce(self):
+        expected = _Collect()
+        self.pcb.produce(expected)
+        result = _Collect()
+        self.columnar.produce(result)
+        self.assertEqual(expected.items, result.items)
+
+    def test_filter(self):
+        tracks = self.columnar.tracks
+        assert tracks
+        mask = tracks.segment_mask(net=2, layer='B.Cu')
+        self.assertEqual(len([x for x in self.segments if x.net == 2 and x.layer == 'B.Cu']),
+                         mask.sum())
+        mask = tracks.via_mask(layer='F.Cu')
+        self.assertEqual(len([x for x in self.vias if 'F.Cu' in x.layers]), mask.sum())
+        self.assertEqual(0, tracks.segment_mask(layer='In1.Cu').sum())
+
+    def test_track_length(self):
+        tracks = self.columnar.tracks
+        assert tracks
+        expected = {}
+        for segment in self.segments:
+            expected[segment.net] = expected.get(segment.net, 0.0) + math.dist(
+                segment.start, segment.end)
+        result = tracks.track_length()
+        self.assertEqual(expected.keys(), result.keys())
+        for net, length in expected.items():
+            self.assertAlmostEqual(length, result[net])
+
+    def test_bounds(self):
+        tracks = self.columnar.tracks
+        assert tracks
+        net = [x for x in self.segments if x.net == 2]
+        min_x = min(min(x.start[0], x.end[0]) - x.width / 2 for x in net)
+        max_y = max(max(x.start[1], x.end[1]) + x.width / 2 for x in net)
+        bounds = tracks.bounds(tracks.segment_mask(net=2))
+        assert bounds
+        self.assertAlmostEqual(min_x, bounds[0])
+        self.assertAlmostEqual(max_y, bounds[3])
+        self.assertEqual(len(self.segments), len(tracks.segment_bounds()))
+        self.assertIsNone(tracks.bounds(tracks.segment_mask(net=-1)))